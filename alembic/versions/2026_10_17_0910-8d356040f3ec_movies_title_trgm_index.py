@@ -0,0 +1,49 @@
+"""
+movies title trgm index.
+
+Create a pg_trgm GIN index for substring search over movie titles.
+
+Revision ID: 8d356040f3ec
+Revises: d7e9db3afe4d
+Create Date: 2026-10-17 09:10:42.518203
+
+"""
+
+from collections.abc import (
+    Sequence,
+)
+
+from alembic import (
+    op,
+)
+
+revision: str = "8d356040f3ec"
+down_revision: str | Sequence[str] | None = "d7e9db3afe4d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            index_name="ix_movies_title_trgm",
+            table_name="movies",
+            columns=["title"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            index_name="ix_movies_title_trgm",
+            table_name="movies",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,72 @@
+"""
+movies search vector.
+
+Add a generated tsvector column over movie title and description with a GIN index.
+
+Revision ID: 4b1f6c2e9a73
+Revises: 8d356040f3ec
+Create Date: 2026-10-17 10:20:13.804512
+
+"""
+
+from collections.abc import (
+    Sequence,
+)
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import (
+    postgresql,
+)
+
+from alembic import (
+    op,
+)
+
+revision: str = "4b1f6c2e9a73"
+down_revision: str | Sequence[str] | None = "8d356040f3ec"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        table_name="movies",
+        column=sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                sqltext=(
+                    "setweight(to_tsvector('english', title), 'A') || "
+                    "setweight(to_tsvector('english', description), 'B')"
+                ),
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            index_name="ix_movies_search_vector",
+            table_name="movies",
+            columns=["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            index_name="ix_movies_search_vector",
+            table_name="movies",
+            postgresql_concurrently=True,
+        )
+
+    op.drop_column(
+        table_name="movies",
+        column_name="search_vector",
+    )
@@ -0,0 +1,71 @@
+"""
+sortable key indexes.
+
+Create composite indexes serving every sortable key of movies and users lists.
+
+Revision ID: c5a2e8d17f40
+Revises: 4b1f6c2e9a73
+Create Date: 2026-10-17 11:40:26.117093
+
+"""
+
+from collections.abc import (
+    Sequence,
+)
+
+from alembic import (
+    op,
+)
+
+revision: str = "c5a2e8d17f40"
+down_revision: str | Sequence[str] | None = "4b1f6c2e9a73"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEXES: dict[str, tuple[str, list[str]]] = {
+    "ix_movies_user_id_id": ("movies", ["user_id", "id"]),
+    "ix_movies_user_id_title": ("movies", ["user_id", "title"]),
+    "ix_movies_user_id_rate_id": ("movies", ["user_id", "rate", "id"]),
+    "ix_movies_user_id_created_at_id": ("movies", ["user_id", "created_at", "id"]),
+    "ix_movies_user_id_updated_at_id": ("movies", ["user_id", "updated_at", "id"]),
+    "ix_users_created_at_id": ("users", ["created_at", "id"]),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for index_name, (table_name, columns) in INDEXES.items():
+            op.create_index(
+                index_name=index_name,
+                table_name=table_name,
+                columns=columns,
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+        # (user_id, id) serves every lookup the single-column index did
+        op.drop_index(
+            index_name="ix_movies_user_id",
+            table_name="movies",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            index_name="ix_movies_user_id",
+            table_name="movies",
+            columns=["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+        for index_name, (table_name, _) in INDEXES.items():
+            op.drop_index(
+                index_name=index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+            )
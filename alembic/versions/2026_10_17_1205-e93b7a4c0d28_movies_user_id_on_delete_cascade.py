@@ -0,0 +1,46 @@
+"""
+movies user id on delete cascade.
+
+Delete the movies of a user in the database when the user is deleted.
+
+Revision ID: e93b7a4c0d28
+Revises: c5a2e8d17f40
+Create Date: 2026-10-17 12:05:51.402775
+
+"""
+
+from collections.abc import (
+    Sequence,
+)
+
+from alembic import (
+    op,
+)
+
+revision: str = "e93b7a4c0d28"
+down_revision: str | Sequence[str] | None = "c5a2e8d17f40"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _replace_foreign_key(on_delete: str) -> None:
+    # NOT VALID keeps the swap to a brief lock, validation only takes a SHARE UPDATE lock
+    op.execute(
+        "ALTER TABLE movies "
+        "DROP CONSTRAINT fk_movies_user_id_users, "
+        "ADD CONSTRAINT fk_movies_user_id_users FOREIGN KEY (user_id) "
+        f"REFERENCES users (id) ON DELETE {on_delete} NOT VALID"
+    )
+    # commits the swap first, so its ACCESS EXCLUSIVE lock is not held through the scan
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE movies VALIDATE CONSTRAINT fk_movies_user_id_users")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _replace_foreign_key("CASCADE")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_foreign_key("NO ACTION")
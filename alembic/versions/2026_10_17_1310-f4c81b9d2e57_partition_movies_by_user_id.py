@@ -0,0 +1,260 @@
+"""
+partition movies by user id.
+
+Move movies into a table hash-partitioned by user_id while it stays online.
+
+A partitioned table cannot have a unique index without the partition key, \
+so global title uniqueness moves to the 'movie_titles' table, claimed and \
+released by triggers on movies. Inserts skipping conflicts set \
+'movies.skip_title_conflicts' for their transaction, so the trigger skips \
+rows with a taken title instead of raising.
+
+Stages:
+    1. create the partitioned table, the title guard, and a trigger mirroring
+       writes of the old table into the new one;
+    2. backfill existing rows in batches, each batch in its own transaction,
+       locking the copied rows so concurrent updates are not lost;
+    3. swap the tables in a short transaction.
+
+Requires PostgreSQL 13+ (row triggers on partitioned tables).
+
+Revision ID: f4c81b9d2e57
+Revises: e93b7a4c0d28
+Create Date: 2026-10-17 13:10:27.845113
+
+"""
+
+from collections.abc import (
+    Sequence,
+)
+
+import sqlalchemy as sa
+
+from alembic import (
+    op,
+)
+
+revision: str = "f4c81b9d2e57"
+down_revision: str | Sequence[str] | None = "e93b7a4c0d28"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PARTITIONS = 16
+BACKFILL_BATCH_SIZE = 10_000
+
+COLUMNS = "id, title, description, rate, user_id, created_at, updated_at"
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', title), 'A') || "
+    "setweight(to_tsvector('english', description), 'B')"
+)
+INDEXES = {
+    "ix_movies_title_trgm": "USING gin (title gin_trgm_ops)",
+    "ix_movies_user_id_id": "(user_id, id)",
+    "ix_movies_user_id_title": "(user_id, title)",
+    "ix_movies_user_id_rate_id": "(user_id, rate, id)",
+    "ix_movies_user_id_created_at_id": "(user_id, created_at, id)",
+    "ix_movies_user_id_updated_at_id": "(user_id, updated_at, id)",
+    "ix_movies_search_vector": "USING gin (search_vector)",
+}
+CONSTRAINTS = (
+    "pk_movies",
+    "ck_movies_check_rate_range",
+    "fk_movies_user_id_users",
+)
+
+
+def _create_movies_table(
+    name: str,
+    primary_key: str,
+    partition_by: str = "",
+) -> None:
+    op.execute(
+        f"CREATE TABLE {name} ("
+        "id integer NOT NULL DEFAULT nextval('movies_id_seq'), "
+        "title varchar(50) NOT NULL, "
+        "description varchar(100) NOT NULL, "
+        "rate numeric(2, 1) NOT NULL, "
+        "user_id uuid NOT NULL, "
+        "created_at timestamp NOT NULL DEFAULT now(), "
+        "updated_at timestamp NOT NULL DEFAULT now(), "
+        f"search_vector tsvector GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED, "
+        f"CONSTRAINT pk_{name} PRIMARY KEY ({primary_key}), "
+        f"CONSTRAINT ck_{name}_check_rate_range CHECK (rate >= 0 AND rate <= 5.0), "
+        f"CONSTRAINT fk_{name}_user_id_users FOREIGN KEY (user_id) "
+        "REFERENCES users (id) ON DELETE CASCADE"
+        f") {partition_by}"
+    )
+
+    for index_name, definition in INDEXES.items():
+        op.execute(
+            f"CREATE INDEX {index_name.replace('movies', name, 1)} ON {name} {definition}",
+        )
+
+
+def _create_sync_trigger(target: str, key: str) -> None:
+    # mirrors every write of 'movies' into the target table until the swap
+    op.execute(
+        f"CREATE FUNCTION movies_sync_{target}() RETURNS trigger "  # noqa: S608
+        "LANGUAGE plpgsql AS $$ "
+        "BEGIN "
+        "IF TG_OP = 'INSERT' THEN "
+        f"INSERT INTO {target} ({COLUMNS}) "
+        "VALUES (NEW.id, NEW.title, NEW.description, NEW.rate, "
+        "NEW.user_id, NEW.created_at, NEW.updated_at); "
+        "ELSIF TG_OP = 'UPDATE' THEN "
+        f"UPDATE {target} SET title = NEW.title, description = NEW.description, "
+        "rate = NEW.rate, updated_at = NEW.updated_at "
+        f"WHERE ({key}) = ({', '.join(f'OLD.{column}' for column in key.split(', '))}); "
+        "ELSE "
+        f"DELETE FROM {target} "
+        f"WHERE ({key}) = ({', '.join(f'OLD.{column}' for column in key.split(', '))}); "
+        "END IF; "
+        "RETURN NULL; "
+        "END $$"
+    )
+    op.execute(
+        f"CREATE TRIGGER movies_sync_{target} "
+        "AFTER INSERT OR UPDATE OR DELETE ON movies "
+        f"FOR EACH ROW EXECUTE FUNCTION movies_sync_{target}()"
+    )
+
+
+def _backfill(target: str, key: str) -> None:
+    conn = op.get_bind()
+    max_id = conn.scalar(sa.text("SELECT coalesce(max(id), 0) FROM movies"))
+    key_match = " AND ".join(f"t.{column} = m.{column}" for column in key.split(", "))
+
+    for lower in range(0, max_id, BACKFILL_BATCH_SIZE):
+        # FOR UPDATE holds concurrent updates of the batch until it is copied,
+        # rows already mirrored by the trigger are skipped
+        conn.execute(
+            sa.text(
+                f"INSERT INTO {target} ({COLUMNS}) "  # noqa: S608
+                f"SELECT {COLUMNS} FROM movies m "
+                "WHERE m.id > :lower AND m.id <= :upper "
+                f"AND NOT EXISTS (SELECT 1 FROM {target} t WHERE {key_match}) "
+                "FOR UPDATE OF m",
+            ),
+            {"lower": lower, "upper": lower + BACKFILL_BATCH_SIZE},
+        )
+
+
+def _swap(source: str) -> None:
+    op.execute("LOCK TABLE movies IN ACCESS EXCLUSIVE MODE")
+    # the sequence is owned by the old table and would be dropped with it
+    op.execute(f"ALTER SEQUENCE movies_id_seq OWNED BY {source}.id")
+    op.execute("DROP TABLE movies")
+    op.execute(f"DROP FUNCTION movies_sync_{source}()")
+    op.execute(f"ALTER TABLE {source} RENAME TO movies")
+
+    for constraint_name in CONSTRAINTS:
+        op.execute(
+            f"ALTER TABLE movies RENAME CONSTRAINT "
+            f"{constraint_name.replace('movies', source, 1)} TO {constraint_name}",
+        )
+
+    for index_name in INDEXES:
+        op.execute(
+            f"ALTER INDEX {index_name.replace('movies', source, 1)} RENAME TO {index_name}"
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ---------------------------------------------------------------------------
+    # 1. Partitioned table and title guard
+    # ---------------------------------------------------------------------------
+    _create_movies_table(
+        name="movies_partitioned",
+        primary_key="id, user_id",
+        partition_by="PARTITION BY HASH (user_id)",
+    )
+
+    for remainder in range(PARTITIONS):
+        op.execute(
+            f"CREATE TABLE movies_p{remainder} PARTITION OF movies_partitioned "
+            f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})",
+        )
+
+    op.create_table(
+        "movie_titles",
+        sa.Column(
+            "title",
+            sa.String(length=50),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint(
+            "title",
+            name=op.f("pk_movie_titles"),
+        ),
+    )
+    op.execute(
+        "CREATE FUNCTION movies_claim_title() RETURNS trigger "
+        "LANGUAGE plpgsql AS $$ "
+        "BEGIN "
+        "IF TG_OP = 'UPDATE' THEN "
+        "IF NEW.title = OLD.title THEN RETURN NEW; END IF; "
+        "DELETE FROM movie_titles WHERE title = OLD.title; "
+        "ELSIF current_setting('movies.skip_title_conflicts', true) = 'on' THEN "
+        "INSERT INTO movie_titles (title) VALUES (NEW.title) ON CONFLICT DO NOTHING; "
+        "IF NOT FOUND THEN RETURN NULL; END IF; "
+        "RETURN NEW; "
+        "END IF; "
+        "INSERT INTO movie_titles (title) VALUES (NEW.title); "
+        "RETURN NEW; "
+        "END $$"
+    )
+    op.execute(
+        "CREATE FUNCTION movies_release_titles() RETURNS trigger "
+        "LANGUAGE plpgsql AS $$ "
+        "BEGIN "
+        "DELETE FROM movie_titles t USING deleted_movies d WHERE t.title = d.title; "
+        "RETURN NULL; "
+        "END $$"
+    )
+    op.execute(
+        "CREATE TRIGGER movies_claim_title "
+        "BEFORE INSERT OR UPDATE OF title ON movies_partitioned "
+        "FOR EACH ROW EXECUTE FUNCTION movies_claim_title()"
+    )
+    op.execute(
+        "CREATE TRIGGER movies_release_titles "
+        "AFTER DELETE ON movies_partitioned "
+        "REFERENCING OLD TABLE AS deleted_movies "
+        "FOR EACH STATEMENT EXECUTE FUNCTION movies_release_titles()"
+    )
+    _create_sync_trigger(target="movies_partitioned", key="id, user_id")
+
+    # ---------------------------------------------------------------------------
+    # 2. Backfill, committed batch by batch
+    # ---------------------------------------------------------------------------
+    with op.get_context().autocommit_block():
+        _backfill(target="movies_partitioned", key="id, user_id")
+
+    # ---------------------------------------------------------------------------
+    # 3. Swap
+    # ---------------------------------------------------------------------------
+    _swap(source="movies_partitioned")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _create_movies_table(
+        name="movies_unpartitioned",
+        primary_key="id",
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_movies_unpartitioned_title ON movies_unpartitioned (title)",
+    )
+    _create_sync_trigger(target="movies_unpartitioned", key="id")
+
+    with op.get_context().autocommit_block():
+        _backfill(target="movies_unpartitioned", key="id")
+
+    _swap(source="movies_unpartitioned")
+    op.execute("ALTER INDEX ix_movies_unpartitioned_title RENAME TO ix_movies_title")
+    op.execute("DROP FUNCTION movies_claim_title()")
+    op.execute("DROP FUNCTION movies_release_titles()")
+    op.drop_table(
+        table_name="movie_titles",
+    )
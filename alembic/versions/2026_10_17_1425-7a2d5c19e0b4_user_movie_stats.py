@@ -0,0 +1,201 @@
+"""
+user movie stats.
+
+Keep per-user movie statistics in 'user_movie_stats' so reading them \
+does not aggregate the user's whole library.
+
+Statement-level triggers on movies apply the net change of every insert, \
+update and delete to the stats rows within the writing transaction, using \
+transition tables, so bulk inserts and imports cost one stats write per user. \
+The newest and oldest creation dates are recomputed from the \
+'ix_movies_user_id_created_at_id' index only when a boundary movie is deleted.
+
+Deletes never insert stats rows, the row of a deleted user is already removed \
+by its foreign key cascade.
+
+Revision ID: 7a2d5c19e0b4
+Revises: f4c81b9d2e57
+Create Date: 2026-10-17 14:25:03.517290
+
+"""
+
+from collections.abc import (
+    Sequence,
+)
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import (
+    postgresql,
+)
+
+from alembic import (
+    op,
+)
+
+revision: str = "7a2d5c19e0b4"
+down_revision: str | Sequence[str] | None = "f4c81b9d2e57"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+RATE_HISTOGRAM_BUCKETS = 5  # movies per whole rate, 5.0 falls into the last bucket
+RATE_BUCKET = f"least(floor(rate)::integer, {RATE_HISTOGRAM_BUCKETS - 1})"
+
+STATS_COLUMNS = (
+    "user_id, movie_count, rate_sum, rate_histogram, newest_created_at, oldest_created_at"
+)
+
+
+def _aggregate(source: str, sign: str) -> str:
+    histogram = ", ".join(
+        f"coalesce(sum({sign}) FILTER (WHERE {RATE_BUCKET} = {bucket}), 0)::integer"
+        for bucket in range(RATE_HISTOGRAM_BUCKETS)
+    )
+    return (
+        f"SELECT user_id, coalesce(sum({sign}), 0)::integer, "  # noqa: S608
+        f"coalesce(sum({sign} * rate), 0), ARRAY[{histogram}], "
+        "max(created_at), min(created_at) "
+        f"FROM {source} GROUP BY user_id"
+    )
+
+
+# net change of a statement, one row per user and a sign per changed movie
+CHANGES = {
+    "insert": "(SELECT user_id, rate, created_at, 1 AS sign FROM new_movies) AS changes",
+    # 'created_at' and 'user_id' are never updated, only rate changes matter
+    "update": (
+        "(SELECT n.user_id, n.rate, n.created_at, 1 AS sign FROM new_movies n "
+        "JOIN old_movies o ON o.id = n.id AND o.user_id = n.user_id "
+        "WHERE o.rate <> n.rate "
+        "UNION ALL "
+        "SELECT o.user_id, o.rate, o.created_at, -1 AS sign FROM old_movies o "
+        "JOIN new_movies n ON n.id = o.id AND n.user_id = o.user_id "
+        "WHERE o.rate <> n.rate) AS changes"
+    ),
+    "delete": "(SELECT user_id, rate, created_at, -1 AS sign FROM old_movies) AS changes",
+}
+STATS_UPDATES = {
+    # sorted by user to keep concurrent multi-user inserts from deadlocking
+    "insert": (
+        f"INSERT INTO user_movie_stats AS s ({STATS_COLUMNS}) "
+        f"{_aggregate(CHANGES['insert'], 'sign')} ORDER BY user_id "
+        "ON CONFLICT (user_id) DO UPDATE SET "
+        "movie_count = s.movie_count + excluded.movie_count, "
+        "rate_sum = s.rate_sum + excluded.rate_sum, "
+        "rate_histogram = user_movie_stats_add(s.rate_histogram, excluded.rate_histogram), "
+        "newest_created_at = greatest(s.newest_created_at, excluded.newest_created_at), "
+        "oldest_created_at = least(s.oldest_created_at, excluded.oldest_created_at)"
+    ),
+    "update": (
+        "UPDATE user_movie_stats AS s SET "  # noqa: S608
+        "rate_sum = s.rate_sum + d.rate_sum, "
+        "rate_histogram = user_movie_stats_add(s.rate_histogram, d.rate_histogram) "
+        f"FROM ({_aggregate(CHANGES['update'], 'sign')}) "
+        f"AS d ({STATS_COLUMNS}) "
+        "WHERE s.user_id = d.user_id"
+    ),
+    "delete": (
+        "UPDATE user_movie_stats AS s SET "  # noqa: S608
+        "movie_count = s.movie_count + d.movie_count, "
+        "rate_sum = s.rate_sum + d.rate_sum, "
+        "rate_histogram = user_movie_stats_add(s.rate_histogram, d.rate_histogram), "
+        "newest_created_at = CASE WHEN d.newest_created_at < s.newest_created_at "
+        "THEN s.newest_created_at "
+        "ELSE (SELECT max(m.created_at) FROM movies m WHERE m.user_id = s.user_id) END, "
+        "oldest_created_at = CASE WHEN d.oldest_created_at > s.oldest_created_at "
+        "THEN s.oldest_created_at "
+        "ELSE (SELECT min(m.created_at) FROM movies m WHERE m.user_id = s.user_id) END "
+        f"FROM ({_aggregate(CHANGES['delete'], 'sign')}) "
+        f"AS d ({STATS_COLUMNS}) "
+        "WHERE s.user_id = d.user_id"
+    ),
+}
+TRANSITION_TABLES = {
+    "insert": "NEW TABLE AS new_movies",
+    "update": "OLD TABLE AS old_movies NEW TABLE AS new_movies",
+    "delete": "OLD TABLE AS old_movies",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_movie_stats",
+        sa.Column(
+            "user_id",
+            sa.Uuid(),
+            nullable=False,
+        ),
+        sa.Column(
+            "movie_count",
+            sa.Integer(),
+            nullable=False,
+        ),
+        sa.Column(
+            "rate_sum",
+            sa.Numeric(),
+            nullable=False,
+        ),
+        sa.Column(
+            "rate_histogram",
+            postgresql.ARRAY(sa.Integer()),
+            nullable=False,
+        ),
+        sa.Column(
+            "newest_created_at",
+            sa.DateTime(),
+            nullable=True,
+        ),
+        sa.Column(
+            "oldest_created_at",
+            sa.DateTime(),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["users.id"],
+            name=op.f("fk_user_movie_stats_user_id_users"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint(
+            "user_id",
+            name=op.f("pk_user_movie_stats"),
+        ),
+    )
+    op.execute(
+        "CREATE FUNCTION user_movie_stats_add(a integer[], b integer[]) "
+        "RETURNS integer[] LANGUAGE sql IMMUTABLE AS $$ "
+        "SELECT array_agg(x + y ORDER BY i) "
+        "FROM unnest(a, b) WITH ORDINALITY AS t (x, y, i) "
+        "$$"
+    )
+
+    # creating the triggers locks out writes to movies until the backfill commits
+    for operation, statement in STATS_UPDATES.items():
+        op.execute(
+            f"CREATE FUNCTION movies_stats_{operation}() RETURNS trigger "
+            "LANGUAGE plpgsql AS $$ "
+            f"BEGIN {statement}; RETURN NULL; END "
+            "$$"
+        )
+        op.execute(
+            f"CREATE TRIGGER movies_stats_{operation} "
+            f"AFTER {operation.upper()} ON movies "
+            f"REFERENCING {TRANSITION_TABLES[operation]} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION movies_stats_{operation}()"
+        )
+
+    op.execute(
+        f"INSERT INTO user_movie_stats ({STATS_COLUMNS}) {_aggregate('movies', '1')}",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for operation in STATS_UPDATES:
+        op.execute(f"DROP TRIGGER movies_stats_{operation} ON movies")
+        op.execute(f"DROP FUNCTION movies_stats_{operation}()")
+
+    op.execute("DROP FUNCTION user_movie_stats_add(integer[], integer[])")
+    op.drop_table(
+        table_name="user_movie_stats",
+    )
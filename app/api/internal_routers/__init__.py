@@ -7,6 +7,10 @@ from fastapi import (
 from app.api.internal_routers.healthcheck import (
     router as health_router,
 )
+from app.api.internal_routers.metrics import (
+    router as metrics_router,
+)
 
 router = APIRouter(tags=["Internal"])
 router.include_router(health_router)
+router.include_router(metrics_router)
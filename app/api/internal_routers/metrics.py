@@ -0,0 +1,44 @@
+from fastapi import (
+    APIRouter,
+    Response,
+)
+from fastapi.responses import (
+    JSONResponse,
+)
+
+from app.api.v1.dependencies import (
+    dep_permission_getter,
+)
+from app.core import (
+    dep_rate_limiter_getter,
+    metrics,
+)
+from app.domains import (
+    UserRole,
+)
+
+router = APIRouter(
+    tags=["Metrics"],
+    dependencies=[
+        dep_rate_limiter_getter(seconds=1),
+        # counters reveal traffic and cache internals
+        dep_permission_getter(UserRole.ADMIN),
+    ],
+)
+
+
+@router.get(
+    path="/metrics",
+)
+async def get_metrics() -> Response:
+    """
+    Get the counters of the current worker process.
+
+    Returns
+    -------
+    Response
+        counter values by name
+    """
+    return JSONResponse(
+        content=metrics.snapshot(),
+    )
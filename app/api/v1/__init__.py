@@ -10,12 +10,23 @@ from app.api.v1.routers import (
     user_router,
 )
 from app.core import (
+    dep_db_timeout_getter,
+    dep_query_guard_getter,
+    dep_request_route_getter,
     settings,
 )
 
 router = APIRouter(
     prefix=settings.api.v1.prefix,
     tags=["V1"],
+    dependencies=[
+        dep_request_route_getter(),
+        dep_query_guard_getter(
+            mode=settings.db.sqla.query_budget_mode,
+            default_budget=settings.db.sqla.query_budget,
+        ),
+        dep_db_timeout_getter(seconds=settings.db.sqla.request_timeout),
+    ],
 )
 router.include_router(auth_router)
 router.include_router(movie_router)
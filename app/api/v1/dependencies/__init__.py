@@ -2,12 +2,17 @@ __all__ = (
     "AuthLoginDep",
     "AuthLogoutDep",
     "AuthRegisterDep",
+    "MovieBatchGetDep",
+    "MovieBulkCreateDep",
     "MovieCreateDep",
     "MovieDeleteDep",
+    "MovieExportDep",
     "MovieGetAllDep",
     "MovieGetAllDep",
     "MovieGetDep",
-    "MovieOwnershipDep",
+    "MovieImportDep",
+    "MovieSearchDep",
+    "MovieStatsDep",
     "MovieUpdateDep",
     "UserDeleteDep",
     "UserDeleteMeDep",
@@ -17,7 +22,6 @@ __all__ = (
     "UserOwnershipDep",
     "UserUpdateDep",
     "UserUpdateMeDep",
-    "dep_movie_ownership_getter",
     "dep_permission_getter",
     "dep_user_ownership_getter",
 )
@@ -26,11 +30,16 @@ from app.api.v1.dependencies.requests import (
     AuthLoginDep,
     AuthLogoutDep,
     AuthRegisterDep,
+    MovieBatchGetDep,
+    MovieBulkCreateDep,
     MovieCreateDep,
     MovieDeleteDep,
+    MovieExportDep,
     MovieGetAllDep,
     MovieGetDep,
-    MovieOwnershipDep,
+    MovieImportDep,
+    MovieSearchDep,
+    MovieStatsDep,
     MovieUpdateDep,
     UserDeleteDep,
     UserDeleteMeDep,
@@ -41,9 +50,6 @@ from app.api.v1.dependencies.requests import (
     UserUpdateDep,
     UserUpdateMeDep,
 )
-from app.api.v1.dependencies.security.movie_ownership import (
-    dep_movie_ownership_getter,
-)
 from app.api.v1.dependencies.security.rbac import (
     dep_permission_getter,
 )
@@ -2,12 +2,17 @@ __all__ = (
     "AuthLoginDep",
     "AuthLogoutDep",
     "AuthRegisterDep",
+    "MovieBatchGetDep",
+    "MovieBulkCreateDep",
     "MovieCreateDep",
     "MovieDeleteDep",
+    "MovieExportDep",
     "MovieGetAllDep",
     "MovieGetAllDep",
     "MovieGetDep",
-    "MovieOwnershipDep",
+    "MovieImportDep",
+    "MovieSearchDep",
+    "MovieStatsDep",
     "MovieUpdateDep",
     "UserDeleteDep",
     "UserDeleteMeDep",
@@ -26,11 +31,16 @@ from app.api.v1.dependencies.requests.auth import (
     AuthRegisterDep,
 )
 from app.api.v1.dependencies.requests.movie import (
+    MovieBatchGetDep,
+    MovieBulkCreateDep,
     MovieCreateDep,
     MovieDeleteDep,
+    MovieExportDep,
     MovieGetAllDep,
     MovieGetDep,
-    MovieOwnershipDep,
+    MovieImportDep,
+    MovieSearchDep,
+    MovieStatsDep,
     MovieUpdateDep,
 )
 from app.api.v1.dependencies.requests.user import (
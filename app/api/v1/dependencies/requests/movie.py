@@ -1,4 +1,5 @@
 from collections.abc import (
+    AsyncIterator,
     Sequence,
 )
 from typing import (
@@ -11,27 +12,76 @@ from uuid import (
 from fastapi import (
     Body,
     Depends,
+    Header,
     Path,
     Query,
+    Request,
+    Response,
 )
-
-from app.api.v1.dependencies.security import (
-    dep_movie_ownership_getter,
+from fastapi.responses import (
+    StreamingResponse,
+)
+from pydantic import (
+    ValidationError,
 )
+
 from app.api.v1.schemas import (
     BaseResponse,
+    MovieBulkErrorDTO,
     MovieFilterDTO,
     MovieInputDTO,
     MovieOutputDTO,
+    MovieSearchDTO,
     MovieUpdateDTO,
+    ResponseBulkCreateMovie,
     ResponseDeleteMovie,
+    ResponseImportMovie,
     ResponseUpdateMovie,
 )
+from app.cache import (
+    RedisCache,
+    RedisGenerationCache,
+    SingleFlight,
+    cache_redis,
+)
+from app.core import (
+    settings,
+)
+from app.core.constants import (
+    ETAG_HEADER,
+    MOVIE_BATCH_MAX_IDS,
+    MOVIE_BULK_MAX_ITEMS,
+    MOVIE_IMPORT_SPOOL_MEMORY,
+    NEXT_CURSOR_HEADER,
+)
+from app.core.etag import (
+    etag_matches,
+    make_etag,
+    not_modified,
+)
+from app.core.exceptions import (
+    PayloadTooLargeError,
+)
+from app.core.serialization import (
+    dump_csv,
+    dump_json,
+    dump_ndjson,
+    iter_spooled,
+    load_csv,
+    load_ndjson,
+    spool,
+)
 from app.domains import (
+    CursorDM,
+    DataFormat,
+    MovieBatchOutputDM,
     MovieFiltersDM,
     MovieInputDM,
     MovieOutputDM,
+    MovieSearchFiltersDM,
+    MovieStatsDM,
     MovieUpdateDM,
+    UserRole,
 )
 from app.security.auth_managers import (
     PayloadDep,
@@ -46,6 +96,18 @@ from app.services.service_managers import (
 
 movie_service_manager = SqlAlchemyServiceManager(
     service_class=MovieService,
+    movie_cache=RedisCache(
+        namespace="movie",
+        value_class=MovieOutputDM,
+    ),
+    listing_cache=RedisGenerationCache(
+        namespace="movie_listing",
+        value_class=MovieOutputDM,
+    ),
+    movie_flight=SingleFlight(
+        namespace="movie",
+        client=cache_redis,
+    ),
 )
 
 MovieServiceDep = Annotated[
@@ -53,9 +115,20 @@ MovieServiceDep = Annotated[
     Depends(movie_service_manager.service_getter),
 ]
 MovieFromBody = Annotated[MovieInputDTO, Body()]
+MoviesFromBody = Annotated[
+    list[MovieInputDTO],
+    Body(min_length=1, max_length=MOVIE_BULK_MAX_ITEMS),
+]
 MovieIdFromPath = Annotated[int | UUID, Path()]
+MovieIdsFromQuery = Annotated[
+    list[int | UUID],
+    Query(alias="ids", min_length=1, max_length=MOVIE_BATCH_MAX_IDS),
+]
 MovieFilterFromQuery = Annotated[MovieFilterDTO, Query()]
+MovieSearchFromQuery = Annotated[MovieSearchDTO, Query()]
+DataFormatFromQuery = Annotated[DataFormat, Query(alias="format")]
 MovieUpdateFromBody = Annotated[MovieUpdateDTO, Body()]
+IfNoneMatchFromHeader = Annotated[str | None, Header()]
 
 
 async def create_movie(
@@ -88,14 +161,125 @@ async def create_movie(
     )
 
 
+async def create_movies(
+    movie_service: MovieServiceDep,
+    payload: PayloadDep,
+    movies_input: MoviesFromBody,
+) -> BaseResponse:
+    """
+    Create new movies in bulk.
+
+    Parameters
+    ----------
+    movie_service : MovieServiceDep
+        movie service
+
+    payload : PayloadDep
+        payload data
+
+    movies_input : MoviesFromBody
+        new movies data
+
+    Returns
+    -------
+    BaseResponse
+        created movies and per-item errors
+    """
+    result = await movie_service.create_movies(
+        movies_input=[MovieInputDM.from_object(movie) for movie in movies_input],
+        user_id=payload.user_id,
+    )
+    return ResponseBulkCreateMovie(
+        created=[MovieOutputDTO.model_validate(movie) for movie in result.created],
+        errors=[MovieBulkErrorDTO.model_validate(error) for error in result.errors],
+    )
+
+
+async def import_movies(
+    movie_service: MovieServiceDep,
+    payload: PayloadDep,
+    request: Request,
+    data_format: DataFormatFromQuery = DataFormat.NDJSON,
+) -> BaseResponse:
+    """
+    Import movies from an uploaded file.
+
+    The request body is buffered before the import starts, in memory \
+        up to a limit and on disk beyond, then parsed and validated \
+        incrementally; rows that fail validation are counted and skipped. \
+        Bodies larger than the configured import size are refused with 413, \
+        up front when announced by Content-Length, otherwise while buffered.
+
+    Parameters
+    ----------
+    movie_service : MovieServiceDep
+        movie service
+
+    payload : PayloadDep
+        payload data
+
+    request : Request
+        request with the streamed file body
+
+    data_format : DataFormatFromQuery, optional
+        import format, by default DataFormat.NDJSON
+
+    Returns
+    -------
+    BaseResponse
+        numbers of inserted, skipped and invalid rows
+    """
+    max_size = settings.app.import_max_bytes
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_size:
+        raise PayloadTooLargeError(max_bytes=max_size)
+
+    # the upload is buffered first, a slow client must not hold a pooled connection
+    body = await spool(
+        request.stream(),
+        max_memory=MOVIE_IMPORT_SPOOL_MEMORY,
+        max_size=max_size,
+    )
+
+    async def validate() -> AsyncIterator[MovieInputDM | None]:
+        match data_format:
+            case DataFormat.NDJSON:
+                rows = load_ndjson(iter_spooled(body))
+            case DataFormat.CSV:
+                rows = load_csv(iter_spooled(body))
+
+        async for row in rows:
+            try:
+                yield MovieInputDM.from_object(MovieInputDTO.model_validate(row))
+            except ValidationError:
+                yield None
+
+    with body:
+        result = await movie_service.import_movies(
+            movies_input=validate(),
+            user_id=payload.user_id,
+        )
+    return ResponseImportMovie(
+        inserted=result.inserted,
+        skipped=result.skipped,
+        invalid=result.invalid,
+    )
+
+
 async def get_all_movies(
     movie_service: MovieServiceDep,
     payload: PayloadDep,
     filters: MovieFilterFromQuery,
-) -> Sequence[MovieOutputDM]:
+    response: Response,
+    if_none_match: IfNoneMatchFromHeader = None,
+) -> Sequence[MovieOutputDM] | Response:
     """
     Get all user's movies.
 
+    A full page sets the cursor of the next page in the response headers. \
+        The entity tag follows the user's movies generation, so a client \
+        holding the current page is answered without reading the movies.
+
     Parameters
     ----------
     movie_service : MovieServiceDep
@@ -107,55 +291,256 @@ async def get_all_movies(
     filters : MovieFilterFromQuery
         movie search filter
 
+    response : Response
+        response to the client
+
+    if_none_match : IfNoneMatchFromHeader, optional
+        entity tags of the client's cached pages, by default None
+
+    Returns
+    -------
+    Sequence[MovieOutputDM] | Response
+        data of movies, or a bodyless response if not modified
+    """
+    movie_filters = MovieFiltersDM.from_object(filters)
+    tag = await movie_service.get_all_movies_tag(
+        user_id=payload.user_id,
+        filters=movie_filters,
+    )
+
+    if tag is not None and etag_matches(if_none_match, etag := make_etag(tag)):
+        return not_modified(etag)
+
+    movies = await movie_service.get_all_movies(
+        user_id=payload.user_id,
+        filters=movie_filters,
+    )
+    # the tag is read before the movies, at worst it is older than them
+    etag = make_etag(tag if tag is not None else dump_json(movies))
+
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    response.headers[ETAG_HEADER] = etag
+
+    if movies and len(movies) == filters.limit:
+        last_movie = movies[-1]
+        response.headers[NEXT_CURSOR_HEADER] = CursorDM(
+            sort_by=filters.sort_by,
+            value=getattr(last_movie, filters.sort_by.removeprefix("-")),
+            id=last_movie.id,
+        ).encode()
+
+    return movies
+
+
+async def export_movies(
+    movie_service: MovieServiceDep,
+    payload: PayloadDep,
+    data_format: DataFormatFromQuery = DataFormat.NDJSON,
+) -> StreamingResponse:
+    """
+    Export all user's movies.
+
+    Movies are streamed from a server-side cursor batch by batch, \
+        so memory use does not depend on the size of the library.
+
+    Parameters
+    ----------
+    movie_service : MovieServiceDep
+        movie service
+
+    payload : PayloadDep
+        payload data
+
+    data_format : DataFormatFromQuery, optional
+        export format, by default DataFormat.NDJSON
+
+    Returns
+    -------
+    StreamingResponse
+        streamed movies file
+    """
+
+    async def serialize() -> AsyncIterator[bytes]:
+        header = True
+
+        async for movies in movie_service.export_movies(user_id=payload.user_id):
+            match data_format:
+                case DataFormat.NDJSON:
+                    yield dump_ndjson(movies)
+                case DataFormat.CSV:
+                    yield dump_csv(movies, header=header)
+                    header = False
+
+    return StreamingResponse(
+        content=serialize(),
+        media_type=data_format.media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="movies.{data_format}"',
+        },
+    )
+
+
+async def search_movies(
+    movie_service: MovieServiceDep,
+    payload: PayloadDep,
+    filters: MovieSearchFromQuery,
+) -> Sequence[MovieOutputDM]:
+    """
+    Full-text search user's movies.
+
+    Parameters
+    ----------
+    movie_service : MovieServiceDep
+        movie service
+
+    payload : PayloadDep
+        payload data
+
+    filters : MovieSearchFromQuery
+        movie full-text search filter
+
     Returns
     -------
     Sequence[MovieOutputDM]
         data of movies
     """
-    return await movie_service.get_all_movies(
+    return await movie_service.search_movies(
         user_id=payload.user_id,
-        filters=MovieFiltersDM.from_object(filters),
+        filters=MovieSearchFiltersDM.from_object(
+            filters,
+            none_if_key_not_found=True,
+        ),
+    )
+
+
+async def get_movie_stats(
+    movie_service: MovieServiceDep,
+    payload: PayloadDep,
+) -> MovieStatsDM:
+    """
+    Get user's movie statistics.
+
+    Parameters
+    ----------
+    movie_service : MovieServiceDep
+        movie service
+
+    payload : PayloadDep
+        payload data
+
+    Returns
+    -------
+    MovieStatsDM
+        movie statistics
+    """
+    return await movie_service.get_movie_stats(
+        user_id=payload.user_id,
+    )
+
+
+async def get_movies(
+    movie_service: MovieServiceDep,
+    payload: PayloadDep,
+    movie_ids: MovieIdsFromQuery,
+) -> MovieBatchOutputDM:
+    """
+    Get movies by ids.
+
+    Users only get their own movies, admins get any movie; \
+        other ids are reported as missing.
+
+    Parameters
+    ----------
+    movie_service : MovieServiceDep
+        movie service
+
+    payload : PayloadDep
+        payload data
+
+    movie_ids : MovieIdsFromQuery
+        movies ids
+
+    Returns
+    -------
+    MovieBatchOutputDM
+        found movies in request order and ids of missing ones
+    """
+    return await movie_service.get_movies(
+        movie_ids=movie_ids,
+        user_id=None if payload.user_role is UserRole.ADMIN else payload.user_id,
+        actor_id=payload.user_id,
     )
 
 
 async def get_movie(
     movie_service: MovieServiceDep,
+    payload: PayloadDep,
     movie_id: MovieIdFromPath,
-) -> MovieOutputDM:
+    response: Response,
+    if_none_match: IfNoneMatchFromHeader = None,
+) -> MovieOutputDM | Response:
     """
     Get a movie by id.
 
+    The entity tag is a digest of the movie rather than of its update \
+        time, which only has a resolution of seconds.
+
     Parameters
     ----------
     movie_service : MovieServiceDep
         movie service
 
+    payload : PayloadDep
+        payload data
+
     movie_id : MovieIdFromPath
         movie id
 
+    response : Response
+        response to the client
+
+    if_none_match : IfNoneMatchFromHeader, optional
+        entity tags of the client's cached movie, by default None
+
     Returns
     -------
-    MovieOutputDM
-        movie data
+    MovieOutputDM | Response
+        movie data, or a bodyless response if not modified
     """
-    return await movie_service.get_movie(
+    movie = await movie_service.get_movie(
         movie_id=movie_id,
+        user_id=payload.user_id,
     )
+    etag = make_etag(dump_json(movie))
+
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    response.headers[ETAG_HEADER] = etag
+    return movie
 
 
 async def update_movie(
     movie_service: MovieServiceDep,
+    payload: PayloadDep,
     movie_id: MovieIdFromPath,
     movie_update: MovieUpdateFromBody,
 ) -> BaseResponse:
     """
     Update a movie by id.
 
+    Users can only update their own movies, admins can update any movie.
+
     Parameters
     ----------
     movie_service : MovieServiceDep
         movie service
 
+    payload : PayloadDep
+        payload data
+
     movie_id : MovieIdFromPath
         movie id
 
@@ -173,6 +558,8 @@ async def update_movie(
             movie_update.model_dump(exclude_unset=True),
             none_if_key_not_found=True,
         ),
+        user_id=None if payload.user_role is UserRole.ADMIN else payload.user_id,
+        actor_id=payload.user_id,
     )
     return ResponseUpdateMovie(
         movie=MovieOutputDTO.model_validate(movie),
@@ -181,16 +568,22 @@ async def update_movie(
 
 async def delete_movie(
     movie_service: MovieServiceDep,
+    payload: PayloadDep,
     movie_id: MovieIdFromPath,
 ) -> BaseResponse:
     """
     Delete a movie by id.
 
+    Users can only delete their own movies, admins can delete any movie.
+
     Parameters
     ----------
     movie_service : MovieServiceDep
         movie service
 
+    payload : PayloadDep
+        payload data
+
     movie_id : MovieIdFromPath
         movie id
 
@@ -201,25 +594,48 @@ async def delete_movie(
     """
     movie = await movie_service.delete_movie(
         movie_id=movie_id,
+        user_id=None if payload.user_role is UserRole.ADMIN else payload.user_id,
+        actor_id=payload.user_id,
     )
     return ResponseDeleteMovie(
         movie=MovieOutputDTO.model_validate(movie),
     )
 
 
-MovieOwnershipDep = dep_movie_ownership_getter(
-    service_manager=movie_service_manager,
-)
 MovieCreateDep = Annotated[
     MovieOutputDM,
     Depends(create_movie),
 ]
+MovieBulkCreateDep = Annotated[
+    BaseResponse,
+    Depends(create_movies),
+]
 MovieGetAllDep = Annotated[
-    Sequence[MovieOutputDM],
+    Sequence[MovieOutputDM] | Response,
     Depends(get_all_movies),
 ]
+MovieExportDep = Annotated[
+    StreamingResponse,
+    Depends(export_movies),
+]
+MovieSearchDep = Annotated[
+    Sequence[MovieOutputDM],
+    Depends(search_movies),
+]
+MovieStatsDep = Annotated[
+    MovieStatsDM,
+    Depends(get_movie_stats),
+]
+MovieImportDep = Annotated[
+    BaseResponse,
+    Depends(import_movies),
+]
+MovieBatchGetDep = Annotated[
+    MovieBatchOutputDM,
+    Depends(get_movies),
+]
 MovieGetDep = Annotated[
-    MovieOutputDM,
+    MovieOutputDM | Response,
     Depends(get_movie),
 ]
 MovieUpdateDep = Annotated[
@@ -32,10 +32,15 @@ from app.api.v1.schemas import (
     UserOutputDTO,
     UserUpdateDTO,
 )
+from app.cache import (
+    LocalCache,
+    RedisCache,
+)
 from app.core import (
     settings,
 )
 from app.domains import (
+    MovieOutputDM,
     UserFiltersDM,
     UserOutputDM,
     UserUpdateDM,
@@ -61,6 +66,13 @@ user_service_manager = SqlAlchemyServiceManager(
     auth_manager=AuthJWTManager(
         auth_config=settings.auth_token,
     ),
+    user_cache=LocalCache(
+        namespace="user",
+    ),
+    movie_cache=RedisCache(
+        namespace="movie",
+        value_class=MovieOutputDM,
+    ),
 )
 
 UserServiceDep = Annotated[
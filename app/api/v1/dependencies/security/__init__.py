@@ -1,12 +1,8 @@
 __all__ = (
-    "dep_movie_ownership_getter",
     "dep_permission_getter",
     "dep_user_ownership_getter",
 )
 
-from app.api.v1.dependencies.security.movie_ownership import (
-    dep_movie_ownership_getter,
-)
 from app.api.v1.dependencies.security.rbac import (
     dep_permission_getter,
 )
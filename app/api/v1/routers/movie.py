@@ -4,30 +4,47 @@ from collections.abc import (
 
 from fastapi import (
     APIRouter,
+    Response,
     status,
 )
+from fastapi.responses import (
+    StreamingResponse,
+)
 
 from app.api.v1.dependencies import (
+    MovieBatchGetDep,
+    MovieBulkCreateDep,
     MovieCreateDep,
     MovieDeleteDep,
+    MovieExportDep,
     MovieGetAllDep,
     MovieGetDep,
-    MovieOwnershipDep,
+    MovieImportDep,
+    MovieSearchDep,
+    MovieStatsDep,
     MovieUpdateDep,
     dep_permission_getter,
 )
 from app.api.v1.schemas import (
     BaseResponse,
+    MovieBatchOutputDTO,
     MovieOutputDTO,
+    MovieStatsDTO,
+    ResponseBulkCreateMovie,
     ResponseDeleteMovie,
+    ResponseImportMovie,
     ResponseUpdateMovie,
 )
 from app.core import (
+    dep_db_timeout_getter,
+    dep_query_budget_getter,
     dep_rate_limiter_getter,
     settings,
 )
 from app.domains import (
+    MovieBatchOutputDM,
     MovieOutputDM,
+    MovieStatsDM,
     UserRole,
 )
 
@@ -45,6 +62,7 @@ router = APIRouter(
     response_model=MovieOutputDTO,
     status_code=status.HTTP_201_CREATED,
     dependencies=[
+        dep_query_budget_getter(statements=2),
         dep_permission_getter(
             UserRole.ADMIN,
             UserRole.USER,
@@ -70,10 +88,102 @@ async def create_movie(
     return created_movie
 
 
+@router.post(
+    path="/bulk",
+    response_model=ResponseBulkCreateMovie,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[
+        dep_query_budget_getter(statements=3),
+        dep_permission_getter(
+            UserRole.ADMIN,
+            UserRole.USER,
+        ),
+    ],
+)
+async def create_movies(
+    created_movies: MovieBulkCreateDep,
+) -> BaseResponse:
+    """
+    Create new movies in bulk.
+
+    Parameters
+    ----------
+    created_movies : MovieBulkCreateDep
+        created movies and per-item errors
+
+    Returns
+    -------
+    BaseResponse
+        status message
+    """
+    return created_movies
+
+
+@router.post(
+    path="/import",
+    response_model=ResponseImportMovie,
+    dependencies=[
+        dep_db_timeout_getter(seconds=settings.db.sqla.import_timeout),
+        dep_permission_getter(
+            UserRole.ADMIN,
+            UserRole.USER,
+        ),
+    ],
+)
+async def import_movies(
+    imported_movies: MovieImportDep,
+) -> BaseResponse:
+    """
+    Import movies from an uploaded NDJSON or CSV file.
+
+    Parameters
+    ----------
+    imported_movies : MovieImportDep
+        import summary
+
+    Returns
+    -------
+    BaseResponse
+        status message
+    """
+    return imported_movies
+
+
+@router.get(
+    path="",
+    response_model=MovieBatchOutputDTO,
+    dependencies=[
+        dep_query_budget_getter(statements=1),
+        dep_permission_getter(
+            UserRole.ADMIN,
+            UserRole.USER,
+        ),
+    ],
+)
+async def get_movies(
+    movies: MovieBatchGetDep,
+) -> MovieBatchOutputDM:
+    """
+    Get movies by ids.
+
+    Parameters
+    ----------
+    movies : MovieBatchGetDep
+        found movies and ids of missing ones
+
+    Returns
+    -------
+    MovieBatchOutputDM
+        movies data
+    """
+    return movies
+
+
 @router.get(
     path="/all",
     response_model=list[MovieOutputDTO],
     dependencies=[
+        dep_query_budget_getter(statements=1),
         dep_permission_getter(
             UserRole.ADMIN,
             UserRole.USER,
@@ -82,14 +192,75 @@ async def create_movie(
 )
 async def get_all_movies(
     movies: MovieGetAllDep,
-) -> Sequence[MovieOutputDM]:
+) -> Sequence[MovieOutputDM] | Response:
     """
     Get all user's movies.
 
     Parameters
     ----------
     movies : MovieGetAllDep
-        user's movies
+        user's movies, or a bodyless response if not modified
+
+    Returns
+    -------
+    Sequence[MovieOutputDM] | Response
+        data of movies
+    """
+    return movies
+
+
+@router.get(
+    path="/export",
+    response_class=StreamingResponse,
+    dependencies=[
+        # streaming is bounded by the client, not by a deadline
+        dep_db_timeout_getter(seconds=None),
+        dep_permission_getter(
+            UserRole.ADMIN,
+            UserRole.USER,
+        ),
+    ],
+)
+async def export_movies(
+    exported_movies: MovieExportDep,
+) -> StreamingResponse:
+    """
+    Export all user's movies as NDJSON or CSV.
+
+    Parameters
+    ----------
+    exported_movies : MovieExportDep
+        streamed movies file
+
+    Returns
+    -------
+    StreamingResponse
+        streamed movies file
+    """
+    return exported_movies
+
+
+@router.get(
+    path="/search",
+    response_model=list[MovieOutputDTO],
+    dependencies=[
+        dep_query_budget_getter(statements=1),
+        dep_permission_getter(
+            UserRole.ADMIN,
+            UserRole.USER,
+        ),
+    ],
+)
+async def search_movies(
+    movies: MovieSearchDep,
+) -> Sequence[MovieOutputDM]:
+    """
+    Full-text search user's movies by title and description.
+
+    Parameters
+    ----------
+    movies : MovieSearchDep
+        found user's movies
 
     Returns
     -------
@@ -99,24 +270,57 @@ async def get_all_movies(
     return movies
 
 
+@router.get(
+    path="/stats",
+    response_model=MovieStatsDTO,
+    dependencies=[
+        dep_query_budget_getter(statements=1),
+        dep_permission_getter(
+            UserRole.ADMIN,
+            UserRole.USER,
+        ),
+    ],
+)
+async def get_movie_stats(
+    stats: MovieStatsDep,
+) -> MovieStatsDM:
+    """
+    Get user's movie statistics.
+
+    Parameters
+    ----------
+    stats : MovieStatsDep
+        user's movie statistics
+
+    Returns
+    -------
+    MovieStatsDM
+        movie statistics
+    """
+    return stats
+
+
 @router.get(
     path="/{movie_id}",
     response_model=MovieOutputDTO,
+    dependencies=[
+        dep_query_budget_getter(statements=1),
+    ],
 )
 async def get_movie(
     movie: MovieGetDep,
-) -> MovieOutputDM:
+) -> MovieOutputDM | Response:
     """
     Get a movie by id.
 
     Parameters
     ----------
     movie : MovieGetDep
-        found movie data
+        found movie data, or a bodyless response if not modified
 
     Returns
     -------
-    MovieOutputDM
+    MovieOutputDM | Response
         movie data
     """
     return movie
@@ -126,11 +330,11 @@ async def get_movie(
     path="/{movie_id}",
     response_model=ResponseUpdateMovie,
     dependencies=[
+        dep_query_budget_getter(statements=3),
         dep_permission_getter(
             UserRole.ADMIN,
             UserRole.USER,
         ),
-        MovieOwnershipDep,
     ],
 )
 async def update_movie(
@@ -156,11 +360,11 @@ async def update_movie(
     path="/{movie_id}",
     response_model=ResponseDeleteMovie,
     dependencies=[
+        dep_query_budget_getter(statements=3),
         dep_permission_getter(
             UserRole.ADMIN,
             UserRole.USER,
         ),
-        MovieOwnershipDep,
     ],
 )
 async def delete_movie(
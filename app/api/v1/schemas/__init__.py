@@ -1,12 +1,18 @@
 __all__ = (
     "BaseResponse",
+    "MovieBatchOutputDTO",
+    "MovieBulkErrorDTO",
     "MovieCreateDTO",
     "MovieFilterDTO",
     "MovieInputDTO",
     "MovieOutputDTO",
+    "MovieSearchDTO",
+    "MovieStatsDTO",
     "MovieUpdateDTO",
+    "ResponseBulkCreateMovie",
     "ResponseDeleteMovie",
     "ResponseDeleteUser",
+    "ResponseImportMovie",
     "ResponseRegisterNewUser",
     "ResponseSuccessLogin",
     "ResponseSuccessLogout",
@@ -30,12 +36,18 @@ from app.api.v1.schemas.base import (
     BaseResponse,
 )
 from app.api.v1.schemas.movie import (
+    MovieBatchOutputDTO,
+    MovieBulkErrorDTO,
     MovieCreateDTO,
     MovieFilterDTO,
     MovieInputDTO,
     MovieOutputDTO,
+    MovieSearchDTO,
+    MovieStatsDTO,
     MovieUpdateDTO,
+    ResponseBulkCreateMovie,
     ResponseDeleteMovie,
+    ResponseImportMovie,
     ResponseUpdateMovie,
 )
 from app.api.v1.schemas.user import (
@@ -1,6 +1,9 @@
 from datetime import (
     datetime,
 )
+from typing import (
+    Self,
+)
 from uuid import (
     UUID,
 )
@@ -8,6 +11,9 @@ from uuid import (
 from pydantic import (
     BaseModel as BaseSchema,
 )
+from pydantic import (
+    model_validator,
+)
 from pydantic.config import (
     ConfigDict,
 )
@@ -66,6 +72,25 @@ class MovieOutputDTO(BaseMovieDTO):
     model_config = ConfigDict(from_attributes=True)
 
 
+class MovieBatchOutputDTO(BaseSchema):
+    """Scheme of returning movies fetched by ids."""
+
+    movies: list[MovieOutputDTO]
+    missing: list[int | UUID]
+
+
+class MovieStatsDTO(BaseSchema):
+    """Scheme of returning a user's movie statistics."""
+
+    count: int
+    average_rate: float | None
+    rate_histogram: list[int]  # movies per whole rate, 5.0 falls into the last
+    newest_created_at: datetime | None
+    oldest_created_at: datetime | None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class MovieFilterDTO(BaseSchema):
     """Scheme of filtering a movie."""
 
@@ -75,9 +100,73 @@ class MovieFilterDTO(BaseSchema):
     rate_from: float = Field(default=0, validation_alias="rate-from")
     rate_to: float = Field(default=5, validation_alias="rate-to")
     title_contains: str | None = Field(default=None, validation_alias="title-contains")
+    cursor: str | None = Field(default=None, max_length=512)
 
     model_config = ConfigDict(populate_by_name=True)
 
+    @model_validator(mode="after")
+    def check_offset_without_cursor(self) -> Self:
+        """
+        Reject an offset on a cursor page.
+
+        The cursor already points past the previous page, an offset \
+            on top of it would silently skip rows.
+
+        Returns
+        -------
+        Self
+            validated filter
+
+        Raises
+        ------
+        ValueError
+            both an offset and a cursor are given
+        """
+        if self.cursor is not None and self.offset:
+            msg = "'offset' cannot be combined with 'cursor'."
+            raise ValueError(msg)
+        return self
+
+
+class MovieSearchDTO(BaseSchema):
+    """Scheme of full-text searching a movie."""
+
+    query: str = Field(min_length=1, max_length=100, validation_alias="q")
+    limit: int = Field(default=10, le=100, ge=1)
+    offset: int = Field(default=0, ge=0)
+    sort_by: str = Field(default="id", validation_alias="sort-by")
+    rate_from: float = Field(default=0, validation_alias="rate-from")
+    rate_to: float = Field(default=5, validation_alias="rate-to")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class MovieBulkErrorDTO(BaseSchema):
+    """Scheme of a movie rejected from a bulk creation."""
+
+    index: int
+    title: str
+    detail: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ResponseBulkCreateMovie(BaseResponse):
+    """Response scheme for creating movies in bulk."""
+
+    message: str = "Movies have been created."
+    created: list[MovieOutputDTO]
+    errors: list[MovieBulkErrorDTO]
+
+
+class ResponseImportMovie(BaseResponse):
+    """Response scheme for importing movies."""
+
+    message: str = "Movies have been imported."
+    inserted: int
+    skipped: int
+    invalid: int
+
 
 class ResponseUpdateMovie(BaseResponse):
     """Response scheme for updating a movie."""
@@ -20,15 +20,25 @@ from app.core import (
 from app.core.config import (
     DEBUG,
 )
+from app.core.constants import (
+    ETAG_HEADER,
+    NEXT_CURSOR_HEADER,
+)
+from app.core.exceptions import (
+    DatabaseTimeoutError,
+    QueryBudgetExceededError,
+)
 from app.core.exceptions.exc_handlers import (
     DatabaseExceptionHandler,
     GlobalExceptionHandler,
     HTTPExceptionHandler,
+    QueryBudgetExceptionHandler,
     ValidationExceptionHandler,
 )
 from app.core.middlewares import (
     AuthMiddleware,
     CORSMiddleware,
+    DisconnectMiddleware,
     ExceptionMiddleware,
     LoggingMiddleware,
 )
@@ -73,6 +83,14 @@ app.add_exception_handler(
     exc_class_or_status_code=SQLAlchemyError,
     handler=DatabaseExceptionHandler(),
 )
+app.add_exception_handler(
+    exc_class_or_status_code=DatabaseTimeoutError,
+    handler=DatabaseExceptionHandler(),
+)
+app.add_exception_handler(
+    exc_class_or_status_code=QueryBudgetExceededError,
+    handler=QueryBudgetExceptionHandler(),
+)
 app.add_exception_handler(
     exc_class_or_status_code=HTTPException,
     handler=HTTPExceptionHandler(),
@@ -112,8 +130,12 @@ app.add_middleware(
     allow_methods=["GET", "POST", "PUT", "DELETE"],
     allow_headers=["*"],
     allow_credentials=True,
+    expose_headers=[ETAG_HEADER, NEXT_CURSOR_HEADER],
 )
 app.add_middleware(
     middleware_class=ExceptionMiddleware,
     handlers=app.exception_handlers,
 )
+app.add_middleware(
+    middleware_class=DisconnectMiddleware,
+)
@@ -0,0 +1,31 @@
+__all__ = (
+    "BaseCache",
+    "CacheInvalidationBus",
+    "LocalCache",
+    "RedisCache",
+    "RedisGenerationCache",
+    "SingleFlight",
+    "cache_bus",
+    "cache_redis",
+)
+
+from app.cache.base import (
+    BaseCache,
+)
+from app.cache.generation import (
+    RedisGenerationCache,
+)
+from app.cache.local import (
+    LocalCache,
+)
+from app.cache.pubsub import (
+    CacheInvalidationBus,
+    cache_bus,
+)
+from app.cache.redis_ import (
+    RedisCache,
+    cache_redis,
+)
+from app.cache.single_flight import (
+    SingleFlight,
+)
@@ -0,0 +1,103 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections.abc import (
+    Iterable,
+)
+
+
+class BaseCache[KeyType, ValueType](ABC):
+    """Basic abstract cache class."""
+
+    @abstractmethod
+    async def get(
+        self,
+        key: KeyType,
+    ) -> ValueType | None:
+        """
+        Get a cached value.
+
+        Parameters
+        ----------
+        key : KeyType
+            cache key
+
+        Returns
+        -------
+        ValueType | None
+            cached value, 'None' on a miss
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def peek(
+        self,
+        key: KeyType,
+    ) -> ValueType | None:
+        """
+        Get a cached value without recording the read.
+
+        Meant for polling, so it neither counts hits and misses \
+            nor prepares a fill.
+
+        Parameters
+        ----------
+        key : KeyType
+            cache key
+
+        Returns
+        -------
+        ValueType | None
+            cached value, 'None' on a miss or an error
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(
+        self,
+        key: KeyType,
+        value: ValueType,
+    ) -> None:
+        """
+        Cache a value read from the source.
+
+        Parameters
+        ----------
+        key : KeyType
+            cache key
+
+        value : ValueType
+            value to cache
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate(
+        self,
+        key: KeyType,
+    ) -> None:
+        """
+        Invalidate a cached value after its source has changed.
+
+        Parameters
+        ----------
+        key : KeyType
+            cache key
+        """
+        raise NotImplementedError
+
+    async def invalidate_many(
+        self,
+        keys: Iterable[KeyType],
+    ) -> None:
+        """
+        Invalidate cached values after their sources have changed.
+
+        Parameters
+        ----------
+        keys : Iterable[KeyType]
+            cache keys
+        """
+        for key in keys:
+            await self.invalidate(key)
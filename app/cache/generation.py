@@ -0,0 +1,292 @@
+import hashlib
+import time
+from collections.abc import (
+    Sequence,
+)
+from typing import (
+    final,
+)
+
+import orjson
+import redis.asyncio as redis
+from loguru import (
+    logger,
+)
+from pydantic import (
+    TypeAdapter,
+    ValidationError,
+)
+
+from app.cache.redis_ import (
+    RedisCache,
+    cache_redis,
+)
+from app.core import (
+    metrics,
+    settings,
+)
+from app.core.serialization import (
+    dump_json,
+)
+from app.domains import (
+    BaseDataclass,
+)
+
+
+@final
+class RedisGenerationCache[ValueType: BaseDataclass]:
+    """
+    Redis cache of query results versioned by a per-scope generation.
+
+    Results are keyed by the scope, its current generation and a digest \
+        of the canonical query parameters. Invalidating a scope only \
+        increments its generation, whatever number of results is cached, \
+        and the orphaned results expire on their own.
+
+    Results must be read from the primary: pinning is per worker, \
+        and a lagging replica would let another worker cache rows older \
+        than the generation they are filed under for the full ttl.
+
+    A generation starts from the current time in nanoseconds rather than \
+        zero, so a scope whose generation key expired never reuses \
+        a generation, nor an entity tag derived from it. Reads and fills \
+        do not extend the generation key, so a lost invalidation heals \
+        once it expires.
+    """
+
+    __slots__ = (
+        "_adapter",
+        "_client",
+        "_errors",
+        "_generation_ttl",
+        "_hits",
+        "_misses",
+        "_namespace",
+        "_prefix",
+        "_ttl",
+    )
+
+    def __init__(
+        self,
+        namespace: str,
+        value_class: type[ValueType],
+        client: redis.Redis = cache_redis,
+        ttl: int = settings.redis.cache_ttl,
+    ) -> None:
+        """
+        Initialize the redis generation cache.
+
+        Parameters
+        ----------
+        namespace : str
+            key prefix and metrics name of the cache
+
+        value_class : type[ValueType]
+            dataclass of the cached result items
+
+        client : redis.Redis, optional
+            redis client, by default the cache database client
+
+        ttl : int, optional
+            seconds a result is cached, by default from the redis config
+        """
+        self._client = client
+        self._ttl = ttl
+        self._generation_ttl = 2 * ttl
+        self._adapter = TypeAdapter(list[value_class])
+        self._namespace = namespace
+        self._prefix = f"{namespace}:{RedisCache.get_version(value_class)}"
+        self._hits = metrics.counter(
+            name=f"cache.{namespace}.hits",
+            description=f"{namespace} results served from redis",
+        )
+        self._misses = metrics.counter(
+            name=f"cache.{namespace}.misses",
+            description=f"{namespace} results not found in redis",
+        )
+        self._errors = metrics.counter(
+            name=f"cache.{namespace}.errors",
+            description=f"failed {namespace} cache calls",
+        )
+
+    async def get_generation(
+        self,
+        scope: object,
+    ) -> int | None:
+        """
+        Get the current generation of a scope.
+
+        Parameters
+        ----------
+        scope : object
+            owner of the cached results, e.g. a user id
+
+        Returns
+        -------
+        int | None
+            generation, 'None' if redis is unavailable
+        """
+        generation_key = self._get_generation_key(scope)
+
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.set(generation_key, time.time_ns(), ex=self._generation_ttl, nx=True)
+                pipe.get(generation_key)
+                _, generation = await pipe.execute()
+        except redis.RedisError as e:
+            self._errors.inc()
+            logger.warning(f"Cache generation read of {scope} failed: {e!s}")
+            return None
+
+        return int(generation)
+
+    async def get_tag(
+        self,
+        scope: object,
+        params: BaseDataclass,
+    ) -> str | None:
+        """
+        Get a tag of a query result without running the query.
+
+        The tag changes whenever the scope is invalidated, the query \
+            parameters differ or the shape of the items changes.
+
+        Parameters
+        ----------
+        scope : object
+            owner of the cached results
+
+        params : BaseDataclass
+            query parameters
+
+        Returns
+        -------
+        str | None
+            tag of the current result, 'None' if redis is unavailable
+        """
+        if (generation := await self.get_generation(scope)) is None:
+            return None
+
+        return self._get_key(scope, generation, params)
+
+    async def get(
+        self,
+        scope: object,
+        generation: int,
+        params: BaseDataclass,
+    ) -> Sequence[ValueType] | None:
+        """
+        Get a cached result.
+
+        Parameters
+        ----------
+        scope : object
+            owner of the cached results
+
+        generation : int
+            generation of the scope read before the query
+
+        params : BaseDataclass
+            query parameters
+
+        Returns
+        -------
+        Sequence[ValueType] | None
+            cached result, 'None' on a miss
+        """
+        try:
+            data = await self._client.get(self._get_key(scope, generation, params))
+        except redis.RedisError as e:
+            self._errors.inc()
+            logger.warning(f"Cache read of {self._namespace} for {scope} failed: {e!s}")
+            return None
+
+        if data is None:
+            self._misses.inc()
+            return None
+
+        try:
+            values = self._adapter.validate_json(data)
+        except ValidationError:
+            self._errors.inc()
+            return None
+
+        self._hits.inc()
+        return values
+
+    async def set(
+        self,
+        scope: object,
+        generation: int,
+        params: BaseDataclass,
+        values: Sequence[ValueType],
+    ) -> None:
+        """
+        Cache a query result.
+
+        Parameters
+        ----------
+        scope : object
+            owner of the cached results
+
+        generation : int
+            generation of the scope read before the query, a result of \
+                a changed scope is cached under an outdated generation
+
+        params : BaseDataclass
+            query parameters
+
+        values : Sequence[ValueType]
+            query result
+        """
+        try:
+            await self._client.set(
+                self._get_key(scope, generation, params),
+                dump_json(values),
+                ex=self._ttl,
+            )
+        except redis.RedisError as e:
+            self._errors.inc()
+            logger.warning(f"Cache fill of {self._namespace} for {scope} failed: {e!s}")
+
+    async def invalidate(
+        self,
+        scope: object,
+    ) -> None:
+        """
+        Invalidate every cached result of a scope.
+
+        Parameters
+        ----------
+        scope : object
+            owner of the cached results
+        """
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                generation_key = self._get_generation_key(scope)
+                pipe.set(generation_key, time.time_ns(), nx=True)
+                pipe.incr(generation_key)
+                pipe.expire(generation_key, self._generation_ttl)
+                await pipe.execute()
+        except redis.RedisError as e:
+            # the stale results live until their ttl expires
+            self._errors.inc()
+            logger.warning(
+                f"Cache invalidation of {self._namespace} for {scope} failed: {e!s}"
+            )
+
+    def _get_generation_key(
+        self,
+        scope: object,
+    ) -> str:
+        return f"{self._namespace}:generation:{scope}"
+
+    def _get_key(
+        self,
+        scope: object,
+        generation: int,
+        params: BaseDataclass,
+    ) -> str:
+        canonical_params = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+        digest = hashlib.sha256(canonical_params).hexdigest()[:16]
+        return f"{self._prefix}:{scope}:{generation}:{digest}"
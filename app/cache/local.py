@@ -0,0 +1,182 @@
+import time
+from collections import (
+    OrderedDict,
+)
+from typing import (
+    final,
+    override,
+)
+
+from app.cache.base import (
+    BaseCache,
+)
+from app.cache.pubsub import (
+    CacheInvalidationBus,
+    cache_bus,
+)
+from app.core import (
+    metrics,
+    settings,
+)
+
+
+@final
+class LocalCache[KeyType, ValueType](BaseCache[KeyType, ValueType]):
+    """
+    Per-worker LRU cache with a TTL.
+
+    Invalidations evict the key in this worker and are published on \
+        the invalidation bus for the others. A fill is dropped if any \
+        invalidation happened since its miss, so a read racing a change \
+        cannot cache the old value.
+    """
+
+    __slots__ = (
+        "_bus",
+        "_entries",
+        "_evictions",
+        "_generation",
+        "_hits",
+        "_max_size",
+        "_misses",
+        "_namespace",
+        "_pending",
+        "_size",
+        "_ttl",
+    )
+
+    def __init__(
+        self,
+        namespace: str,
+        max_size: int = settings.redis.local_cache_size,
+        ttl: int = settings.redis.local_cache_ttl,
+        bus: CacheInvalidationBus = cache_bus,
+    ) -> None:
+        """
+        Initialize the local cache.
+
+        Parameters
+        ----------
+        namespace : str
+            unique bus namespace and metrics name of the cache
+
+        max_size : int, optional
+            entries kept before the least recently used is evicted, \
+                by default from the redis config
+
+        ttl : int, optional
+            seconds an entry is served, by default from the redis config
+
+        bus : CacheInvalidationBus, optional
+            cross-worker invalidation bus, by default the redis pub/sub one
+        """
+        self._namespace = namespace
+        self._max_size = max_size
+        self._ttl = ttl
+        self._bus = bus
+        self._entries: OrderedDict[str, tuple[float, ValueType]] = OrderedDict()
+        self._pending: dict[str, int] = {}
+        self._generation = 0
+        self._hits = metrics.counter(
+            name=f"cache.{namespace}.hits",
+            description=f"{namespace} reads served from the worker memory",
+        )
+        self._misses = metrics.counter(
+            name=f"cache.{namespace}.misses",
+            description=f"{namespace} reads not found in the worker memory",
+        )
+        self._evictions = metrics.counter(
+            name=f"cache.{namespace}.evictions",
+            description=f"{namespace} entries evicted as least recently used",
+        )
+        self._size = metrics.gauge(
+            name=f"cache.{namespace}.size",
+            description=f"{namespace} entries held in the worker memory",
+        )
+        bus.register(namespace, self)
+
+    @override
+    async def get(
+        self,
+        key: KeyType,
+    ) -> ValueType | None:
+        str_key = str(key)
+
+        if (entry := self._entries.get(str_key)) is not None:
+            expires_at, value = entry
+
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(str_key)
+                self._hits.inc()
+                return value
+
+            del self._entries[str_key]
+            self._size.set(len(self._entries))
+
+        self._misses.inc()
+        if len(self._pending) >= self._max_size:
+            # fills that never came, e.g. reads of missing rows
+            self._pending.clear()
+        self._pending[str_key] = self._generation
+        return None
+
+    @override
+    async def peek(
+        self,
+        key: KeyType,
+    ) -> ValueType | None:
+        if (entry := self._entries.get(str(key))) is None:
+            return None
+
+        expires_at, value = entry
+        return value if expires_at > time.monotonic() else None
+
+    @override
+    async def set(
+        self,
+        key: KeyType,
+        value: ValueType,
+    ) -> None:
+        str_key = str(key)
+
+        if self._pending.pop(str_key, None) != self._generation:
+            return
+
+        self._entries[str_key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(str_key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions.inc()
+
+        self._size.set(len(self._entries))
+
+    @override
+    async def invalidate(
+        self,
+        key: KeyType,
+    ) -> None:
+        self.evict(str(key))
+        await self._bus.publish(self._namespace, str(key))
+
+    def evict(
+        self,
+        key: str,
+    ) -> None:
+        """
+        Drop a key from this worker only.
+
+        Parameters
+        ----------
+        key : str
+            stringified cache key
+        """
+        self._generation += 1
+        self._entries.pop(key, None)
+        self._size.set(len(self._entries))
+
+    def clear(self) -> None:
+        """Drop every key from this worker only."""
+        self._generation += 1
+        self._entries.clear()
+        self._size.set(0)
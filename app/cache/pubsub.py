@@ -0,0 +1,156 @@
+import asyncio
+import contextlib
+from typing import (
+    Final,
+    Protocol,
+    final,
+)
+
+import redis.asyncio as redis
+from loguru import (
+    logger,
+)
+
+from app.cache.redis_ import (
+    cache_redis,
+)
+from app.core import (
+    settings,
+)
+
+RECONNECT_DELAY: Final[float] = 1.0  # seconds
+
+
+class LocalInvalidation(Protocol):
+    """Cache held in the worker process memory."""
+
+    def evict(self, key: str) -> None:
+        """
+        Drop a key from this worker only.
+
+        Parameters
+        ----------
+        key : str
+            stringified cache key
+        """
+
+    def clear(self) -> None:
+        """Drop every key from this worker only."""
+
+
+@final
+class CacheInvalidationBus:
+    """
+    Redis pub/sub channel spreading invalidations across workers.
+
+    Every worker subscribes once and evicts the published keys from \
+        its registered local caches. Messages sent while a worker is \
+        disconnected are lost, so its local caches are cleared on every \
+        (re)subscription.
+    """
+
+    __slots__ = ("_caches", "_channel", "_client", "_task")
+
+    def __init__(
+        self,
+        client: redis.Redis = cache_redis,
+        channel: str = settings.redis.cache_channel,
+    ) -> None:
+        """
+        Initialize the cache invalidation bus.
+
+        Parameters
+        ----------
+        client : redis.Redis, optional
+            redis client, by default the cache database client
+
+        channel : str, optional
+            pub/sub channel, by default from the redis config
+        """
+        self._client = client
+        self._channel = channel
+        self._caches: dict[str, LocalInvalidation] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    def register(
+        self,
+        namespace: str,
+        cache: LocalInvalidation,
+    ) -> None:
+        """
+        Register a local cache to evict published keys from.
+
+        Parameters
+        ----------
+        namespace : str
+            unique cache namespace
+
+        cache : LocalInvalidation
+            local cache
+        """
+        self._caches[namespace] = cache
+
+    async def publish(
+        self,
+        namespace: str,
+        key: str,
+    ) -> None:
+        """
+        Tell every worker to evict a key.
+
+        Parameters
+        ----------
+        namespace : str
+            cache namespace
+
+        key : str
+            stringified cache key
+        """
+        try:
+            await self._client.publish(self._channel, f"{namespace}:{key}")
+        except redis.RedisError as e:
+            # other workers keep the stale value until its ttl expires
+            logger.warning(f"Cache invalidation of {namespace}:{key} was not published: {e!s}")
+
+    async def start(self) -> None:
+        """Start listening to the channel in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop listening to the channel."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self._client.pubsub() as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    self._clear()
+
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._evict(message["data"].decode())
+            except redis.RedisError as e:
+                logger.warning(f"Cache invalidation channel is unavailable: {e!s}")
+                self._clear()
+                await asyncio.sleep(RECONNECT_DELAY)
+
+    def _evict(self, message: str) -> None:
+        namespace, _, key = message.partition(":")
+
+        if (cache := self._caches.get(namespace)) is not None:
+            cache.evict(key)
+
+    def _clear(self) -> None:
+        for cache in self._caches.values():
+            cache.clear()
+
+
+cache_bus: Final = CacheInvalidationBus()
@@ -0,0 +1,242 @@
+import hashlib
+import time
+from collections.abc import (
+    Iterable,
+)
+from dataclasses import (
+    fields,
+)
+from typing import (
+    Final,
+    final,
+    override,
+)
+
+import orjson
+import redis.asyncio as redis
+from loguru import (
+    logger,
+)
+from pydantic import (
+    TypeAdapter,
+    ValidationError,
+)
+
+from app.cache.base import (
+    BaseCache,
+)
+from app.core import (
+    metrics,
+    settings,
+)
+from app.core.serialization import (
+    dump_json,
+)
+from app.domains import (
+    BaseDataclass,
+)
+
+# written on invalidation, a fill started before the write cannot replace it
+TOMBSTONE: Final[bytes] = b""
+
+cache_redis: Final = redis.Redis(
+    host=settings.redis.host,
+    port=settings.redis.port,
+    db=settings.redis.db_cache,
+)
+
+
+@final
+class RedisCache[KeyType, ValueType: BaseDataclass](BaseCache[KeyType, ValueType]):
+    """
+    Redis read-through cache of dataclasses.
+
+    Keys embed a fingerprint of the dataclass fields, so values cached \
+        in another shape are never read back. An invalidation leaves \
+        a short-lived tombstone instead of deleting the key: fills only \
+        set missing keys, so a read that started before the change \
+        cannot cache the old value again. Redis errors are logged and \
+        treated as misses.
+    """
+
+    __slots__ = (
+        "_adapter",
+        "_client",
+        "_errors",
+        "_hits",
+        "_invalidation_ttl",
+        "_latency",
+        "_misses",
+        "_prefix",
+        "_ttl",
+    )
+
+    def __init__(
+        self,
+        namespace: str,
+        value_class: type[ValueType],
+        client: redis.Redis = cache_redis,
+        ttl: int = settings.redis.cache_ttl,
+        invalidation_ttl: int = settings.redis.cache_invalidation_ttl,
+    ) -> None:
+        """
+        Initialize the redis cache.
+
+        Parameters
+        ----------
+        namespace : str
+            key prefix and metrics name of the cache
+
+        value_class : type[ValueType]
+            dataclass of the cached values
+
+        client : redis.Redis, optional
+            redis client, by default the cache database client
+
+        ttl : int, optional
+            seconds a value is cached, by default from the redis config
+
+        invalidation_ttl : int, optional
+            seconds an invalidated key is not refilled, should exceed \
+                the longest read, by default from the redis config
+        """
+        self._client = client
+        self._ttl = ttl
+        self._invalidation_ttl = invalidation_ttl
+        self._adapter = TypeAdapter(value_class)
+        self._prefix = f"{namespace}:{self.get_version(value_class)}"
+        self._hits = metrics.counter(
+            name=f"cache.{namespace}.hits",
+            description=f"{namespace} reads served from redis",
+        )
+        self._misses = metrics.counter(
+            name=f"cache.{namespace}.misses",
+            description=f"{namespace} reads not found in redis",
+        )
+        self._errors = metrics.counter(
+            name=f"cache.{namespace}.errors",
+            description=f"failed {namespace} cache calls",
+        )
+        self._latency = metrics.counter(
+            name=f"cache.{namespace}.get_us",
+            description=f"total microseconds spent in {namespace} cache reads",
+        )
+
+    @override
+    async def get(
+        self,
+        key: KeyType,
+    ) -> ValueType | None:
+        start = time.perf_counter()
+
+        try:
+            data = await self._client.get(self._get_key(key))
+        except redis.RedisError as e:
+            self._errors.inc()
+            logger.warning(f"Cache read of {self._get_key(key)} failed: {e!s}")
+            return None
+        finally:
+            self._latency.inc(int((time.perf_counter() - start) * 1_000_000))
+
+        if not data:
+            self._misses.inc()
+            return None
+
+        try:
+            value = self._adapter.validate_json(data)
+        except ValidationError:
+            self._errors.inc()
+            return None
+
+        self._hits.inc()
+        return value
+
+    @override
+    async def peek(
+        self,
+        key: KeyType,
+    ) -> ValueType | None:
+        try:
+            data = await self._client.get(self._get_key(key))
+        except redis.RedisError:
+            return None
+
+        if not data:
+            return None
+
+        try:
+            return self._adapter.validate_json(data)
+        except ValidationError:
+            return None
+
+    @override
+    async def set(
+        self,
+        key: KeyType,
+        value: ValueType,
+    ) -> None:
+        try:
+            await self._client.set(
+                self._get_key(key),
+                dump_json(value),
+                ex=self._ttl,
+                nx=True,
+            )
+        except redis.RedisError as e:
+            self._errors.inc()
+            logger.warning(f"Cache fill of {self._get_key(key)} failed: {e!s}")
+
+    @override
+    async def invalidate(
+        self,
+        key: KeyType,
+    ) -> None:
+        try:
+            await self._client.set(
+                self._get_key(key),
+                TOMBSTONE,
+                ex=self._invalidation_ttl,
+            )
+        except redis.RedisError as e:
+            # the stale value lives until its ttl expires
+            self._errors.inc()
+            logger.warning(f"Cache invalidation of {self._get_key(key)} failed: {e!s}")
+
+    @override
+    async def invalidate_many(
+        self,
+        keys: Iterable[KeyType],
+    ) -> None:
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.set(self._get_key(key), TOMBSTONE, ex=self._invalidation_ttl)
+                await pipe.execute()
+        except redis.RedisError as e:
+            # the stale values live until their ttl expires
+            self._errors.inc()
+            logger.warning(f"Cache invalidation of {self._prefix} keys failed: {e!s}")
+
+    def _get_key(
+        self,
+        key: KeyType,
+    ) -> str:
+        return f"{self._prefix}:{key}"
+
+    @staticmethod
+    def get_version(value_class: type[BaseDataclass]) -> str:
+        """
+        Get the key version of a dataclass shape.
+
+        Parameters
+        ----------
+        value_class : type[BaseDataclass]
+            dataclass of the cached values
+
+        Returns
+        -------
+        str
+            fingerprint of the field names and types
+        """
+        shape = orjson.dumps([(field.name, str(field.type)) for field in fields(value_class)])
+        return f"v{hashlib.sha256(shape).hexdigest()[:8]}"
@@ -0,0 +1,217 @@
+import asyncio
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from typing import (
+    Final,
+    final,
+)
+
+import redis.asyncio as redis
+from loguru import (
+    logger,
+)
+from redis.asyncio.lock import (
+    Lock,
+)
+
+from app.core import (
+    metrics,
+    settings,
+)
+
+LOCK_POLL_INTERVAL: Final[float] = 0.02  # seconds
+
+
+@final
+class SingleFlight[KeyType, ValueType]:
+    """
+    Coalescing of identical concurrent loads.
+
+    The first call of a key starts the load in a task sharing its \
+        context, later calls of the key await the same task until it \
+        finishes. A caller cancelled while waiting does not cancel \
+        the load of the others.
+
+    With a redis client, the first call of a key in any worker also \
+        takes a short lock; the other workers poll their cache instead \
+        of loading until the lock is released or expires, then load \
+        on their own if the value is still missing.
+    """
+
+    __slots__ = (
+        "_client",
+        "_coalesced",
+        "_flights",
+        "_lock_hits",
+        "_lock_ttl",
+        "_lock_waits",
+        "_prefix",
+    )
+
+    def __init__(
+        self,
+        namespace: str,
+        client: redis.Redis | None = None,
+        lock_ttl: float = settings.redis.single_flight_lock_ttl,
+    ) -> None:
+        """
+        Initialize the single flight.
+
+        Parameters
+        ----------
+        namespace : str
+            lock key prefix and metrics name of the flights
+
+        client : redis.Redis | None, optional
+            redis client of the cross-worker locks, \
+                by default None for per-worker coalescing only
+
+        lock_ttl : float, optional
+            seconds a lock is held at most, should exceed the longest \
+                load, by default from the redis config
+        """
+        self._client = client
+        self._lock_ttl = lock_ttl
+        self._prefix = f"{namespace}:flight"
+        self._flights: dict[str, asyncio.Task[ValueType]] = {}
+        self._coalesced = metrics.counter(
+            name=f"single_flight.{namespace}.coalesced",
+            description=f"{namespace} calls served by a load in flight in the worker",
+        )
+        self._lock_waits = metrics.counter(
+            name=f"single_flight.{namespace}.lock_waits",
+            description=f"{namespace} calls that waited for a load of another worker",
+        )
+        self._lock_hits = metrics.counter(
+            name=f"single_flight.{namespace}.lock_hits",
+            description=f"{namespace} calls served by a load of another worker",
+        )
+
+    async def do(
+        self,
+        key: KeyType,
+        load: Callable[[], Awaitable[ValueType]],
+        recheck: Callable[[], Awaitable[ValueType | None]] | None = None,
+    ) -> ValueType:
+        """
+        Load a value once for every concurrent call of a key.
+
+        Parameters
+        ----------
+        key : KeyType
+            identity of the load, calls with equal keys must be \
+                interchangeable
+
+        load : Callable[[], Awaitable[ValueType]]
+            load of the value, e.g. a database read filling the cache
+
+        recheck : Callable[[], Awaitable[ValueType | None]] | None, optional
+            uncounted cache read polled while another worker loads the key, \
+                by default None for no cross-worker coalescing
+
+        Returns
+        -------
+        ValueType
+            loaded value, errors of the load are raised to every caller
+        """
+        str_key = str(key)
+
+        if (flight := self._flights.get(str_key)) is not None:
+            self._coalesced.inc()
+        else:
+            flight = asyncio.create_task(self._load(str_key, load, recheck))
+            self._flights[str_key] = flight
+            flight.add_done_callback(lambda task: self._land(str_key, task))
+
+        return await asyncio.shield(flight)
+
+    def forget(
+        self,
+        key: KeyType,
+    ) -> None:
+        """
+        Stop sharing the load in flight of a key.
+
+        Called on a change of the value, so later calls do not get \
+            the result of a load that started before the change.
+
+        Parameters
+        ----------
+        key : KeyType
+            identity of the load
+        """
+        self._flights.pop(str(key), None)
+
+    def _land(
+        self,
+        str_key: str,
+        task: asyncio.Task[ValueType],
+    ) -> None:
+        if self._flights.get(str_key) is task:
+            del self._flights[str_key]
+
+        # every caller may have been cancelled before the load failed
+        if not task.cancelled():
+            task.exception()
+
+    async def _load(
+        self,
+        str_key: str,
+        load: Callable[[], Awaitable[ValueType]],
+        recheck: Callable[[], Awaitable[ValueType | None]] | None,
+    ) -> ValueType:
+        if self._client is None or recheck is None:
+            return await load()
+
+        lock = self._client.lock(
+            f"{self._prefix}:{str_key}",
+            timeout=self._lock_ttl,
+            blocking=False,
+        )
+
+        try:
+            acquired = await lock.acquire()
+        except redis.RedisError as e:
+            logger.warning(f"Single flight lock of {str_key} failed: {e!s}")
+            return await load()
+
+        if not acquired:
+            if (value := await self._wait(lock, recheck)) is not None:
+                self._lock_hits.inc()
+                return value
+            return await load()
+
+        try:
+            return await load()
+        finally:
+            try:
+                await lock.release()
+            except redis.RedisError as e:
+                # expired before the load finished, another worker may have loaded too
+                logger.warning(f"Single flight lock of {str_key} was not released: {e!s}")
+
+    async def _wait(
+        self,
+        lock: Lock,
+        recheck: Callable[[], Awaitable[ValueType | None]],
+    ) -> ValueType | None:
+        self._lock_waits.inc()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._lock_ttl
+
+        while loop.time() < deadline:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+
+            if (value := await recheck()) is not None:
+                return value
+
+            try:
+                if not await lock.locked():
+                    break
+            except redis.RedisError:
+                break
+
+        # the other worker failed, or loaded a value it could not cache
+        return await recheck()
@@ -1,5 +1,10 @@
 __all__ = (
+    "dep_db_timeout_getter",
+    "dep_query_budget_getter",
+    "dep_query_guard_getter",
     "dep_rate_limiter_getter",
+    "dep_request_route_getter",
+    "metrics",
     "settings",
 )
 
@@ -9,3 +14,16 @@ from app.core.config import (
 from app.core.limiter import (
     dep_rate_limiter_getter,
 )
+from app.core.metrics import (
+    metrics,
+)
+from app.core.query_budget import (
+    dep_query_budget_getter,
+    dep_query_guard_getter,
+)
+from app.core.request_context import (
+    dep_request_route_getter,
+)
+from app.core.timeout import (
+    dep_db_timeout_getter,
+)
@@ -9,3 +9,4 @@ class AppConfig(BaseSchema):
     title: str = "Movie Manager"
     host: str = "127.0.0.1"
     port: int = 8000
+    import_max_bytes: int = 100 * 1024 * 1024  # largest accepted movie import upload
@@ -1,6 +1,9 @@
 from functools import (
     cached_property,
 )
+from typing import (
+    Literal,
+)
 
 from pydantic import (
     BaseModel as BaseSchema,
@@ -20,6 +23,20 @@ class SqlAlchemyConfig(BaseSchema):
     echo_pool: bool = False
     pool_size: int = 50
     max_overflow: int = 10
+    query_cache_size: int = 500  # compiled statements per engine
+    prepared_statement_cache_size: int = 100  # asyncpg statements per connection
+    pool_timeout: float = 5.0  # seconds waiting for a free connection
+    statement_timeout: int = 30_000  # milliseconds, server-side cap for any statement
+    request_timeout: float = 5.0  # seconds, default deadline of a unit-of-work
+    import_timeout: float = 120.0  # seconds, deadline of a bulk import
+    slow_query_threshold: float = 0.5  # seconds, 0 disables the slow query log
+    slow_query_explain: bool = False  # capture EXPLAIN (ANALYZE, BUFFERS) of slow selects
+    query_budget_mode: Literal["off", "warn", "fail"] = "off"  # per-request statement counter
+    query_budget: int | None = None  # statements per request for routes without a budget
+
+    replica_max_lag: float = 1.0  # seconds
+    replica_lag_check_interval: float = 1.0  # seconds
+    replica_pin_seconds: float = 5.0  # read-your-writes window
 
 
 class DatabaseConfig(BaseSchema):
@@ -30,6 +47,7 @@ class DatabaseConfig(BaseSchema):
     port: int = 5432
     database: str = "movie_manager"
     password: SecretStr
+    replica_hosts: list[str] = []  # "host" or "host:port"
 
     sqla: SqlAlchemyConfig = SqlAlchemyConfig()
 
@@ -52,3 +70,19 @@ class DatabaseConfig(BaseSchema):
             port=self.port,
             database=self.database,
         )
+
+    @cached_property
+    def replica_async_urls(self) -> list[URL]:
+        """Read replica url connections."""
+        urls: list[URL] = []
+
+        for replica_host in self.replica_hosts:
+            host, _, port = replica_host.partition(":")
+            urls.append(
+                self.async_url.set(
+                    host=host,
+                    port=int(port) if port else self.port,
+                ),
+            )
+
+        return urls
@@ -65,8 +65,10 @@ class LoggingConfig(BaseSchema):
     common_file: LoggerConfig
     error_file: LoggerConfig
     json_file: LoggerConfig
+    slow_query_file: LoggerConfig
 
     stream_log_handler: int | None = None
     common_log_handler: int | None = None
     error_log_handler: int | None = None
     json_log_handler: int | None = None
+    slow_query_log_handler: int | None = None
@@ -9,4 +9,11 @@ class RedisConfig(BaseSchema):
     host: str = "localhost"
     port: int = 6379
     db_refresh_token: int = 1
+    db_cache: int = 2
+    cache_ttl: int = 300  # seconds
+    cache_invalidation_ttl: int = 10  # seconds, longer than the longest read
+    cache_channel: str = "cache:invalidate"
+    local_cache_size: int = 10_000
+    local_cache_ttl: int = 60  # seconds, bounds staleness while pub/sub is down
+    single_flight_lock_ttl: float = 2.0  # seconds, longer than the longest load
     encoding: str = "utf-8"
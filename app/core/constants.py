@@ -75,6 +75,12 @@ MOVIE_DESCRIPTION_FIELD: Final = Field(
     pattern=MOVIE_DESCRIPTION_PATTERN,
 )
 MOVIE_RATE_FIELD: Final = Field(ge=0, le=5)
+MOVIE_BULK_MAX_ITEMS: Final[int] = 1000  # 4 columns per row, well below asyncpg's 32767 args
+MOVIE_BATCH_MAX_IDS: Final[int] = 200
+MOVIE_IMPORT_BATCH_SIZE: Final[int] = 5000  # rows validated and copied per COPY round trip
+MOVIE_IMPORT_SPOOL_MEMORY: Final[int] = (
+    8 * 1024 * 1024
+)  # upload bytes kept in memory, then disk
 
 # ---------------------------------------------------------------------------
 # User
@@ -84,9 +90,24 @@ USER_USERNAME_FIELD: Final = Field(max_length=20, pattern=USER_USERNAME_PATTERN)
 USER_PASSWORD_FIELD: Final = Field(min_length=5, max_length=30)
 
 
+# ===========================================================================
+# Database
+# ===========================================================================
+MOVIE_SEARCH_CONFIG: Final[str] = "english"
+MOVIE_SKIP_TITLE_CONFLICTS_SETTING: Final[str] = "movies.skip_title_conflicts"
+MOVIE_RATE_HISTOGRAM_BUCKETS: Final[int] = (
+    5  # [0, 1), [1, 2), ..., [4, 5], see the stats triggers
+)
+QUERY_CANCELED_SQLSTATE: Final[str] = (
+    "57014"  # raised by statement_timeout and cancel requests
+)
+
+
 # ===========================================================================
 # HTTP
 # ===========================================================================
+NEXT_CURSOR_HEADER: Final[str] = "X-Next-Cursor"
+ETAG_HEADER: Final[str] = "ETag"
 HTTP_RESPONSE_500: Final[Response] = JSONResponse(
     content={
         "error": "Internal server error.",
@@ -94,3 +115,17 @@ HTTP_RESPONSE_500: Final[Response] = JSONResponse(
     },
     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
 )
+HTTP_RESPONSE_503: Final[Response] = JSONResponse(
+    content={
+        "error": "Service unavailable.",
+        "message": "Database is overloaded, please try again later.",
+    },
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+)
+HTTP_RESPONSE_504: Final[Response] = JSONResponse(
+    content={
+        "error": "Gateway timeout.",
+        "message": "Database query took too long, please try again later.",
+    },
+    status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+)
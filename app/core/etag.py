@@ -0,0 +1,80 @@
+import hashlib
+
+from fastapi import (
+    Response,
+    status,
+)
+
+from app.core.constants import (
+    ETAG_HEADER,
+)
+
+
+def make_etag(data: bytes | str) -> str:
+    """
+    Make a strong entity tag of a representation.
+
+    Parameters
+    ----------
+    data : bytes | str
+        representation, or a value that changes whenever it does
+
+    Returns
+    -------
+    str
+        quoted entity tag
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    return f'"{hashlib.sha256(data).hexdigest()[:32]}"'
+
+
+def etag_matches(
+    if_none_match: str | None,
+    etag: str,
+) -> bool:
+    """
+    Check whether the client already has the current representation.
+
+    'If-None-Match' uses the weak comparison, so a 'W/' prefix is ignored.
+
+    Parameters
+    ----------
+    if_none_match : str | None
+        'If-None-Match' request header
+
+    etag : str
+        entity tag of the current representation
+
+    Returns
+    -------
+    bool
+        the representation is not modified
+    """
+    if if_none_match is None:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """
+    Get a response telling the client to use its cached representation.
+
+    Parameters
+    ----------
+    etag : str
+        entity tag of the current representation
+
+    Returns
+    -------
+    Response
+        bodyless 304 response
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={ETAG_HEADER: etag},
+    )
@@ -1,10 +1,14 @@
 __all__ = (
     "AuthorizationError",
     "DatabaseSessionError",
+    "DatabaseTimeoutError",
     "ExpiredTokenError",
     "ImmutableValueError",
     "IncorrectMethodError",
+    "InvalidCursorError",
     "InvalidTokenError",
+    "PayloadTooLargeError",
+    "QueryBudgetExceededError",
     "QueryValueError",
     "ResourceNotFoundError",
     "ResourceOwnershipError",
@@ -16,10 +20,14 @@ __all__ = (
 from app.core.exceptions.errors import (
     AuthorizationError,
     DatabaseSessionError,
+    DatabaseTimeoutError,
     ExpiredTokenError,
     ImmutableValueError,
     IncorrectMethodError,
+    InvalidCursorError,
     InvalidTokenError,
+    PayloadTooLargeError,
+    QueryBudgetExceededError,
     QueryValueError,
     ResourceNotFoundError,
     ResourceOwnershipError,
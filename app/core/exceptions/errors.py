@@ -151,6 +151,30 @@ class ResourceOwnershipError(HTTPException):
         )
 
 
+class PayloadTooLargeError(HTTPException):
+    """Request body size error."""
+
+    def __init__(
+        self,
+        max_bytes: int,
+    ) -> None:
+        """
+        Initialize the exception.
+
+        status code: 413
+        error message: Request body exceeds {max_bytes} bytes.
+
+        Parameters
+        ----------
+        max_bytes : int
+            largest accepted body in bytes
+        """
+        super().__init__(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Request body exceeds {max_bytes} bytes.",
+        )
+
+
 class IncorrectMethodError(HTTPException):
     """Incorrect method error."""
 
@@ -198,6 +222,35 @@ class QueryValueError(
         )
 
 
+class InvalidCursorError(
+    RequestValidationError,
+    ValueError,
+):
+    """Request pagination cursor error."""
+
+    def __init__(
+        self,
+        query_key: str = "cursor",
+    ) -> None:
+        """
+        Initialize the exception.
+
+        Parameters
+        ----------
+        query_key : str, optional
+            key to the cursor, by default "cursor"
+        """
+        super().__init__(
+            errors=[
+                DictRequestValidationError(
+                    loc=["query", query_key],
+                    msg="Invalid or expired pagination cursor",
+                    type="invalid_cursor",
+                ),
+            ]
+        )
+
+
 class DatabaseSessionError(OSError):
     """Database session error."""
 
@@ -210,6 +263,54 @@ class DatabaseSessionError(OSError):
         super().__init__("Database session has not been initialized.")
 
 
+class DatabaseTimeoutError(TimeoutError):
+    """Database deadline error."""
+
+    def __init__(
+        self,
+        seconds: float,
+    ) -> None:
+        """
+        Initialize the exception.
+
+        error message: Database deadline of {seconds}s has been exceeded.
+
+        Parameters
+        ----------
+        seconds : float
+            exceeded deadline in seconds
+        """
+        super().__init__(f"Database deadline of {seconds}s has been exceeded.")
+
+
+class QueryBudgetExceededError(RuntimeError):
+    """Request query budget error."""
+
+    def __init__(
+        self,
+        route: str,
+        statements: int,
+        budget: int,
+    ) -> None:
+        """
+        Initialize the exception.
+
+        error message: {route} issued {statements} statements, budget is {budget}.
+
+        Parameters
+        ----------
+        route : str
+            request route
+
+        statements : int
+            number of issued statements
+
+        budget : int
+            allowed number of statements
+        """
+        super().__init__(f"{route} issued {statements} statements, budget is {budget}.")
+
+
 class ImmutableValueError(ValueError):
     """Immutable value error."""
 
@@ -2,6 +2,7 @@ __all__ = (
     "DatabaseExceptionHandler",
     "GlobalExceptionHandler",
     "HTTPExceptionHandler",
+    "QueryBudgetExceptionHandler",
     "ValidationExceptionHandler",
 )
 
@@ -15,6 +16,9 @@ from app.core.exceptions.exc_handlers.global_handler import (
 from app.core.exceptions.exc_handlers.http_handler import (
     HTTPExceptionHandler,
 )
+from app.core.exceptions.exc_handlers.query_budget_handler import (
+    QueryBudgetExceptionHandler,
+)
 from app.core.exceptions.exc_handlers.validation_handler import (
     ValidationExceptionHandler,
 )
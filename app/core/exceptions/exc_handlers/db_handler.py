@@ -12,11 +12,21 @@ from loguru import (
     logger,
 )
 from sqlalchemy.exc import (
+    DBAPIError,
     SQLAlchemyError,
 )
+from sqlalchemy.exc import (
+    TimeoutError as PoolTimeoutError,
+)
 
 from app.core.constants import (
     HTTP_RESPONSE_500,
+    HTTP_RESPONSE_503,
+    HTTP_RESPONSE_504,
+    QUERY_CANCELED_SQLSTATE,
+)
+from app.core.exceptions.errors import (
+    DatabaseTimeoutError,
 )
 from app.core.exceptions.exc_handlers.base import (
     BaseExceptionHandler,
@@ -30,6 +40,7 @@ class DatabaseExceptionHandler(BaseExceptionHandler):
 
     Exceptions:
         sqlalchemy.exc.SQLAlchemyError
+        app.core.exceptions.DatabaseTimeoutError
     """
 
     @override
@@ -46,6 +57,28 @@ class DatabaseExceptionHandler(BaseExceptionHandler):
             address=address,
         )
 
+        if isinstance(exc, DatabaseTimeoutError) or self._is_query_canceled(exc):
+            logger_db_exc.bind(
+                type="database_timeout",
+            ).warning(
+                "DatabaseTimeout: {exc_msg};\nRequest: {method} {path}",
+                exc_msg=str(exc),
+                method=method,
+                path=path,
+            )
+            return HTTP_RESPONSE_504
+
+        if isinstance(exc, PoolTimeoutError):
+            logger_db_exc.bind(
+                type="database_pool_timeout",
+            ).warning(
+                "DatabasePoolTimeout: {exc_msg};\nRequest: {method} {path}",
+                exc_msg=str(exc),
+                method=method,
+                path=path,
+            )
+            return HTTP_RESPONSE_503
+
         if isinstance(exc, SQLAlchemyError):
             logger_db_exc.bind(
                 type="sqlalchemy_exception",
@@ -66,3 +99,23 @@ class DatabaseExceptionHandler(BaseExceptionHandler):
             path=path,
         )
         return HTTP_RESPONSE_500
+
+    @staticmethod
+    def _is_query_canceled(exc: Exception) -> bool:
+        """
+        Check if the query was cancelled by the server.
+
+        Parameters
+        ----------
+        exc : Exception
+            raised exception
+
+        Returns
+        -------
+        bool
+            'True' if the statement timeout or a cancel request stopped the query
+        """
+        return (
+            isinstance(exc, DBAPIError)
+            and getattr(exc.orig, "sqlstate", None) == QUERY_CANCELED_SQLSTATE
+        )
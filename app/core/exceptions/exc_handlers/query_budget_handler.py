@@ -0,0 +1,50 @@
+from typing import (
+    final,
+    override,
+)
+
+from fastapi import (
+    Request,
+    Response,
+)
+from loguru import (
+    logger,
+)
+
+from app.core.constants import (
+    HTTP_RESPONSE_500,
+)
+from app.core.exceptions.exc_handlers.base import (
+    BaseExceptionHandler,
+)
+
+
+@final
+class QueryBudgetExceptionHandler(BaseExceptionHandler):
+    """
+    Query budget exception handler.
+
+    Exceptions:
+        app.core.exceptions.QueryBudgetExceededError
+    """
+
+    @override
+    async def __call__(
+        self,
+        request: Request,
+        exc: Exception,
+    ) -> Response:
+        method, path, address = self._get_request_params(request)
+
+        logger.bind(
+            type="query_budget",
+            path=path,
+            method=method,
+            address=address,
+        ).error(
+            "QueryBudgetExceeded: {exc_msg};\nRequest: {method} {path}",
+            exc_msg=str(exc),
+            method=method,
+            path=path,
+        )
+        return HTTP_RESPONSE_500
@@ -17,6 +17,7 @@ from app.core.logging_.loggers import (
     ErrorLogger,
     InterceptLogger,
     JSONLogger,
+    SlowQueryLogger,
     StreamLogger,
 )
 
@@ -72,4 +73,9 @@ def setup_logger(
             logger_config=logging_config.json_file,
         ).register()
 
+    if logging_config.slow_query_file.enabled:
+        logging_config.slow_query_log_handler = SlowQueryLogger(
+            logger_config=logging_config.slow_query_file,
+        ).register()
+
     logger.info("Logging setup completed successfully.")
@@ -3,6 +3,7 @@ __all__ = (
     "ErrorLogger",
     "InterceptLogger",
     "JSONLogger",
+    "SlowQueryLogger",
     "StreamLogger",
 )
 
@@ -19,6 +20,9 @@ from app.core.logging_.loggers.intercept import (
 from app.core.logging_.loggers.json import (
     JSONLogger,
 )
+from app.core.logging_.loggers.slow_query import (
+    SlowQueryLogger,
+)
 from app.core.logging_.loggers.stream import (
     StreamLogger,
 )
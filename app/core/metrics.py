@@ -0,0 +1,163 @@
+from typing import (
+    Final,
+    final,
+)
+
+
+@final
+class Counter:
+    """Monotonic in-process counter."""
+
+    __slots__ = ("description", "name", "value")
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+    ) -> None:
+        """
+        Initialize the counter.
+
+        Parameters
+        ----------
+        name : str
+            unique counter name
+
+        description : str
+            what the counter counts
+        """
+        self.name = name
+        self.description = description
+        self.value = 0
+
+    def inc(
+        self,
+        amount: int = 1,
+    ) -> None:
+        """
+        Increment the counter.
+
+        Parameters
+        ----------
+        amount : int, optional
+            increment value, by default 1
+        """
+        self.value += amount
+
+
+@final
+class Gauge:
+    """In-process gauge holding the latest value."""
+
+    __slots__ = ("description", "name", "value")
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+    ) -> None:
+        """
+        Initialize the gauge.
+
+        Parameters
+        ----------
+        name : str
+            unique gauge name
+
+        description : str
+            what the gauge measures
+        """
+        self.name = name
+        self.description = description
+        self.value = 0
+
+    def set(
+        self,
+        value: int,
+    ) -> None:
+        """
+        Set the gauge.
+
+        Parameters
+        ----------
+        value : int
+            current value
+        """
+        self.value = value
+
+
+@final
+class MetricsRegistry:
+    """Registry of the worker process counters and gauges."""
+
+    __slots__ = ("_counters", "_gauges")
+
+    def __init__(self) -> None:
+        """Initialize the metrics registry."""
+        self._counters: dict[str, Counter] = {}
+        self._gauges: dict[str, Gauge] = {}
+
+    def counter(
+        self,
+        name: str,
+        description: str = "",
+    ) -> Counter:
+        """
+        Get or register a counter.
+
+        Parameters
+        ----------
+        name : str
+            unique counter name
+
+        description : str, optional
+            what the counter counts, by default ""
+
+        Returns
+        -------
+        Counter
+            registered counter
+        """
+        if (counter := self._counters.get(name)) is None:
+            counter = self._counters[name] = Counter(name, description)
+        return counter
+
+    def gauge(
+        self,
+        name: str,
+        description: str = "",
+    ) -> Gauge:
+        """
+        Get or register a gauge.
+
+        Parameters
+        ----------
+        name : str
+            unique gauge name
+
+        description : str, optional
+            what the gauge measures, by default ""
+
+        Returns
+        -------
+        Gauge
+            registered gauge
+        """
+        if (gauge := self._gauges.get(name)) is None:
+            gauge = self._gauges[name] = Gauge(name, description)
+        return gauge
+
+    def snapshot(self) -> dict[str, int]:
+        """
+        Get the current values of all counters and gauges.
+
+        Returns
+        -------
+        dict[str, int]
+            counter and gauge values by name
+        """
+        metrics = self._counters | self._gauges
+        return {name: metric.value for name, metric in sorted(metrics.items())}
+
+
+metrics: Final = MetricsRegistry()
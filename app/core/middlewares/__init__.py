@@ -1,6 +1,7 @@
 __all__ = (
     "AuthMiddleware",
     "CORSMiddleware",
+    "DisconnectMiddleware",
     "ExceptionMiddleware",
     "LoggingMiddleware",
 )
@@ -11,6 +12,9 @@ from app.core.middlewares.auth import (
 from app.core.middlewares.cors import (
     CORSMiddleware,
 )
+from app.core.middlewares.disconnect import (
+    DisconnectMiddleware,
+)
 from app.core.middlewares.exception import (
     ExceptionMiddleware,
 )
@@ -0,0 +1,164 @@
+import asyncio
+import math
+from typing import (
+    Final,
+    final,
+)
+
+import anyio
+from starlette.types import (
+    ASGIApp,
+    Message,
+    Receive,
+    Scope,
+    Send,
+)
+
+# bytes of request body buffered before the app reads it
+BODY_READ_AHEAD: Final[int] = 1024 * 1024
+
+
+@final
+class DisconnectMiddleware:
+    """
+    Middleware cancelling request handling once the client disconnects.
+
+    Cancellation reaches the running database query, which asyncpg then \
+        cancels on the server, so abandoned requests release their connection.
+
+    Parameters
+    ----------
+    app : ASGIApp
+        ASGI application
+    """
+
+    __slots__ = ("app",)
+
+    def __init__(
+        self,
+        app: ASGIApp,
+    ) -> None:
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """
+        Handle the request, cancelling it if the client goes away.
+
+        Parameters
+        ----------
+        scope : Scope
+            connection scope
+
+        receive : Receive
+            receive channel of the client messages
+
+        send : Send
+            send channel of the application messages
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with anyio.CancelScope() as cancel_scope:
+            watch = _DisconnectWatch(receive, send, cancel_scope)
+            watcher = asyncio.create_task(watch.run())
+
+            try:
+                await self.app(scope, watch.receive, watch.send)
+            finally:
+                watcher.cancel()
+
+
+@final
+class _DisconnectWatch:
+    """
+    Watch of a single request for a client disconnect.
+
+    The request body is read ahead of the application up to a limit, \
+        so a disconnect is seen even if the body is left unread. \
+        Once the response is complete the watch stops: servers report \
+        a disconnect for every finished response, and cancelling then \
+        would hit background tasks and dependency teardowns.
+    """
+
+    __slots__ = (
+        "_buffered",
+        "_cancel_scope",
+        "_drained",
+        "_messages",
+        "_receive",
+        "_response_complete",
+        "_send",
+        "_sent_messages",
+    )
+
+    def __init__(
+        self,
+        receive: Receive,
+        send: Send,
+        cancel_scope: anyio.CancelScope,
+    ) -> None:
+        self._receive = receive
+        self._send = send
+        self._cancel_scope = cancel_scope
+        self._response_complete = False
+        self._buffered = 0
+        self._drained = asyncio.Event()
+        self._sent_messages, self._messages = anyio.create_memory_object_stream[Message](
+            math.inf
+        )
+
+    async def run(self) -> None:
+        """Forward the request body, then cancel the request on a disconnect."""
+        while (message := await self._receive())["type"] != "http.disconnect":
+            self._sent_messages.send_nowait(message)
+            self._buffered += len(message.get("body", b""))
+
+            if not message.get("more_body", False):
+                # only a disconnect can follow the end of the body
+                message = await self._receive()
+                break
+
+            while self._buffered > BODY_READ_AHEAD:
+                # the app is not reading, keep the server's back-pressure
+                self._drained.clear()
+                await self._drained.wait()
+
+        self._sent_messages.send_nowait(message)
+
+        if not self._response_complete:
+            self._cancel_scope.cancel()
+
+    async def receive(self) -> Message:
+        """
+        Receive a client message on behalf of the application.
+
+        Returns
+        -------
+        Message
+            request body chunk or disconnect
+        """
+        message = await self._messages.receive()
+        self._buffered -= len(message.get("body", b""))
+        self._drained.set()
+        return message
+
+    async def send(self, message: Message) -> None:
+        """
+        Send an application message to the client.
+
+        Parameters
+        ----------
+        message : Message
+            response start or body chunk
+        """
+        if message["type"] == "http.response.body" and not message.get("more_body", False):
+            # marked first, the server reports the disconnect as soon as it is sent
+            self._response_complete = True
+
+        await self._send(message)
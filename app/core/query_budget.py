@@ -0,0 +1,177 @@
+from collections.abc import (
+    AsyncIterator,
+)
+from typing import (
+    Literal,
+)
+
+from fastapi import (
+    Depends,
+    params,
+)
+from loguru import (
+    logger,
+)
+
+import app.core.exceptions as exc
+from app.core.request_context import (
+    QueryStats,
+    request_query_stats,
+    request_route,
+)
+
+type QueryBudgetMode = Literal["off", "warn", "fail"]
+
+
+class QueryBudgetGuard:
+    """Request query budget guard."""
+
+    __slots__ = ("default_budget", "mode")
+
+    def __init__(
+        self,
+        mode: QueryBudgetMode,
+        default_budget: int | None = None,
+    ) -> None:
+        """
+        Initialize the request query budget guard.
+
+        Parameters
+        ----------
+        mode : QueryBudgetMode
+            'off' to disable counting, 'warn' to log and 'fail' to raise \
+                on an exceeded budget
+
+        default_budget : int | None, optional
+            statements allowed for routes without their own budget, \
+                by default None
+        """
+        self.mode = mode
+        self.default_budget = default_budget
+
+    async def __call__(self) -> AsyncIterator[None]:
+        """
+        Count database statements of the request and check the budget.
+
+        Yields
+        ------
+        None
+            control to the request handler
+
+        Raises
+        ------
+        QueryBudgetExceededError
+            budget is exceeded in 'fail' mode
+        """
+        if self.mode == "off":
+            yield
+            return
+
+        stats = QueryStats(budget=self.default_budget)
+        request_query_stats.set(stats)
+
+        yield
+
+        route = request_route.get() or "-"
+        logger.bind(
+            type="query_budget",
+        ).debug(
+            "QueryStats: {route} issued {statements} statements in {duration_ms:.2f} ms",
+            route=route,
+            statements=stats.statements,
+            duration_ms=stats.duration * 1000,
+        )
+
+        if stats.budget is None or stats.statements <= stats.budget:
+            return
+
+        if self.mode == "fail":
+            raise exc.QueryBudgetExceededError(route, stats.statements, stats.budget)
+
+        logger.bind(
+            type="query_budget",
+        ).warning(
+            "QueryBudgetExceeded: {route} issued {statements} statements, budget is {budget}",
+            route=route,
+            statements=stats.statements,
+            budget=stats.budget,
+        )
+
+
+class QueryBudget:
+    """Route query budget."""
+
+    __slots__ = ("statements",)
+
+    def __init__(
+        self,
+        statements: int,
+    ) -> None:
+        """
+        Initialize the route query budget.
+
+        Parameters
+        ----------
+        statements : int
+            statements allowed per request, including commits
+        """
+        self.statements = statements
+
+    async def __call__(self) -> None:
+        """Set the budget of the current request."""
+        if (stats := request_query_stats.get()) is not None:
+            stats.budget = self.statements
+
+
+def dep_query_guard_getter(
+    mode: QueryBudgetMode,
+    default_budget: int | None = None,
+) -> params.Depends:
+    """
+    Get dependency on request query budget guard.
+
+    Parameters
+    ----------
+    mode : QueryBudgetMode
+        'off' to disable counting, 'warn' to log and 'fail' to raise \
+            on an exceeded budget
+
+    default_budget : int | None, optional
+        statements allowed for routes without their own budget, by default None
+
+    Returns
+    -------
+    params.Depends
+        dependency on guard
+    """
+    return Depends(
+        dependency=QueryBudgetGuard(
+            mode=mode,
+            default_budget=default_budget,
+        ),
+        # checked before the response is sent, a request-scoped teardown runs after it
+        scope="function",
+    )
+
+
+def dep_query_budget_getter(
+    statements: int,
+) -> params.Depends:
+    """
+    Get dependency on route query budget.
+
+    Parameters
+    ----------
+    statements : int
+        statements allowed per request, including commits
+
+    Returns
+    -------
+    params.Depends
+        dependency on budget
+    """
+    return Depends(
+        dependency=QueryBudget(
+            statements=statements,
+        ),
+    )
@@ -0,0 +1,62 @@
+from contextvars import (
+    ContextVar,
+)
+from dataclasses import (
+    dataclass,
+)
+from typing import (
+    Final,
+)
+
+from fastapi import (
+    Depends,
+    Request,
+    params,
+)
+from starlette.routing import (
+    Route,
+)
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """Database statements issued by a request."""
+
+    statements: int = 0
+    duration: float = 0.0  # seconds
+    budget: int | None = None
+
+
+request_route: Final[ContextVar[str | None]] = ContextVar("request_route", default=None)
+request_query_stats: Final[ContextVar[QueryStats | None]] = ContextVar(
+    "request_query_stats",
+    default=None,
+)
+
+
+async def track_request_route(request: Request) -> None:
+    """
+    Remember the matched route of the current request.
+
+    Parameters
+    ----------
+    request : Request
+        request from the client
+    """
+    route = request.scope.get("route")
+    path = route.path if isinstance(route, Route) else request.url.path
+    request_route.set(f"{request.method} {path}")
+
+
+def dep_request_route_getter() -> params.Depends:
+    """
+    Get dependency on the request route tracker.
+
+    Returns
+    -------
+    params.Depends
+        dependency on route tracker
+    """
+    return Depends(
+        dependency=track_request_route,
+    )
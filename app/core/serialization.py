@@ -0,0 +1,261 @@
+import codecs
+import csv
+import io
+import tempfile
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Sequence,
+)
+from dataclasses import (
+    fields,
+)
+from datetime import (
+    datetime,
+)
+from decimal import (
+    Decimal,
+)
+from typing import (
+    IO,
+    Any,
+    Final,
+)
+
+import orjson
+
+from app.core.exceptions import (
+    PayloadTooLargeError,
+)
+
+SPOOL_CHUNK_SIZE: Final[int] = 64 * 1024  # bytes
+
+
+def _orjson_default(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, Decimal):
+        return float(value)
+
+    raise TypeError
+
+
+def _csv_value(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def dump_json(item: Any) -> bytes:  # noqa: ANN401
+    """
+    Serialize a dataclass as JSON.
+
+    Parameters
+    ----------
+    item : Any
+        dataclass instance
+
+    Returns
+    -------
+    bytes
+        JSON object
+    """
+    return orjson.dumps(item, default=_orjson_default)
+
+
+def dump_ndjson(items: Iterable[Any]) -> bytes:
+    """
+    Serialize dataclasses as newline-delimited JSON.
+
+    Parameters
+    ----------
+    items : Iterable[Any]
+        dataclass instances
+
+    Returns
+    -------
+    bytes
+        one JSON object per line
+    """
+    return b"".join(
+        orjson.dumps(item, default=_orjson_default, option=orjson.OPT_APPEND_NEWLINE)
+        for item in items
+    )
+
+
+def dump_csv(
+    items: Sequence[Any],
+    *,
+    header: bool,
+) -> bytes:
+    """
+    Serialize dataclasses as CSV rows.
+
+    Parameters
+    ----------
+    items : Sequence[Any]
+        dataclass instances of the same type
+
+    header : bool
+        prepend a row of field names
+
+    Returns
+    -------
+    bytes
+        utf-8 encoded CSV rows
+    """
+    if not items:
+        return b""
+
+    names = [field.name for field in fields(items[0])]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    if header:
+        writer.writerow(names)
+
+    writer.writerows([_csv_value(getattr(item, name)) for name in names] for item in items)
+    return buffer.getvalue().encode()
+
+
+async def _iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    tail = ""
+
+    async for chunk in chunks:
+        *lines, tail = (tail + decoder.decode(chunk)).split("\n")
+        for line in lines:
+            yield line + "\n"
+
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+async def load_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """
+    Incrementally deserialize newline-delimited JSON.
+
+    Parameters
+    ----------
+    chunks : AsyncIterable[bytes]
+        utf-8 encoded body chunks
+
+    Yields
+    ------
+    Any
+        one decoded value per non-blank line, None for malformed lines
+    """
+    async for line in _iter_lines(chunks):
+        if not line.strip():
+            continue
+
+        try:
+            yield orjson.loads(line)
+        except orjson.JSONDecodeError:
+            yield None
+
+
+async def load_csv(chunks: AsyncIterable[bytes]) -> AsyncIterator[dict[str, str] | None]:
+    """
+    Incrementally deserialize CSV rows keyed by the header row.
+
+    Parameters
+    ----------
+    chunks : AsyncIterable[bytes]
+        utf-8 encoded body chunks
+
+    Yields
+    ------
+    dict[str, str] | None
+        one mapping per record, None for records not matching the header
+    """
+    header: list[str] | None = None
+    record = ""
+
+    async for line in _iter_lines(chunks):
+        record += line
+        # quoted fields may span lines, a record ends on a balanced quote count
+        if record.count('"') % 2:
+            continue
+
+        values, record = next(csv.reader([record]), []), ""
+        if not values:
+            continue
+
+        if header is None:
+            header = values
+        elif len(values) == len(header):
+            yield dict(zip(header, values, strict=True))
+        else:
+            yield None
+
+    if record:
+        yield None
+
+
+async def spool(
+    chunks: AsyncIterable[bytes],
+    max_memory: int,
+    max_size: int | None = None,
+) -> IO[bytes]:
+    """
+    Buffer a whole body before it is processed.
+
+    Parameters
+    ----------
+    chunks : AsyncIterable[bytes]
+        body chunks
+
+    max_memory : int
+        bytes kept in memory before the buffer spills to a temporary file
+
+    max_size : int | None, optional
+        bytes accepted at most, by default None for no limit
+
+    Returns
+    -------
+    IO[bytes]
+        buffered body rewound to the start, to be closed by the caller
+
+    Raises
+    ------
+    PayloadTooLargeError
+        the body is larger than 'max_size', nothing is kept of it
+    """
+    spooled = tempfile.SpooledTemporaryFile(max_size=max_memory)  # noqa: SIM115
+    size = 0
+
+    try:
+        async for chunk in chunks:
+            size += len(chunk)
+            if max_size is not None and size > max_size:
+                break
+            spooled.write(chunk)
+    except BaseException:
+        spooled.close()
+        raise
+
+    if max_size is not None and size > max_size:
+        spooled.close()
+        raise PayloadTooLargeError(max_bytes=max_size)
+
+    spooled.seek(0)
+    return spooled
+
+
+async def iter_spooled(spooled: IO[bytes]) -> AsyncIterator[bytes]:
+    """
+    Read a buffered body chunk by chunk.
+
+    Parameters
+    ----------
+    spooled : IO[bytes]
+        buffered body
+
+    Yields
+    ------
+    bytes
+        body chunks
+    """
+    while chunk := spooled.read(SPOOL_CHUNK_SIZE):
+        yield chunk
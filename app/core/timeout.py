@@ -0,0 +1,62 @@
+from contextvars import (
+    ContextVar,
+)
+from typing import (
+    Final,
+)
+
+from fastapi import (
+    Depends,
+    params,
+)
+
+db_deadline: Final[ContextVar[float | None]] = ContextVar("db_deadline", default=None)
+
+
+class DatabaseDeadline:
+    """Request database deadline."""
+
+    __slots__ = ("seconds",)
+
+    def __init__(
+        self,
+        seconds: float | None,
+    ) -> None:
+        """
+        Initialize the request database deadline.
+
+        Parameters
+        ----------
+        seconds : float | None
+            time budget of each unit-of-work in seconds, 'None' for no deadline
+        """
+        self.seconds = seconds
+
+    async def __call__(self) -> None:
+        """Set the deadline for units-of-work of the current request."""
+        db_deadline.set(self.seconds)
+
+
+def dep_db_timeout_getter(
+    seconds: float | None,
+) -> params.Depends:
+    """
+    Get dependency on database deadline.
+
+    A route-level dependency overrides the deadline set by the router.
+
+    Parameters
+    ----------
+    seconds : float | None
+        time budget of each unit-of-work in seconds, 'None' for no deadline
+
+    Returns
+    -------
+    params.Depends
+        dependency on deadline
+    """
+    return Depends(
+        dependency=DatabaseDeadline(
+            seconds=seconds,
+        ),
+    )
@@ -2,12 +2,17 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from collections.abc import (
+    Hashable,
+    Sequence,
+)
 from typing import (
     ClassVar,
     Self,
     final,
 )
 
+import redis.asyncio as redis
 from pydantic import (
     BaseModel as BaseSchema,
 )
@@ -51,6 +56,8 @@ class BaseDatabaseManager[
         self,
         url: str,
         db_config: DatabaseConfigType,
+        replica_urls: Sequence[str] = (),
+        pin_store: redis.Redis | None = None,
     ) -> None:
         """
         Initialize a db session.
@@ -58,10 +65,17 @@ class BaseDatabaseManager[
         Parameters
         ----------
         url : str
-            connection url
+            primary connection url
 
         db_config : DatabaseConfigType
             database config
+
+        replica_urls : Sequence[str], optional
+            read replica connection urls, by default ()
+
+        pin_store : redis.Redis | None, optional
+            redis client sharing the pinned writers across worker \
+                processes, by default None for this worker only
         """
         raise NotImplementedError
 
@@ -70,6 +84,67 @@ class BaseDatabaseManager[
         """Close a db session."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def read_session_factory(
+        self,
+        pin_key: Hashable | None = None,
+        *,
+        primary: bool = False,
+    ) -> SessionFactoryType:
+        """
+        Get the session factory for read-only work.
+
+        Parameters
+        ----------
+        pin_key : Hashable | None, optional
+            key of the recent writer, by default None
+
+        primary : bool, optional
+            read on the primary regardless of the replicas, by default False
+
+        Returns
+        -------
+        SessionFactoryType
+            replica session factory, or the primary one if requested, \
+                if the key is pinned or if no replica is healthy
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def pin_primary(
+        self,
+        pin_key: Hashable,
+    ) -> None:
+        """
+        Route the key's reads to the primary for a short window after a write.
+
+        Parameters
+        ----------
+        pin_key : Hashable
+            key of the writer
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def is_pinned(
+        self,
+        pin_key: Hashable | None,
+    ) -> bool:
+        """
+        Check whether the key's reads are routed to the primary.
+
+        Parameters
+        ----------
+        pin_key : Hashable | None
+            key of the reader
+
+        Returns
+        -------
+        bool
+            the key wrote within the pin window
+        """
+        raise NotImplementedError
+
     @final
     @property
     def session_factory(self) -> SessionFactoryType:
@@ -1,8 +1,20 @@
+import asyncio
+import itertools
+import time
+from collections.abc import (
+    Hashable,
+    Sequence,
+)
 from typing import (
+    Final,
     final,
     override,
 )
 
+import redis.asyncio as redis
+from loguru import (
+    logger,
+)
 from sqlalchemy.engine import (
     URL,
 )
@@ -12,13 +24,29 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.sql.expression import (
+    text,
+)
 
+import app.core.exceptions as exc
 from app.core.config import (
     SqlAlchemyConfig,
 )
 from app.database.db_managers.base import (
     BaseDatabaseManager,
 )
+from app.database.events import (
+    QueryCounterListener,
+    SlowQueryListener,
+)
+
+REPLICA_LAG_QUERY: Final = text(
+    "SELECT CASE "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) "
+    "END",
+)
+REPLICA_PIN_PREFIX: Final[str] = "db:pin"
 
 
 @final
@@ -30,33 +58,246 @@ class SqlAlchemyDatabaseManager(
         SqlAlchemyConfig,
     ],
 ):
-    """SqlAlchemy database manager."""
+    """
+    SqlAlchemy database manager.
+
+    Read-only sessions run in autocommit mode and can be routed to replicas: \
+        a background task measures the replay lag of every replica and only \
+        those within 'replica_max_lag' are used. Pinned writers are kept \
+        on the primary, across workers when a pin store is given: a write \
+        on one worker is then followed by primary reads on all of them.
+    """
+
+    __slots__ = (
+        "_db_config",
+        "_healthy_replicas",
+        "_lag_monitor",
+        "_pin_store",
+        "_pinned_until",
+        "_primary_read_session_factory",
+        "_replica_counter",
+        "_replica_engines",
+        "_replica_session_factories",
+    )
+
+    @override
+    def __init__(self) -> None:
+        super().__init__()
+        self._db_config: SqlAlchemyConfig | None = None
+        self._primary_read_session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._replica_engines: list[AsyncEngine] = []
+        self._replica_session_factories: list[async_sessionmaker[AsyncSession]] = []
+        self._healthy_replicas: list[int] = []
+        self._replica_counter = itertools.count()
+        self._pinned_until: dict[Hashable, float] = {}
+        self._pin_store: redis.Redis | None = None
+        self._lag_monitor: asyncio.Task[None] | None = None
 
     @override
     async def init(
         self,
         url: str | URL,
         db_config: SqlAlchemyConfig,
+        replica_urls: Sequence[str | URL] = (),
+        pin_store: redis.Redis | None = None,
     ) -> None:
-        self._engine = create_async_engine(
-            url=url,
-            echo=db_config.echo,
-            echo_pool=db_config.echo_pool,
-            pool_size=db_config.pool_size,
-            max_overflow=db_config.max_overflow,
-        )
-        self._session_factory = async_sessionmaker(
-            bind=self._engine,
-            autoflush=False,
-            autocommit=False,
-            expire_on_commit=False,
+        self._db_config = db_config
+        self._pin_store = pin_store
+        self._engine = self._create_engine(url, db_config)
+        self._session_factory = self._create_session_factory(self._engine)
+        self._primary_read_session_factory = self._create_session_factory(
+            self._engine,
+            read_only=True,
         )
 
+        for replica_url in replica_urls:
+            replica_engine = self._create_engine(replica_url, db_config)
+            self._replica_engines.append(replica_engine)
+            self._replica_session_factories.append(
+                self._create_session_factory(replica_engine, read_only=True),
+            )
+
+        if self._replica_engines:
+            self._lag_monitor = asyncio.create_task(self._monitor_replica_lag())
+
     @override
     async def close(self) -> None:
+        if self._lag_monitor is not None:
+            self._lag_monitor.cancel()
+            self._lag_monitor = None
+
+        for replica_engine in self._replica_engines:
+            await replica_engine.dispose()
+
+        self._replica_engines.clear()
+        self._replica_session_factories.clear()
+        self._healthy_replicas.clear()
+        self._pinned_until.clear()
+        self._pin_store = None
+
         if self._engine is None:
             return
 
         await self._engine.dispose()
         self._engine = None
         self._session_factory = None
+        self._primary_read_session_factory = None
+
+    @override
+    async def read_session_factory(
+        self,
+        pin_key: Hashable | None = None,
+        *,
+        primary: bool = False,
+    ) -> async_sessionmaker[AsyncSession]:
+        healthy_replicas = self._healthy_replicas
+
+        if primary or not healthy_replicas or await self.is_pinned(pin_key):
+            if self._primary_read_session_factory is None:
+                raise exc.DatabaseSessionError
+            return self._primary_read_session_factory
+
+        index = next(self._replica_counter) % len(healthy_replicas)
+        return self._replica_session_factories[healthy_replicas[index]]
+
+    @override
+    async def pin_primary(
+        self,
+        pin_key: Hashable,
+    ) -> None:
+        if not self._replica_engines or self._db_config is None:
+            return
+
+        pin_seconds = self._db_config.replica_pin_seconds
+        self._pinned_until[pin_key] = time.monotonic() + pin_seconds
+
+        if self._pin_store is None:
+            return
+
+        try:
+            await self._pin_store.set(
+                f"{REPLICA_PIN_PREFIX}:{pin_key}",
+                1,
+                px=int(pin_seconds * 1000),
+            )
+        except redis.RedisError as e:
+            # other workers may serve the writer from a lagging replica
+            logger.warning(f"Replica pin of {pin_key} was not shared: {e!s}")
+
+    @override
+    async def is_pinned(
+        self,
+        pin_key: Hashable | None,
+    ) -> bool:
+        if pin_key is None:
+            return False
+
+        if (pinned_until := self._pinned_until.get(pin_key)) is not None:
+            if pinned_until > time.monotonic():
+                return True
+            self._pinned_until.pop(pin_key, None)
+
+        # without replicas every read is on the primary anyway
+        if self._pin_store is None or not self._replica_engines:
+            return False
+
+        try:
+            return bool(await self._pin_store.exists(f"{REPLICA_PIN_PREFIX}:{pin_key}"))
+        except redis.RedisError as e:
+            logger.warning(f"Replica pin of {pin_key} could not be read: {e!s}")
+            return False
+
+    async def _monitor_replica_lag(self) -> None:
+        """Periodically refresh the list of replicas within the allowed lag."""
+        if self._db_config is None:
+            return
+
+        while True:
+            healthy_replicas: list[int] = []
+
+            for index, replica_engine in enumerate(self._replica_engines):
+                try:
+                    async with replica_engine.connect() as conn:
+                        lag = float(await conn.scalar(REPLICA_LAG_QUERY) or 0)
+                except Exception as e:  # noqa: BLE001
+                    logger.warning(f"Replica #{index} is unavailable: {e!s}")
+                    continue
+
+                if lag <= self._db_config.replica_max_lag:
+                    healthy_replicas.append(index)
+                else:
+                    logger.warning(f"Replica #{index} is lagging by {lag:.2f} s")
+
+            self._healthy_replicas = healthy_replicas
+
+            now = time.monotonic()
+            self._pinned_until = {
+                key: until for key, until in self._pinned_until.items() if until > now
+            }
+
+            await asyncio.sleep(self._db_config.replica_lag_check_interval)
+
+    @staticmethod
+    def _create_engine(
+        url: str | URL,
+        db_config: SqlAlchemyConfig,
+    ) -> AsyncEngine:
+        engine = create_async_engine(
+            url=url,
+            echo=db_config.echo,
+            echo_pool=db_config.echo_pool,
+            pool_size=db_config.pool_size,
+            max_overflow=db_config.max_overflow,
+            pool_timeout=db_config.pool_timeout,
+            query_cache_size=db_config.query_cache_size,
+            connect_args={
+                "prepared_statement_cache_size": db_config.prepared_statement_cache_size,
+                "server_settings": {
+                    "statement_timeout": str(db_config.statement_timeout),
+                },
+            },
+        )
+
+        if db_config.slow_query_threshold > 0:
+            SlowQueryListener(
+                engine=engine,
+                threshold=db_config.slow_query_threshold,
+                explain=db_config.slow_query_explain,
+            ).register()
+
+        if db_config.query_budget_mode != "off":
+            QueryCounterListener(engine=engine).register()
+
+        return engine
+
+    @staticmethod
+    def _create_session_factory(
+        engine: AsyncEngine,
+        *,
+        read_only: bool = False,
+    ) -> async_sessionmaker[AsyncSession]:
+        """
+        Create a session factory bound to the engine.
+
+        Parameters
+        ----------
+        engine : AsyncEngine
+            database engine
+
+        read_only : bool, optional
+            run every statement in autocommit mode without BEGIN/COMMIT, \
+                by default False
+
+        Returns
+        -------
+        async_sessionmaker[AsyncSession]
+            session factory
+        """
+        return async_sessionmaker(
+            bind=engine.execution_options(isolation_level="AUTOCOMMIT")
+            if read_only
+            else engine,
+            autoflush=False,
+            autocommit=False,
+            expire_on_commit=False,
+        )
@@ -0,0 +1,11 @@
+__all__ = (
+    "QueryCounterListener",
+    "SlowQueryListener",
+)
+
+from app.database.events.query_counter import (
+    QueryCounterListener,
+)
+from app.database.events.slow_query import (
+    SlowQueryListener,
+)
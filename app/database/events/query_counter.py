@@ -0,0 +1,92 @@
+import time
+from typing import (
+    Any,
+    Final,
+    final,
+)
+
+from sqlalchemy import (
+    event,
+)
+from sqlalchemy.engine import (
+    Connection,
+    ExecutionContext,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+)
+
+from app.core.request_context import (
+    request_query_stats,
+)
+
+_START_TIMES_KEY: Final[str] = "query_counter_start_times"
+
+
+@final
+class QueryCounterListener:
+    """
+    Engine listener counting statements and database time of a request.
+
+    Every cursor execution and commit is added to the request query stats, \
+        if the request collects them.
+    """
+
+    __slots__ = ("_engine",)
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+    ) -> None:
+        """
+        Initialize the query counter listener.
+
+        Parameters
+        ----------
+        engine : AsyncEngine
+            database engine to listen on
+        """
+        self._engine = engine
+
+    def register(self) -> None:
+        """Attach the listener to the engine."""
+        event.listen(self._engine.sync_engine, "before_cursor_execute", self._before_execute)
+        event.listen(self._engine.sync_engine, "after_cursor_execute", self._after_execute)
+        event.listen(self._engine.sync_engine, "commit", self._commit)
+
+    @staticmethod
+    def _before_execute(  # noqa: PLR0913, PLR0917
+        conn: Connection,
+        cursor: Any,  # noqa: ANN401
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: ExecutionContext | None,
+        executemany: bool,  # noqa: FBT001
+    ) -> None:
+        _ = cursor, statement, parameters, context, executemany
+        if request_query_stats.get() is not None:
+            conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+    @staticmethod
+    def _after_execute(  # noqa: PLR0913, PLR0917
+        conn: Connection,
+        cursor: Any,  # noqa: ANN401
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: ExecutionContext | None,
+        executemany: bool,  # noqa: FBT001
+    ) -> None:
+        _ = cursor, statement, parameters, context, executemany
+        if (stats := request_query_stats.get()) is None or not (
+            start_times := conn.info.get(_START_TIMES_KEY)
+        ):
+            return
+
+        stats.statements += 1
+        stats.duration += time.perf_counter() - start_times.pop()
+
+    @staticmethod
+    def _commit(conn: Connection) -> None:
+        _ = conn
+        if (stats := request_query_stats.get()) is not None:
+            stats.statements += 1
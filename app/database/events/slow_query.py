@@ -0,0 +1,196 @@
+import asyncio
+import time
+from collections.abc import (
+    Sequence,
+)
+from typing import (
+    Any,
+    Final,
+    final,
+)
+
+from loguru import (
+    logger,
+)
+from sqlalchemy import (
+    event,
+)
+from sqlalchemy.engine import (
+    Connection,
+    ExceptionContext,
+    ExecutionContext,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+)
+
+from app.core.request_context import (
+    request_route,
+)
+
+REDACTED: Final[str] = "***"
+SENSITIVE_PARAM_NAMES: Final[Sequence[str]] = ("password", "token", "secret")
+MAX_PARAM_LENGTH: Final[int] = 64
+EXPLAIN_OPTION: Final[str] = "slow_query_explain"
+
+_START_TIMES_KEY: Final[str] = "slow_query_start_times"
+
+
+@final
+class SlowQueryListener:
+    """
+    Engine listener logging statements slower than a threshold.
+
+    Slow statements are written to the 'slow_query' log with the request \
+        route and redacted parameters. Slow SELECT statements can also be \
+        re-run under 'EXPLAIN (ANALYZE, BUFFERS)' in the background, \
+        one at a time and in a rolled back transaction.
+    """
+
+    __slots__ = ("_engine", "_explain", "_explain_task", "_threshold")
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        threshold: float,
+        *,
+        explain: bool = False,
+    ) -> None:
+        """
+        Initialize the slow query listener.
+
+        Parameters
+        ----------
+        engine : AsyncEngine
+            database engine to listen on
+
+        threshold : float
+            minimum duration of a logged statement in seconds
+
+        explain : bool, optional
+            capture plans of slow SELECT statements, by default False
+        """
+        self._engine = engine
+        self._threshold = threshold
+        self._explain = explain
+        self._explain_task: asyncio.Task[None] | None = None
+
+    def register(self) -> None:
+        """Attach the listener to the engine."""
+        event.listen(self._engine.sync_engine, "before_cursor_execute", self._before_execute)
+        event.listen(self._engine.sync_engine, "after_cursor_execute", self._after_execute)
+        event.listen(self._engine.sync_engine, "handle_error", self._handle_error)
+
+    def _before_execute(  # noqa: PLR0913, PLR0917
+        self,
+        conn: Connection,
+        cursor: Any,  # noqa: ANN401
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: ExecutionContext | None,
+        executemany: bool,  # noqa: FBT001
+    ) -> None:
+        _ = cursor, statement, parameters, context, executemany
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+    def _after_execute(  # noqa: PLR0913, PLR0917
+        self,
+        conn: Connection,
+        cursor: Any,  # noqa: ANN401
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        context: ExecutionContext | None,
+        executemany: bool,  # noqa: FBT001
+    ) -> None:
+        _ = cursor
+        duration = time.perf_counter() - conn.info[_START_TIMES_KEY].pop()
+
+        if duration < self._threshold or conn.get_execution_options().get(EXPLAIN_OPTION):
+            return
+
+        route = request_route.get()
+        logger.bind(
+            type="slow_query",
+        ).warning(
+            "SlowQuery: {duration_ms:.2f} ms on {route};\n{statement}\n"
+            "Parameters: {parameters}",
+            duration_ms=duration * 1000,
+            route=route or "-",
+            statement=statement,
+            parameters=self._redact(parameters, context),
+        )
+
+        if (
+            self._explain
+            and not executemany
+            and statement.lstrip().upper().startswith("SELECT")
+            and (self._explain_task is None or self._explain_task.done())
+        ):
+            self._explain_task = asyncio.get_running_loop().create_task(
+                self._run_explain(statement, parameters, route),
+            )
+
+    @staticmethod
+    def _handle_error(context: ExceptionContext) -> None:
+        # failed statements never reach 'after_cursor_execute'
+        if context.connection is not None and context.cursor is not None:
+            start_times = context.connection.info.get(_START_TIMES_KEY)
+            if start_times:
+                start_times.pop()
+
+    async def _run_explain(
+        self,
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        route: str | None,
+    ) -> None:
+        """Log the plan of a slow statement, never raising."""
+        try:
+            async with self._engine.connect() as conn:
+                explain_conn = await conn.execution_options(**{EXPLAIN_OPTION: True})
+                result = await explain_conn.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS) {statement}",
+                    parameters,
+                )
+                plan = "\n".join(row[0] for row in result)
+                # ANALYZE executes the statement, its effects are never kept
+                await conn.rollback()
+        except Exception as e:  # noqa: BLE001
+            logger.bind(type="slow_query").warning(f"SlowQuery plan is unavailable: {e!s}")
+            return
+
+        logger.bind(
+            type="slow_query",
+        ).warning(
+            "SlowQueryPlan on {route};\n{statement}\n{plan}",
+            route=route or "-",
+            statement=statement,
+            plan=plan,
+        )
+
+    @staticmethod
+    def _redact(
+        parameters: Any,  # noqa: ANN401
+        context: ExecutionContext | None,
+    ) -> Any:  # noqa: ANN401
+        """Mask sensitive parameters and shorten long ones."""
+        compiled = getattr(context, "compiled", None)
+        names = getattr(compiled, "positiontup", None)
+
+        if isinstance(parameters, Sequence) and names and len(names) == len(parameters):
+            parameters = dict(zip(names, parameters, strict=True))
+
+        if not isinstance(parameters, dict):
+            return REDACTED if parameters else parameters
+
+        redacted: dict[str, Any] = {}
+
+        for name, value in parameters.items():
+            if any(sensitive in str(name).lower() for sensitive in SENSITIVE_PARAM_NAMES):
+                redacted[name] = REDACTED
+            elif isinstance(value, str) and len(value) > MAX_PARAM_LENGTH:
+                redacted[name] = f"{value[:MAX_PARAM_LENGTH]}..."
+            else:
+                redacted[name] = value
+
+        return redacted
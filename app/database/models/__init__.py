@@ -1,6 +1,7 @@
 __all__ = (
     "BaseModel",
     "MovieModel",
+    "MovieStatsModel",
     "UserModel",
 )
 
@@ -10,6 +11,9 @@ from app.database.models.base import (
 from app.database.models.movie import (
     MovieModel,
 )
+from app.database.models.movie_stats import (
+    MovieStatsModel,
+)
 from app.database.models.user import (
     UserModel,
 )
@@ -1,24 +1,34 @@
 from typing import (
+    Any,
     final,
 )
 from uuid import (
     UUID,
 )
 
+from sqlalchemy.dialects.postgresql import (
+    TSVECTOR,
+)
 from sqlalchemy.orm import (
     Mapped,
+    declared_attr,
     mapped_column,
     relationship,
 )
 from sqlalchemy.schema import (
     CheckConstraint,
+    Computed,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.types import (
     Numeric,
     String,
 )
 
+from app.core.constants import (
+    MOVIE_SEARCH_CONFIG,
+)
 from app.database.models.base import (
     BaseModel,
 )
@@ -39,21 +49,30 @@ class MovieModel(
     """
     Movie database model.
 
+    The table is hash-partitioned by 'user_id' and its primary key is \
+        (id, user_id). Ids stay unique on their own, so the mapper identifies \
+        movies by id alone. Partitioned tables cannot have a unique index \
+        without the partition key, titles are claimed in 'movie_titles' \
+        by triggers instead (see the partitioning migration).
+
     Columns:
         id: int
         created_at: datetime
         updated_at: datetime
-        title: str (50)
+        title: str (50, unique across all users)
         description: str (100)
         rate: float (0.0-5.0)
         user_id: UUID
+        search_vector: tsvector (generated, deferred)
     """
 
+    id: Mapped[int] = mapped_column(
+        primary_key=True,
+        autoincrement=True,
+    )
     title: Mapped[str] = mapped_column(
         String(50),
-        unique=True,
         nullable=False,
-        index=True,
     )
     description: Mapped[str] = mapped_column(
         String(100),
@@ -64,8 +83,19 @@ class MovieModel(
         nullable=False,
     )
     user_id: Mapped[UUID] = mapped_column(
-        ForeignKey("users.id"),
-        index=True,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            sqltext=(
+                f"setweight(to_tsvector('{MOVIE_SEARCH_CONFIG}', title), 'A') || "
+                f"setweight(to_tsvector('{MOVIE_SEARCH_CONFIG}', description), 'B')"
+            ),
+            persisted=True,
+        ),
+        deferred=True,
     )
     user = relationship(
         argument="UserModel",
@@ -77,4 +107,34 @@ class MovieModel(
             sqltext="rate >= 0 AND rate <= 5.0",
             name="check_rate_range",
         ),
+        Index(
+            "ix_movies_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index("ix_movies_user_id_id", "user_id", "id"),
+        Index("ix_movies_user_id_title", "user_id", "title"),
+        Index("ix_movies_user_id_rate_id", "user_id", "rate", "id"),
+        Index("ix_movies_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_movies_user_id_updated_at_id", "user_id", "updated_at", "id"),
+        Index(
+            "ix_movies_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        {"postgresql_partition_by": "HASH (user_id)"},
     )
+
+    @declared_attr.directive
+    @classmethod
+    def __mapper_args__(cls) -> dict[str, Any]:
+        """
+        Get the mapper arguments.
+
+        Returns
+        -------
+        dict[str, Any]
+            mapper arguments
+        """
+        return {"primary_key": [cls.__table__.c.id]}
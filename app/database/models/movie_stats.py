@@ -0,0 +1,74 @@
+from datetime import (
+    datetime,
+)
+from decimal import (
+    Decimal,
+)
+from typing import (
+    final,
+)
+from uuid import (
+    UUID,
+)
+
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+)
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column,
+)
+from sqlalchemy.schema import (
+    ForeignKey,
+)
+from sqlalchemy.types import (
+    Integer,
+    Numeric,
+)
+
+from app.database.models.base import (
+    BaseModel,
+)
+
+
+@final
+class MovieStatsModel(BaseModel):
+    """
+    Per-user movie statistics database model.
+
+    Rows are maintained by statement-level triggers on movies within \
+        the writing transaction and must not be written by the application \
+        (see the movie stats migration).
+
+    Columns:
+        user_id: UUID
+        movie_count: int
+        rate_sum: Decimal
+        rate_histogram: list[int] (movies per whole rate, 5.0 falls into the last)
+        newest_created_at: datetime | None
+        oldest_created_at: datetime | None
+    """
+
+    __tablename__ = "user_movie_stats"
+
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    movie_count: Mapped[int] = mapped_column(
+        nullable=False,
+    )
+    rate_sum: Mapped[Decimal] = mapped_column(
+        Numeric,
+        nullable=False,
+    )
+    rate_histogram: Mapped[list[int]] = mapped_column(
+        ARRAY(Integer),
+        nullable=False,
+    )
+    newest_created_at: Mapped[datetime | None] = mapped_column(
+        nullable=True,
+    )
+    oldest_created_at: Mapped[datetime | None] = mapped_column(
+        nullable=True,
+    )
@@ -7,6 +7,9 @@ from sqlalchemy.orm import (
     mapped_column,
     relationship,
 )
+from sqlalchemy.schema import (
+    Index,
+)
 from sqlalchemy.types import (
     Enum,
     String,
@@ -64,4 +67,7 @@ class UserModel(
         argument="MovieModel",
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
+
+    __table_args__ = (Index("ix_users_created_at_id", "created_at", "id"),)
@@ -3,9 +3,29 @@ from abc import (
     abstractmethod,
 )
 from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Hashable,
+    Mapping,
     Sequence,
 )
+from dataclasses import (
+    fields,
+)
+from decimal import (
+    Decimal,
+)
+from functools import (
+    cache,
+)
+from types import (
+    MappingProxyType,
+)
 from typing import (
+    Any,
+    ClassVar,
+    Final,
     final,
     override,
 )
@@ -13,14 +33,43 @@ from uuid import (
     UUID,
 )
 
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    insert,
+)
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
 )
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+)
+from sqlalchemy.schema import (
+    Column,
+    MetaData,
+    Table,
+)
 from sqlalchemy.sql.expression import (
+    BindParameter,
+    ColumnElement,
     Select,
+    any_,
+    bindparam,
+    delete,
+    exists,
     select,
+    update,
+)
+from sqlalchemy.types import (
+    BigInteger,
 )
 
+import app.core.exceptions as exc
+from app.core import (
+    metrics,
+)
+from app.core.typing_ import (
+    KwargsType,
+)
 from app.database.models import (
     BaseModel,
 )
@@ -28,6 +77,17 @@ from app.domains import (
     BaseDataclass,
 )
 
+FILTER_QUERY_CACHE_SIZE: Final[int] = 512
+STREAM_BATCH_SIZE: Final[int] = 1000
+FILTER_QUERY_CACHE_HITS: Final = metrics.counter(
+    name="db.filter_query_cache.hits",
+    description="filtered queries reused from the shape cache",
+)
+FILTER_QUERY_CACHE_MISSES: Final = metrics.counter(
+    name="db.filter_query_cache.misses",
+    description="filtered queries built from scratch",
+)
+
 
 class BaseDatabaseRepository[
     ModelType,
@@ -74,6 +134,49 @@ class BaseDatabaseRepository[
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_many(
+        self,
+        items_create: Sequence[ItemCreateType],
+    ) -> Sequence[ModelType]:
+        """
+        Create new items in one statement, skipping conflicting ones.
+
+        Parameters
+        ----------
+        items_create : Sequence[ItemCreateType]
+            items data to create
+
+        Returns
+        -------
+        Sequence[ModelType]
+            created item models, conflicting items are omitted
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def copy_many(
+        self,
+        batches: AsyncIterable[Sequence[ItemCreateType]],
+    ) -> tuple[int, int]:
+        """
+        Bulk load new items through a staging table, skipping conflicting ones.
+
+        The batches are consumed inside the transaction, so they should \
+            come from buffered data rather than a client upload.
+
+        Parameters
+        ----------
+        batches : AsyncIterable[Sequence[ItemCreateType]]
+            batches of items data to create
+
+        Returns
+        -------
+        tuple[int, int]
+            number of loaded items, number of created items
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def read(
         self,
@@ -94,6 +197,26 @@ class BaseDatabaseRepository[
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def exists(
+        self,
+        item_id: int | UUID,
+    ) -> bool:
+        """
+        Check whether a item exists by id.
+
+        Parameters
+        ----------
+        item_id : int | UUID
+            item id
+
+        Returns
+        -------
+        bool
+            item exists
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def update(
         self,
@@ -138,6 +261,66 @@ class BaseDatabaseRepository[
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def update_returning[OutputType](
+        self,
+        item_id: int | UUID,
+        item_update: ItemUpdateType,
+        output_class: type[OutputType],
+        relation_id: int | UUID | None = None,
+    ) -> OutputType | None:
+        """
+        Update a item by id in a single round trip.
+
+        Parameters
+        ----------
+        item_id : int | UUID
+            item id
+
+        item_update : ItemUpdateType
+            item data to update
+
+        output_class : type[OutputType]
+            output domain model, only its fields are returned
+
+        relation_id : int | UUID | None, optional
+            relationship id the item must belong to, by default None
+
+        Returns
+        -------
+        OutputType | None
+            updated item data
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_returning[OutputType](
+        self,
+        item_id: int | UUID,
+        output_class: type[OutputType],
+        relation_id: int | UUID | None = None,
+    ) -> OutputType | None:
+        """
+        Delete a item by id in a single round trip.
+
+        Parameters
+        ----------
+        item_id : int | UUID
+            item id
+
+        output_class : type[OutputType]
+            output domain model, only its fields are returned
+
+        relation_id : int | UUID | None, optional
+            relationship id the item must belong to, by default None
+
+        Returns
+        -------
+        OutputType | None
+            deleted item data
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def read_all(
         self,
@@ -162,6 +345,86 @@ class BaseDatabaseRepository[
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def read_all_as[OutputType](
+        self,
+        filters: FiltersType,
+        output_class: type[OutputType],
+        relation_id: int | UUID | None = None,
+    ) -> Sequence[OutputType]:
+        """
+        Read all items with a search filter without loading models.
+
+        Parameters
+        ----------
+        filters : FiltersType
+            item search filter
+
+        output_class : type[OutputType]
+            output domain model, only its fields are selected
+
+        relation_id : int | UUID | None, optional
+            relationship id, by default None
+
+        Returns
+        -------
+        Sequence[OutputType]
+            list of items data
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def read_many_as[OutputType](
+        self,
+        item_ids: Sequence[int | UUID],
+        output_class: type[OutputType],
+        relation_id: int | UUID | None = None,
+    ) -> Sequence[OutputType]:
+        """
+        Read items by ids in a single query without loading models.
+
+        Parameters
+        ----------
+        item_ids : Sequence[int | UUID]
+            items ids
+
+        output_class : type[OutputType]
+            output domain model, only its fields are selected
+
+        relation_id : int | UUID | None, optional
+            relationship id the items must belong to, by default None
+
+        Returns
+        -------
+        Sequence[OutputType]
+            found items data in no particular order
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_all_as[OutputType](
+        self,
+        output_class: type[OutputType],
+        relation_id: int | UUID | None = None,
+    ) -> AsyncIterator[Sequence[OutputType]]:
+        """
+        Stream all items in batches through a server-side cursor.
+
+        Parameters
+        ----------
+        output_class : type[OutputType]
+            output domain model, only its fields are selected
+
+        relation_id : int | UUID | None, optional
+            relationship id, by default None
+
+        Yields
+        ------
+        Sequence[OutputType]
+            batch of items data ordered by id
+        """
+        raise NotImplementedError
+
 
 class BaseSqlAlchemyRepository[
     ModelType: BaseModel,
@@ -180,6 +443,15 @@ class BaseSqlAlchemyRepository[
     """Basic abstract SqlAlchemy database repository class."""
 
     model_class: type[ModelType]
+    sortable_keys: ClassVar[Mapping[str, tuple[InstrumentedAttribute[Any], ...]]] = (
+        MappingProxyType({})
+    )
+    _query_cache: ClassVar[dict[Hashable, Select[Any]]] = {}
+
+    @override
+    def __init_subclass__(cls, **kwargs: KwargsType) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._query_cache = {}
 
     @final
     @override
@@ -192,6 +464,89 @@ class BaseSqlAlchemyRepository[
         await self.session.flush()
         return new_item
 
+    @final
+    @override
+    async def create_many(
+        self,
+        items_create: Sequence[ItemCreateType],
+    ) -> Sequence[ModelType]:
+        if not items_create:
+            return []
+
+        await self._skip_conflicts()
+        query = (
+            insert(self.model_class)
+            .values([item_create.as_dict() for item_create in items_create])
+            .on_conflict_do_nothing()
+            .returning(self.model_class)
+        )
+        result = await self.session.scalars(query)
+        return result.all()
+
+    @final
+    @override
+    async def copy_many(
+        self,
+        batches: AsyncIterable[Sequence[ItemCreateType]],
+    ) -> tuple[int, int]:
+        table = self.model_class.__table__
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        staging: Table | None = None
+        names: list[str] = []
+        converters: list[Callable[[Any], Any]] = []
+        loaded = 0
+
+        async for batch in batches:
+            if not batch:
+                continue
+
+            if staging is None:
+                names = [field.name for field in fields(batch[0])]
+                converters = [self._get_copy_converter(table.c[name]) for name in names]
+                staging = Table(
+                    f"{table.name}_staging",
+                    MetaData(),
+                    *(Column(name, table.c[name].type) for name in names),
+                    Column("position", BigInteger),
+                    prefixes=["TEMPORARY"],
+                    postgresql_on_commit="DROP",
+                )
+                await connection.run_sync(staging.create)
+
+            await driver_connection.copy_records_to_table(
+                staging.name,
+                records=[
+                    (
+                        *(
+                            convert(getattr(item, name))
+                            for name, convert in zip(names, converters, strict=True)
+                        ),
+                        position,
+                    )
+                    for position, item in enumerate(batch, start=loaded)
+                ],
+                columns=[*names, "position"],
+            )
+            loaded += len(batch)
+
+        if staging is None:
+            return 0, 0
+
+        await self._skip_conflicts()
+        # rows are merged in load order, so the first of duplicated rows wins
+        query = (
+            insert(table)
+            .from_select(
+                names,
+                select(*(staging.c[name] for name in names)).order_by(staging.c.position),
+            )
+            .on_conflict_do_nothing()
+        )
+        result = await connection.execute(query)
+        return loaded, result.rowcount
+
     @final
     @override
     async def read(
@@ -200,6 +555,15 @@ class BaseSqlAlchemyRepository[
     ) -> ModelType | None:
         return await self.session.get(self.model_class, item_id)
 
+    @final
+    @override
+    async def exists(
+        self,
+        item_id: int | UUID,
+    ) -> bool:
+        query = select(exists().where(self._get_id_clause(item_id)))
+        return bool(await self.session.scalar(query))
+
     @final
     @override
     async def update(
@@ -232,35 +596,233 @@ class BaseSqlAlchemyRepository[
         await self.session.delete(item)
         return item
 
+    @final
+    @override
+    async def update_returning[OutputType: BaseDataclass](
+        self,
+        item_id: int | UUID,
+        item_update: ItemUpdateType,
+        output_class: type[OutputType],
+        relation_id: int | UUID | None = None,
+    ) -> OutputType | None:
+        columns = self._get_returning_columns(output_class)
+        table_columns = self.model_class.__table__.columns
+        values = {
+            key: value
+            for key, value in item_update.as_dict(exclude_none=True).items()
+            if key in table_columns
+        }
+
+        if values:
+            query = (
+                update(self.model_class)
+                .where(
+                    self._get_id_clause(item_id),
+                    *self._get_scope_clauses(relation_id),
+                )
+                .values(values)
+                .returning(*columns)
+                .execution_options(synchronize_session=False)
+            )
+        else:
+            query = select(*columns).where(
+                self._get_id_clause(item_id),
+                *self._get_scope_clauses(relation_id),
+            )
+
+        result = await self.session.execute(query)
+        row = result.one_or_none()
+        return None if row is None else output_class.from_object(row._asdict())
+
+    @final
+    @override
+    async def delete_returning[OutputType: BaseDataclass](
+        self,
+        item_id: int | UUID,
+        output_class: type[OutputType],
+        relation_id: int | UUID | None = None,
+    ) -> OutputType | None:
+        query = (
+            delete(self.model_class)
+            .where(
+                self._get_id_clause(item_id),
+                *self._get_scope_clauses(relation_id),
+            )
+            .returning(*self._get_returning_columns(output_class))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        row = result.one_or_none()
+        return None if row is None else output_class.from_object(row._asdict())
+
     @override
     async def read_all(
         self,
         filters: FiltersType,
         relation_id: int | UUID | None,
     ) -> Sequence[ModelType]:
-        query = select(self.model_class)
-        query = await self._filter_query(
-            query=query,
+        query, params = await self._get_filtered_query(
+            base_key=self.model_class,
+            base_query=lambda: select(self.model_class),
             filters=filters,
             relation_id=relation_id,
         )
-        result = await self.session.scalars(query)
+        result = await self.session.scalars(query, params)
         return result.all()
 
+    @override
+    async def read_all_as[OutputType: BaseDataclass](
+        self,
+        filters: FiltersType,
+        output_class: type[OutputType],
+        relation_id: int | UUID | None = None,
+    ) -> Sequence[OutputType]:
+        query, params = await self._get_filtered_query(
+            base_key=output_class,
+            base_query=lambda: select(*self._get_returning_columns(output_class)),
+            filters=filters,
+            relation_id=relation_id,
+        )
+        result = await self.session.execute(query, params)
+        # selected columns follow the order of the dataclass fields
+        return [output_class(*row) for row in result]
+
+    @final
+    @override
+    async def read_many_as[OutputType: BaseDataclass](
+        self,
+        item_ids: Sequence[int | UUID],
+        output_class: type[OutputType],
+        relation_id: int | UUID | None = None,
+    ) -> Sequence[OutputType]:
+        id_column = self.model_class.__mapper__.primary_key[0]
+        # a single array parameter keeps one statement regardless of the number of ids
+        query = select(*self._get_returning_columns(output_class)).where(
+            id_column == any_(bindparam("ids", type_=ARRAY(id_column.type))),
+            *self._get_scope_clauses(relation_id),
+        )
+        result = await self.session.execute(query, {"ids": list(item_ids)})
+        return [output_class(*row) for row in result]
+
+    @override
+    async def stream_all_as[OutputType: BaseDataclass](
+        self,
+        output_class: type[OutputType],
+        relation_id: int | UUID | None = None,
+    ) -> AsyncIterator[Sequence[OutputType]]:
+        query = (
+            select(*self._get_returning_columns(output_class))
+            .where(*self._get_scope_clauses(relation_id))
+            .order_by(self.model_class.__mapper__.primary_key[0])
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        result = await self.session.stream(query)
+
+        async for rows in result.partitions():
+            yield [output_class(*row) for row in rows]
+
+    async def _skip_conflicts(self) -> None:
+        """
+        Prepare the transaction for inserts skipping conflicting items.
+
+        'ON CONFLICT DO NOTHING' only covers unique indexes of the table itself, \
+            uniqueness enforced in another way must be relaxed here.
+        """
+
+    @staticmethod
+    def _get_copy_converter(column: Column[Any]) -> Callable[[Any], Any]:
+        """
+        Get a converter of values to the binary COPY type of the column.
+
+        Parameters
+        ----------
+        column : Column[Any]
+            table column
+
+        Returns
+        -------
+        Callable[[Any], Any]
+            value converter
+        """
+        if column.type.python_type is Decimal:
+            return lambda value: value if value is None else Decimal(str(value))
+        return lambda value: value
+
+    @final
     @classmethod
-    async def _filter_query(
+    def _get_id_clause(
+        cls,
+        item_id: int | UUID,
+    ) -> ColumnElement[bool]:
+        return cls.model_class.__mapper__.primary_key[0] == item_id
+
+    @classmethod
+    def _get_scope_clauses(
+        cls,
+        relation_id: int | UUID | BindParameter[Any] | None,
+    ) -> tuple[ColumnElement[bool], ...]:
+        """
+        Get predicates restricting items to the relationship.
+
+        Parameters
+        ----------
+        relation_id : int | UUID | BindParameter[Any] | None
+            relationship id or its bind parameter, 'None' for no restriction
+
+        Returns
+        -------
+        tuple[ColumnElement[bool], ...]
+            scope predicates
+        """
+        _ = relation_id
+        return ()
+
+    @final
+    @classmethod
+    @cache
+    def _get_returning_columns(
         cls,
-        query: Select[tuple[ModelType]],
+        output_class: type[BaseDataclass],
+    ) -> tuple[InstrumentedAttribute[Any], ...]:
+        """
+        Get the model columns matching the output domain model fields.
+
+        The result is cached per model and domain model pair.
+
+        Parameters
+        ----------
+        output_class : type[BaseDataclass]
+            output domain model
+
+        Returns
+        -------
+        tuple[InstrumentedAttribute[Any], ...]
+            columns to return
+        """
+        return tuple(getattr(cls.model_class, field.name) for field in fields(output_class))
+
+    @final
+    @classmethod
+    async def _get_filtered_query(
+        cls,
+        base_key: Hashable,
+        base_query: Callable[[], Select[Any]],
         filters: FiltersType,
         relation_id: int | UUID | None,
-    ) -> Select[tuple[ModelType]]:
+    ) -> tuple[Select[Any], dict[str, Any]]:
         """
-        Filter a query by the specified search filter.
+        Get a filtered query compiled for the shape of the search filter.
+
+        Queries are cached per base query and filter shape and take all \
+            filter values as bind parameters.
 
         Parameters
         ----------
-        query : Select[tuple[ModelType]]
-            database query expression
+        base_key : Hashable
+            cache key of the base query
+
+        base_query : Callable[[], Select[Any]]
+            base query factory, only called on a cache miss
 
         filters : FiltersType
             item search filter
@@ -270,9 +832,149 @@ class BaseSqlAlchemyRepository[
 
         Returns
         -------
-        Select[tuple[ModelType]]
-            filtered query expression
+        tuple[Select[Any], dict[str, Any]]
+            filtered query expression, bind parameter values
+        """
+        params = cls._get_filter_params(
+            filters=filters,
+            relation_id=relation_id,
+        )
+        shape = (base_key, cls._get_filter_shape(filters, params))
+
+        if (query := cls._query_cache.get(shape)) is not None:
+            FILTER_QUERY_CACHE_HITS.inc()
+            return query, params
+
+        FILTER_QUERY_CACHE_MISSES.inc()
+        query = await cls._filter_query(
+            query=base_query(),
+            filters=filters,
+            params=params,
+        )
+
+        if len(cls._query_cache) < FILTER_QUERY_CACHE_SIZE:
+            cls._query_cache[shape] = query
+
+        return query, params
+
+    @final
+    @classmethod
+    @cache
+    def _get_sort_keys(
+        cls,
+        sort_by: str,
+    ) -> tuple[tuple[InstrumentedAttribute[Any], ...], bool]:
+        """
+        Get the sort columns of a key from the 'sortable_keys' registry.
+
+        Every registered key must be backed by an index, so that ordering \
+            never needs a sort of the whole result. The result is cached per sort key.
+
+        Parameters
+        ----------
+        sort_by : str
+            sort key, prefixed with '-' for descending order
+
+        Returns
+        -------
+        tuple[tuple[InstrumentedAttribute[Any], ...], bool]
+            sort columns, descending order
+
+        Raises
+        ------
+        QueryValueError
+            unknown sort key
+        """
+        key = sort_by.removeprefix("-")
+
+        if (sort_keys := cls.sortable_keys.get(key)) is None:
+            raise exc.QueryValueError(
+                query_value=key,
+                query_key="sort-by",
+            )
+
+        return sort_keys, sort_by.startswith("-")
+
+    @classmethod
+    def _get_filter_params(
+        cls,
+        filters: FiltersType,
+        relation_id: int | UUID | None,
+    ) -> dict[str, Any]:
+        """
+        Get the bind parameter values of the search filter.
+
+        Only predicates that actually restrict the result get a parameter.
+
+        Parameters
+        ----------
+        filters : FiltersType
+            item search filter
+
+        relation_id : int | UUID | None
+            relationship id
+
+        Returns
+        -------
+        dict[str, Any]
+            bind parameter values by name
         """
         _ = filters
         _ = relation_id
+        return {}
+
+    @classmethod
+    def _get_filter_shape(
+        cls,
+        filters: FiltersType,
+        params: dict[str, Any],
+    ) -> Hashable:
+        """
+        Get the part of the search filter that changes the query text.
+
+        Parameters
+        ----------
+        filters : FiltersType
+            item search filter
+
+        params : dict[str, Any]
+            bind parameter values by name
+
+        Returns
+        -------
+        Hashable
+            filter shape
+        """
+        _ = filters
+        return tuple(sorted(params))
+
+    @classmethod
+    async def _filter_query(
+        cls,
+        query: Select[Any],
+        filters: FiltersType,
+        params: dict[str, Any],
+    ) -> Select[Any]:
+        """
+        Filter a query by the specified search filter shape.
+
+        Parameters
+        ----------
+        query : Select[Any]
+            database query expression
+
+        filters : FiltersType
+            item search filter
+
+        params : dict[str, Any]
+            bind parameter values by name, \
+                the query must only refer to them with 'bindparam()'
+
+        Returns
+        -------
+        Select[Any]
+            filtered query expression
+        """
+        _ = filters
+        _ = params
         return query
@@ -2,9 +2,19 @@ from abc import (
     abstractmethod,
 )
 from collections.abc import (
+    AsyncIterator,
+    Hashable,
     Sequence,
 )
+from datetime import (
+    datetime,
+)
+from types import (
+    MappingProxyType,
+)
 from typing import (
+    Any,
+    Final,
     final,
     override,
 )
@@ -15,24 +25,47 @@ from uuid import (
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
 )
+from sqlalchemy.orm import (
+    InstrumentedAttribute,
+)
 from sqlalchemy.sql.expression import (
+    BindParameter,
+    ColumnElement,
     Select,
+    bindparam,
+    delete,
+    func,
+    select,
+    true,
+    tuple_,
 )
 
 import app.core.exceptions as exc
+from app.core.constants import (
+    MOVIE_SEARCH_CONFIG,
+    MOVIE_SKIP_TITLE_CONFLICTS_SETTING,
+)
 from app.database.models import (
     MovieModel,
+    MovieStatsModel,
 )
 from app.database.repositories.base import (
     BaseDatabaseRepository,
     BaseSqlAlchemyRepository,
 )
 from app.domains import (
+    BaseDataclass,
+    CursorDM,
     MovieCreateDM,
     MovieFiltersDM,
+    MovieSearchFiltersDM,
     MovieUpdateDM,
 )
 
+TRIGRAM_LENGTH: Final[int] = 3
+MIN_RATE: Final[float] = 0  # bounds of the 'check_rate_range' constraint
+MAX_RATE: Final[float] = 5
+
 
 class BaseMovieRepository[SessionType](
     BaseDatabaseRepository[
@@ -75,6 +108,70 @@ class BaseMovieRepository[SessionType](
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def search(
+        self,
+        filters: MovieSearchFiltersDM,
+        relation_id: int | UUID,
+    ) -> Sequence[MovieModel]:
+        """
+        Full-text search movies by title and description.
+
+        Parameters
+        ----------
+        filters : MovieSearchFiltersDM
+            movie full-text search filter
+
+        relation_id : int | UUID
+            relationship id
+
+        Returns
+        -------
+        Sequence[MovieModel]
+            list of movies, the most relevant first
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_all(
+        self,
+        relation_id: int | UUID,
+    ) -> Sequence[int | UUID]:
+        """
+        Delete all movies of a user.
+
+        Parameters
+        ----------
+        relation_id : int | UUID
+            relationship id
+
+        Returns
+        -------
+        Sequence[int | UUID]
+            ids of the deleted movies
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def read_stats(
+        self,
+        relation_id: int | UUID,
+    ) -> MovieStatsModel | None:
+        """
+        Read the precomputed movie statistics of a user.
+
+        Parameters
+        ----------
+        relation_id : int | UUID
+            relationship id
+
+        Returns
+        -------
+        MovieStatsModel | None
+            statistics, 'None' if the user has never had a movie
+        """
+        raise NotImplementedError
+
 
 @final
 class MovieRepository(
@@ -89,6 +186,16 @@ class MovieRepository(
     """SqlAlchemy movie repository."""
 
     model_class = MovieModel
+    # every key is served by the 'ix_movies_user_id_<columns>' index
+    sortable_keys = MappingProxyType(
+        {
+            "id": (MovieModel.id,),
+            "title": (MovieModel.title,),  # unique, needs no tiebreaker
+            "rate": (MovieModel.rate, MovieModel.id),
+            "created_at": (MovieModel.created_at, MovieModel.id),
+            "updated_at": (MovieModel.updated_at, MovieModel.id),
+        },
+    )
 
     @override
     async def read_all(
@@ -108,37 +215,292 @@ class MovieRepository(
             relation_id=relation_id,
         )
 
+    @override
+    async def read_all_as[OutputType: BaseDataclass](
+        self,
+        filters: MovieFiltersDM,
+        output_class: type[OutputType],
+        relation_id: int | UUID | None = None,
+    ) -> Sequence[OutputType]:
+        if relation_id is None:
+            exc_msg = (
+                f"{self.model_class}.read_all_as() missing 1 required argument: 'relation_id'"
+            )
+            raise TypeError(exc_msg)
+
+        return await super().read_all_as(
+            filters=filters,
+            output_class=output_class,
+            relation_id=relation_id,
+        )
+
+    @override
+    async def stream_all_as[OutputType: BaseDataclass](
+        self,
+        output_class: type[OutputType],
+        relation_id: int | UUID | None = None,
+    ) -> AsyncIterator[Sequence[OutputType]]:
+        if relation_id is None:
+            exc_msg = (
+                f"{self.model_class}.stream_all_as() missing 1 required "
+                "argument: 'relation_id'"
+            )
+            raise TypeError(exc_msg)
+
+        async for batch in super().stream_all_as(
+            output_class=output_class,
+            relation_id=relation_id,
+        ):
+            yield batch
+
+    @override
+    async def search(
+        self,
+        filters: MovieSearchFiltersDM,
+        relation_id: int | UUID,
+    ) -> Sequence[MovieModel]:
+        query, params = await self._get_filtered_query(
+            base_key="search",
+            base_query=self._get_search_query,
+            filters=filters,
+            relation_id=relation_id,
+        )
+        params["query"] = filters.query
+        result = await self.session.scalars(query, params)
+        return result.all()
+
+    @override
+    async def delete_all(
+        self,
+        relation_id: int | UUID,
+    ) -> Sequence[int | UUID]:
+        query = (
+            delete(self.model_class)
+            .where(*self._get_scope_clauses(relation_id))
+            .returning(self.model_class.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.scalars(query)
+        return result.all()
+
+    @override
+    async def read_stats(
+        self,
+        relation_id: int | UUID,
+    ) -> MovieStatsModel | None:
+        return await self.session.scalar(
+            select(MovieStatsModel).where(MovieStatsModel.user_id == relation_id),
+        )
+
+    @classmethod
+    def _get_search_query(cls) -> Select[tuple[MovieModel]]:
+        ts_query = func.websearch_to_tsquery(MOVIE_SEARCH_CONFIG, bindparam("query"))
+        return (
+            select(cls.model_class)
+            .where(cls.model_class.search_vector.bool_op("@@")(ts_query))
+            .order_by(func.ts_rank(cls.model_class.search_vector, ts_query).desc())
+        )
+
     @classmethod
     @override
-    async def _filter_query(
+    def _get_filter_params(
         cls,
-        query: Select[tuple[MovieModel]],
         filters: MovieFiltersDM,
         relation_id: int | UUID | None,
-    ) -> Select[tuple[MovieModel]]:
-        query = query.where(cls.model_class.user_id == relation_id)
+    ) -> dict[str, Any]:
+        sort_keys, _ = cls._get_sort_keys(filters.sort_by)
+        params: dict[str, Any] = {"limit": filters.limit}
+
+        if relation_id is not None:
+            params["relation_id"] = relation_id
+
+        # a cursor page starts after the cursor, never at an offset
+        if filters.offset and filters.cursor is None:
+            params["offset"] = filters.offset
 
         if (title := filters.title_contains) is not None:
-            query = query.where(cls.model_class.title.ilike(f"%{title}%"))
-
-        if hasattr(cls.model_class, filters.sort_by.removeprefix("-")):
-            sort_attr = getattr(cls.model_class, filters.sort_by.removeprefix("-"))
-        else:
-            raise exc.QueryValueError(
-                query_value=filters.sort_by.removeprefix("-"),
-                query_key="sort-by",
-            )
+            # shorter patterns yield no trigrams for the 'ix_movies_title_trgm' index
+            if len(title) < TRIGRAM_LENGTH:
+                params["title_lower"] = title.lower()
+            else:
+                params["title_pattern"] = f"%{cls._escape_like(title)}%"
 
-        sort_by = sort_attr.desc() if filters.sort_by.startswith("-") else sort_attr.asc()
+        if filters.rate_from > MIN_RATE:
+            params["rate_from"] = filters.rate_from
 
-        return (
-            query.where(
-                cls.model_class.rate.between(
-                    cleft=filters.rate_from,
-                    cright=filters.rate_to,
-                ),
+        if filters.rate_to < MAX_RATE:
+            params["rate_to"] = filters.rate_to
+
+        if (cursor := filters.cursor) is not None:
+            params.update(cls._get_cursor_params(cursor, filters.sort_by, sort_keys))
+
+        return params
+
+    @classmethod
+    @override
+    def _get_filter_shape(
+        cls,
+        filters: MovieFiltersDM,
+        params: dict[str, Any],
+    ) -> Hashable:
+        return (filters.sort_by, *sorted(params))
+
+    @classmethod
+    @override
+    async def _filter_query(
+        cls,
+        query: Select[Any],
+        filters: MovieFiltersDM,
+        params: dict[str, Any],
+    ) -> Select[Any]:
+        if "relation_id" in params:
+            query = query.where(*cls._get_scope_clauses(bindparam("relation_id")))
+
+        if "title_lower" in params:
+            query = query.where(
+                func.strpos(func.lower(cls.model_class.title), bindparam("title_lower")) > 0,
             )
-            .order_by(sort_by)
-            .limit(filters.limit)
-            .offset(filters.offset)
+
+        if "title_pattern" in params:
+            query = query.where(
+                cls.model_class.title.ilike(bindparam("title_pattern"), escape="\\"),
+            )
+
+        if "rate_from" in params:
+            query = query.where(cls.model_class.rate >= bindparam("rate_from"))
+
+        if "rate_to" in params:
+            query = query.where(cls.model_class.rate <= bindparam("rate_to"))
+
+        sort_keys, is_desc = cls._get_sort_keys(filters.sort_by)
+
+        if filters.cursor is not None:
+            query = query.where(cls._get_seek_clause(sort_keys, is_desc=is_desc))
+
+        query = query.order_by(*(key.desc() if is_desc else key.asc() for key in sort_keys))
+        query = query.limit(bindparam("limit"))
+
+        if "offset" in params:
+            query = query.offset(bindparam("offset"))
+
+        return query
+
+    @override
+    async def _skip_conflicts(self) -> None:
+        # titles are claimed in 'movie_titles' by a trigger, this makes it skip
+        # rows with a taken title instead of raising, for this transaction only
+        await self.session.execute(
+            select(func.set_config(MOVIE_SKIP_TITLE_CONFLICTS_SETTING, "on", true())),
+        )
+
+    @classmethod
+    @override
+    def _get_scope_clauses(
+        cls,
+        relation_id: int | UUID | BindParameter[Any] | None,
+    ) -> tuple[ColumnElement[bool], ...]:
+        if relation_id is None:
+            return ()
+        return (cls.model_class.user_id == relation_id,)
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    @classmethod
+    def _get_cursor_params(
+        cls,
+        cursor: str,
+        sort_by: str,
+        sort_keys: tuple[InstrumentedAttribute[Any], ...],
+    ) -> dict[str, Any]:
+        """
+        Get the bind parameter values of the row the cursor points to.
+
+        Parameters
+        ----------
+        cursor : str
+            opaque pagination cursor
+
+        sort_by : str
+            requested sort key, must match the cursor
+
+        sort_keys : tuple[InstrumentedAttribute[Any], ...]
+            sort columns of the key
+
+        Returns
+        -------
+        dict[str, Any]
+            'cursor_id' and/or 'cursor_value', one per sort column
+
+        Raises
+        ------
+        InvalidCursorError
+            malformed cursor or cursor issued for another sort key
+        """
+        try:
+            cursor_dm = CursorDM.decode(cursor)
+
+            if cursor_dm.sort_by != sort_by:
+                raise ValueError  # noqa: TRY301
+
+            params = {
+                cls._get_cursor_param_name(key): cls._coerce_cursor_value(
+                    key,
+                    cursor_dm.id if key is cls.model_class.id else cursor_dm.value,
+                )
+                for key in sort_keys
+            }
+        except (TypeError, ValueError):
+            raise exc.InvalidCursorError from None
+
+        return params
+
+    @classmethod
+    def _get_cursor_param_name(
+        cls,
+        column: InstrumentedAttribute[Any],
+    ) -> str:
+        return "cursor_id" if column is cls.model_class.id else "cursor_value"
+
+    @classmethod
+    def _get_seek_clause(
+        cls,
+        sort_keys: tuple[InstrumentedAttribute[Any], ...],
+        *,
+        is_desc: bool,
+    ) -> ColumnElement[bool]:
+        """
+        Get a keyset predicate that continues after the cursor row.
+
+        Parameters
+        ----------
+        sort_keys : tuple[InstrumentedAttribute[Any], ...]
+            sort columns, unique as a whole
+
+        is_desc : bool
+            descending sort direction
+
+        Returns
+        -------
+        ColumnElement[bool]
+            seek predicate over the 'cursor_value' and 'cursor_id' parameters
+        """
+        values = tuple(
+            bindparam(cls._get_cursor_param_name(key), type_=key.type) for key in sort_keys
         )
+
+        if is_desc:
+            return tuple_(*sort_keys) < tuple_(*values)
+        return tuple_(*sort_keys) > tuple_(*values)
+
+    @staticmethod
+    def _coerce_cursor_value(
+        column: InstrumentedAttribute[Any],
+        value: Any,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        python_type = column.type.python_type
+
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        return python_type(value)
@@ -2,9 +2,14 @@ from abc import (
     abstractmethod,
 )
 from collections.abc import (
+    Hashable,
     Sequence,
 )
+from types import (
+    MappingProxyType,
+)
 from typing import (
+    Any,
     final,
     override,
 )
@@ -17,10 +22,10 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.sql.expression import (
     Select,
+    bindparam,
     select,
 )
 
-import app.core.exceptions as exc
 from app.database.models import (
     UserModel,
 )
@@ -105,6 +110,14 @@ class UserRepository(
     """SqlAlchemy user repository."""
 
     model_class = UserModel
+    # every key is served by the primary key or an 'ix_users_<columns>' index
+    sortable_keys = MappingProxyType(
+        {
+            "id": (UserModel.id,),
+            "username": (UserModel.username,),  # unique, needs no tiebreaker
+            "created_at": (UserModel.created_at, UserModel.id),
+        },
+    )
 
     @override
     async def read_by_name(
@@ -128,26 +141,53 @@ class UserRepository(
 
     @classmethod
     @override
-    async def _filter_query(
+    def _get_filter_params(
         cls,
-        query: Select[tuple[UserModel]],
         filters: UserFiltersDM,
         relation_id: int | UUID | None,
-    ) -> Select[tuple[UserModel]]:
+    ) -> dict[str, Any]:
+        cls._get_sort_keys(filters.sort_by)
+        params: dict[str, Any] = {"limit": filters.limit}
+
+        if filters.offset:
+            params["offset"] = filters.offset
+
         if (username := filters.username_contains) is not None:
-            query = query.where(cls.model_class.username.ilike(f"%{username}%"))
+            params["username_pattern"] = f"%{username}%"
 
         if (roles := filters.role) is not None:
-            query = query.where(cls.model_class.role.in_(roles))
+            params["roles"] = roles
+
+        return params
+
+    @classmethod
+    @override
+    def _get_filter_shape(
+        cls,
+        filters: UserFiltersDM,
+        params: dict[str, Any],
+    ) -> Hashable:
+        return (filters.sort_by, *sorted(params))
+
+    @classmethod
+    @override
+    async def _filter_query(
+        cls,
+        query: Select[Any],
+        filters: UserFiltersDM,
+        params: dict[str, Any],
+    ) -> Select[Any]:
+        if "username_pattern" in params:
+            query = query.where(cls.model_class.username.ilike(bindparam("username_pattern")))
+
+        if "roles" in params:
+            query = query.where(cls.model_class.role.in_(bindparam("roles", expanding=True)))
 
-        if hasattr(cls.model_class, filters.sort_by.removeprefix("-")):
-            sort_attr = getattr(cls.model_class, filters.sort_by.removeprefix("-"))
-        else:
-            raise exc.QueryValueError(
-                query_value=filters.sort_by.removeprefix("-"),
-                query_key="sort-by",
-            )
+        sort_keys, is_desc = cls._get_sort_keys(filters.sort_by)
+        query = query.order_by(*(key.desc() if is_desc else key.asc() for key in sort_keys))
+        query = query.limit(bindparam("limit"))
 
-        sort_by = sort_attr.desc() if filters.sort_by.startswith("-") else sort_attr.asc()
+        if "offset" in params:
+            query = query.offset(bindparam("offset"))
 
-        return query.order_by(sort_by).limit(filters.limit).offset(filters.offset)
+        return query
@@ -2,6 +2,9 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from collections.abc import (
+    Hashable,
+)
 from types import (
     TracebackType,
 )
@@ -25,6 +28,20 @@ from app.database.repositories import (
 class BaseUOW(ABC):
     """Basic abstract unit-of-work class."""
 
+    @property
+    def read_only(self) -> bool:
+        """
+        Check whether the unit of work only reads.
+
+        Read-only work is never committed.
+
+        Returns
+        -------
+        bool
+            read-only mode
+        """
+        return False
+
     async def __aenter__(self) -> Self:
         """
         Enter to the asynchronous UOW manager.
@@ -56,10 +73,10 @@ class BaseUOW(ABC):
         exc_tb : TracebackType | None
             traceback
         """
-        if exc_type is None:
-            await self.commit()
-        else:
+        if exc_type is not None:
             await self.rollback()
+        elif not self.read_only:
+            await self.commit()
 
     @abstractmethod
     async def commit(self) -> None:
@@ -102,3 +119,35 @@ class BaseDatabaseUOW[
             database manager
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def __call__(
+        self,
+        *,
+        read_only: bool = False,
+        pin_key: Hashable | None = None,
+        primary: bool = False,
+    ) -> Self:
+        """
+        Configure the next unit of work.
+
+        Parameters
+        ----------
+        read_only : bool, optional
+            run the work outside a transaction on a read replica \
+                and skip the commit, by default False
+
+        pin_key : Hashable | None, optional
+            key of the user doing the work: reads of a recent writer are kept \
+                on the primary, by default None
+
+        primary : bool, optional
+            keep read-only work on the primary, for results outliving \
+                the request that must not lag behind a change, by default False
+
+        Returns
+        -------
+        Self
+            self instance
+        """
+        raise NotImplementedError
@@ -1,3 +1,8 @@
+import asyncio
+import math
+from collections.abc import (
+    Hashable,
+)
 from types import (
     TracebackType,
 )
@@ -12,10 +17,19 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
 )
+from sqlalchemy.sql.expression import (
+    func,
+    select,
+    true,
+)
 
 import app.core.exceptions as exc
 from app.core.config import (
     SqlAlchemyConfig,
+    settings,
+)
+from app.core.timeout import (
+    db_deadline,
 )
 from app.database.db_managers import (
     SqlAlchemyDatabaseManager,
@@ -41,7 +55,15 @@ class SqlAlchemyUOW(
 ):
     """SqlAlchemy unit-of-work."""
 
-    __slots__ = ("_session", "_session_factory")
+    __slots__ = (
+        "_database_manager",
+        "_deadline",
+        "_pin_key",
+        "_primary",
+        "_read_only",
+        "_session",
+        "_timeout",
+    )
 
     @override
     def __init__(
@@ -49,13 +71,69 @@ class SqlAlchemyUOW(
         database_manager: SqlAlchemyDatabaseManager,
     ) -> None:
         self._session: AsyncSession | None = None
-        self._session_factory = database_manager.session_factory
+        self._database_manager = database_manager
+        self._read_only = False
+        self._pin_key: Hashable | None = None
+        self._primary = False
+        self._deadline: float | None = None
+        self._timeout: asyncio.Timeout | None = None
+
+    @override
+    def __call__(
+        self,
+        *,
+        read_only: bool = False,
+        pin_key: Hashable | None = None,
+        primary: bool = False,
+    ) -> Self:
+        self._read_only = read_only
+        self._pin_key = pin_key
+        self._primary = primary
+        return self
+
+    @property
+    @override
+    def read_only(self) -> bool:
+        return self._read_only
 
     @override
     async def __aenter__(self) -> Self:
-        self._session = self._session_factory()
+        # the whole unit-of-work shares the request deadline, a cancelled
+        # asyncpg query is also cancelled on the server
+        self._deadline = db_deadline.get()
+        if self._deadline is not None:
+            self._timeout = asyncio.timeout(self._deadline)
+            await self._timeout.__aenter__()
+
+        if self._read_only:
+            session_factory = await self._database_manager.read_session_factory(
+                self._pin_key,
+                primary=self._primary,
+            )
+        else:
+            session_factory = self._database_manager.session_factory
+
+        self._session = session_factory()
         self.users = UserRepository(self._session)
         self.movies = MovieRepository(self._session)
+
+        # the server-side cap of every statement must not end a longer
+        # deadline early, it is raised for this transaction only
+        if (
+            self._deadline is not None
+            and (statement_timeout := math.ceil(self._deadline * 1000))
+            > settings.db.sqla.statement_timeout
+        ):
+            try:
+                await self._session.execute(
+                    select(
+                        func.set_config("statement_timeout", str(statement_timeout), true())
+                    ),
+                )
+            except BaseException as error:
+                await self.__aexit__(type(error), error, error.__traceback__)
+                raise
+
         return await super().__aenter__()
 
     @override
@@ -83,17 +161,42 @@ class SqlAlchemyUOW(
         ------
         DatabaseSessionError
             session is not initialized
+
+        DatabaseTimeoutError
+            unit-of-work has exceeded the request deadline
         """
         if self._session is None:
             raise exc.DatabaseSessionError
 
-        await super().__aexit__(
-            exc_type=exc_type,
-            exc_val=exc_val,
-            exc_tb=exc_tb,
-        )
-        await self._session.close()
-        self._session = None
+        pin_key = None if self._read_only else self._pin_key
+        deadline, timeout = self._deadline, self._timeout
+        self._deadline, self._timeout = None, None
+
+        # commit and rollback are never interrupted halfway
+        if timeout is not None and not timeout.expired():
+            timeout.reschedule(None)
+
+        try:
+            await super().__aexit__(
+                exc_type=exc_type,
+                exc_val=exc_val,
+                exc_tb=exc_tb,
+            )
+        finally:
+            await self._session.close()
+            self._session = None
+            self._read_only = False
+            self._pin_key = None
+            self._primary = False
+
+        if timeout is not None and deadline is not None:
+            try:
+                await timeout.__aexit__(exc_type, exc_val, exc_tb)
+            except TimeoutError as error:
+                raise exc.DatabaseTimeoutError(deadline) from error
+
+        if exc_type is None and pin_key is not None:
+            await self._database_manager.pin_primary(pin_key)
 
     @override
     async def commit(self) -> None:
@@ -1,10 +1,18 @@
 __all__ = (
     "BaseDataclass",
+    "CursorDM",
+    "DataFormat",
     "DataclassType",
+    "MovieBatchOutputDM",
+    "MovieBulkErrorDM",
+    "MovieBulkOutputDM",
     "MovieCreateDM",
     "MovieFiltersDM",
+    "MovieImportOutputDM",
     "MovieInputDM",
     "MovieOutputDM",
+    "MovieSearchFiltersDM",
+    "MovieStatsDM",
     "MovieUpdateDM",
     "UserCreateDM",
     "UserFiltersDM",
@@ -20,11 +28,23 @@ from app.domains.base import (
     BaseDataclass,
     DataclassType,
 )
+from app.domains.cursor import (
+    CursorDM,
+)
+from app.domains.data_format import (
+    DataFormat,
+)
 from app.domains.movie import (
+    MovieBatchOutputDM,
+    MovieBulkErrorDM,
+    MovieBulkOutputDM,
     MovieCreateDM,
     MovieFiltersDM,
+    MovieImportOutputDM,
     MovieInputDM,
     MovieOutputDM,
+    MovieSearchFiltersDM,
+    MovieStatsDM,
     MovieUpdateDM,
 )
 from app.domains.user import (
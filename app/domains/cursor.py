@@ -0,0 +1,88 @@
+import base64
+import binascii
+from dataclasses import (
+    dataclass,
+)
+from decimal import (
+    Decimal,
+)
+from typing import (
+    Any,
+    Self,
+)
+from uuid import (
+    UUID,
+)
+
+import orjson
+
+from app.domains.base import (
+    BaseDataclass,
+)
+
+
+def _serialize_default(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, Decimal):
+        return str(value)
+
+    raise TypeError
+
+
+@dataclass(slots=True, frozen=True)
+class CursorDM(BaseDataclass):
+    """Domain model of a keyset pagination cursor."""
+
+    sort_by: str
+    value: Any
+    id: int | UUID
+
+    def encode(self) -> str:
+        """
+        Encode the cursor into an opaque string.
+
+        Returns
+        -------
+        str
+            url-safe cursor string
+        """
+        raw = orjson.dumps(
+            [self.sort_by, self.value, self.id],
+            default=_serialize_default,
+        )
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(
+        cls,
+        cursor: str,
+    ) -> Self:
+        """
+        Decode the cursor from an opaque string.
+
+        Parameters
+        ----------
+        cursor : str
+            url-safe cursor string
+
+        Returns
+        -------
+        Self
+            cursor instance
+
+        Raises
+        ------
+        ValueError
+            malformed cursor
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            sort_by, value, item_id = orjson.loads(raw)
+        except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+            exc_msg = f"Malformed cursor: {cursor!r}"
+            raise ValueError(exc_msg) from None
+
+        return cls(
+            sort_by=sort_by,
+            value=value,
+            id=item_id,
+        )
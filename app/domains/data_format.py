@@ -0,0 +1,26 @@
+from enum import (
+    StrEnum,
+)
+
+
+class DataFormat(StrEnum):
+    """Formats of bulk data exchange."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        """
+        Get the media type of the format.
+
+        Returns
+        -------
+        str
+            media type
+        """
+        match self:
+            case DataFormat.NDJSON:
+                return "application/x-ndjson"
+            case DataFormat.CSV:
+                return "text/csv"
@@ -1,3 +1,6 @@
+from collections.abc import (
+    Sequence,
+)
 from dataclasses import (
     dataclass,
 )
@@ -57,3 +60,56 @@ class MovieFiltersDM(BaseDataclass):
     rate_from: float
     rate_to: float
     title_contains: str | None
+    cursor: str | None
+
+
+@dataclass(slots=True, frozen=True)
+class MovieSearchFiltersDM(MovieFiltersDM):
+    """Domain model of full-text searching a movie."""
+
+    query: str
+
+
+@dataclass(slots=True, frozen=True)
+class MovieBulkErrorDM(BaseDataclass):
+    """Domain model of a movie rejected from a bulk creation."""
+
+    index: int
+    title: str
+    detail: str
+
+
+@dataclass(slots=True, frozen=True)
+class MovieBulkOutputDM(BaseDataclass):
+    """Domain model of returning a bulk movie creation."""
+
+    created: Sequence[MovieOutputDM]
+    errors: Sequence[MovieBulkErrorDM]
+
+
+@dataclass(slots=True, frozen=True)
+class MovieImportOutputDM(BaseDataclass):
+    """Domain model of a movie import summary."""
+
+    inserted: int
+    skipped: int
+    invalid: int
+
+
+@dataclass(slots=True, frozen=True)
+class MovieBatchOutputDM(BaseDataclass):
+    """Domain model of movies fetched by ids."""
+
+    movies: Sequence[MovieOutputDM]
+    missing: Sequence[int | UUID]
+
+
+@dataclass(slots=True, frozen=True)
+class MovieStatsDM(BaseDataclass):
+    """Domain model of a user's movie statistics."""
+
+    count: int
+    average_rate: float | None
+    rate_histogram: Sequence[int]
+    newest_created_at: datetime | None
+    oldest_created_at: datetime | None
@@ -12,6 +12,10 @@ from loguru import (
     logger,
 )
 
+from app.cache import (
+    cache_bus,
+    cache_redis,
+)
 from app.core import (
     settings,
 )
@@ -55,9 +59,17 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[None]:
     await database_manager.init(
         url=settings.db.async_url,
         db_config=settings.db.sqla,
+        replica_urls=settings.db.replica_async_urls,
+        pin_store=cache_redis,
     )
     logger.info("Connection to database complete.")
 
+    # ---------------------------------------------------------------------------
+    # Cache
+    # ---------------------------------------------------------------------------
+    logger.info("Subscribing to cache invalidations...")
+    await cache_bus.start()
+
     # ===========================================================================
 
     yield
@@ -72,3 +84,11 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[None]:
     logger.info("Disconnecting from the database...")
     await database_manager.close()
     logger.info("Disconnection from the database complete.")
+
+    # ---------------------------------------------------------------------------
+    # Cache
+    # ---------------------------------------------------------------------------
+    logger.info("Disconnecting from the cache...")
+    await cache_bus.stop()
+    await cache_redis.aclose()
+    logger.info("Disconnection from the cache complete.")
@@ -2,8 +2,16 @@ from abc import (
     abstractmethod,
 )
 from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
     Sequence,
 )
+from dataclasses import (
+    replace,
+)
+from functools import (
+    partial,
+)
 from typing import (
     Final,
     final,
@@ -14,11 +22,32 @@ from uuid import (
 )
 
 import app.core.exceptions as exc
+from app.cache import (
+    BaseCache,
+    RedisGenerationCache,
+    SingleFlight,
+)
+from app.core.constants import (
+    MOVIE_IMPORT_BATCH_SIZE,
+    MOVIE_RATE_HISTOGRAM_BUCKETS,
+)
+from app.database.db_managers import (
+    SqlAlchemyDatabaseManager,
+)
+from app.database.unit_of_works import (
+    SqlAlchemyUOW,
+)
 from app.domains import (
+    MovieBatchOutputDM,
+    MovieBulkErrorDM,
+    MovieBulkOutputDM,
     MovieCreateDM,
     MovieFiltersDM,
+    MovieImportOutputDM,
     MovieInputDM,
     MovieOutputDM,
+    MovieSearchFiltersDM,
+    MovieStatsDM,
     MovieUpdateDM,
 )
 from app.services.base import (
@@ -27,6 +56,7 @@ from app.services.base import (
 )
 
 MovieNotFoundError: Final[Exception] = exc.ResourceNotFoundError("Movie not found.")
+MOVIE_TITLE_CONFLICT_DETAIL: Final[str] = "Movie with this title already exists."
 
 
 class BaseMovieService(BaseService):
@@ -56,6 +86,61 @@ class BaseMovieService(BaseService):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_movies(
+        self,
+        movies_input: Sequence[MovieInputDM],
+        user_id: UUID,
+    ) -> MovieBulkOutputDM:
+        """
+        Create new movies in bulk.
+
+        Movies with an already taken title are reported as errors \
+            without aborting the rest of the batch.
+
+        Parameters
+        ----------
+        movies_input : Sequence[MovieInputDM]
+            movies data to create
+
+        user_id : UUID
+            user id
+
+        Returns
+        -------
+        MovieBulkOutputDM
+            created movies and per-item errors
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def import_movies(
+        self,
+        movies_input: AsyncIterable[MovieInputDM | None],
+        user_id: UUID,
+    ) -> MovieImportOutputDM:
+        """
+        Import movies from a stream of parsed rows.
+
+        Rows are copied in batches into a staging table and merged into \
+            the movies in a single transaction. The stream is consumed \
+            while a connection is held, so it must not wait on a client.
+
+        Parameters
+        ----------
+        movies_input : AsyncIterable[MovieInputDM | None]
+            movies data to import, None for rows that failed validation
+
+        user_id : UUID
+            user id
+
+        Returns
+        -------
+        MovieImportOutputDM
+            numbers of inserted, skipped and invalid rows
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_all_movies(
         self,
@@ -80,10 +165,132 @@ class BaseMovieService(BaseService):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_all_movies_tag(
+        self,
+        user_id: UUID,
+        filters: MovieFiltersDM,
+    ) -> str | None:
+        """
+        Get a tag of a user's filtered movies without reading them.
+
+        Parameters
+        ----------
+        user_id : UUID
+            relation user id
+
+        filters : MovieFiltersDM
+            movie search filter
+
+        Returns
+        -------
+        str | None
+            tag changing whenever the movies do, 'None' if unknown
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def export_movies(
+        self,
+        user_id: UUID,
+    ) -> AsyncIterator[Sequence[MovieOutputDM]]:
+        """
+        Stream all of a user's movies.
+
+        The unit of work stays open until the stream is exhausted or closed.
+
+        Parameters
+        ----------
+        user_id : UUID
+            relation user id
+
+        Yields
+        ------
+        Sequence[MovieOutputDM]
+            batch of movies ordered by id
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search_movies(
+        self,
+        user_id: UUID,
+        filters: MovieSearchFiltersDM,
+    ) -> Sequence[MovieOutputDM]:
+        """
+        Full-text search a user's movies.
+
+        Parameters
+        ----------
+        user_id : UUID
+            relation user id
+
+        filters : MovieSearchFiltersDM
+            movie full-text search filter
+
+        Returns
+        -------
+        Sequence[MovieOutputDM]
+            list of movies, the most relevant first
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_movie_stats(
+        self,
+        user_id: UUID,
+    ) -> MovieStatsDM:
+        """
+        Get a user's movie statistics.
+
+        Statistics are maintained on every write, so reading them does not \
+            aggregate the user's movies.
+
+        Parameters
+        ----------
+        user_id : UUID
+            relation user id
+
+        Returns
+        -------
+        MovieStatsDM
+            movie statistics
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_movies(
+        self,
+        movie_ids: Sequence[int | UUID],
+        user_id: UUID | None,
+        actor_id: UUID,
+    ) -> MovieBatchOutputDM:
+        """
+        Get movies by ids in a single query.
+
+        Parameters
+        ----------
+        movie_ids : Sequence[int | UUID]
+            movies ids
+
+        user_id : UUID | None
+            id of the user the movies must belong to, 'None' for any user
+
+        actor_id : UUID
+            reading user id, sees own writes immediately
+
+        Returns
+        -------
+        MovieBatchOutputDM
+            found movies in request order and ids of missing ones
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_movie(
         self,
         movie_id: int | UUID,
+        user_id: UUID,
     ) -> MovieOutputDM:
         """
         Get a movie by id.
@@ -93,6 +300,9 @@ class BaseMovieService(BaseService):
         movie_id : int | UUID
             movie id
 
+        user_id : UUID
+            requesting user id, sees own writes immediately
+
         Returns
         -------
         MovieOutputDM
@@ -110,6 +320,8 @@ class BaseMovieService(BaseService):
         self,
         movie_id: int | UUID,
         movie_update: MovieUpdateDM,
+        user_id: UUID | None,
+        actor_id: UUID,
     ) -> MovieOutputDM:
         """
         Update a movie by id.
@@ -122,6 +334,12 @@ class BaseMovieService(BaseService):
         movie_update : MovieUpdateDM
             movie data to update
 
+        user_id : UUID | None
+            owner id the movie must belong to, 'None' for any owner
+
+        actor_id : UUID
+            acting user id, whose reads are pinned after the change
+
         Returns
         -------
         MovieOutputDM
@@ -131,6 +349,9 @@ class BaseMovieService(BaseService):
         ------
         MovieNotFoundError
             movie not found
+
+        ResourceOwnershipError
+            movie belongs to another user
         """
         raise NotImplementedError
 
@@ -138,6 +359,8 @@ class BaseMovieService(BaseService):
     async def delete_movie(
         self,
         movie_id: int | UUID,
+        user_id: UUID | None,
+        actor_id: UUID,
     ) -> MovieOutputDM:
         """
         Delete a movie by id.
@@ -147,6 +370,12 @@ class BaseMovieService(BaseService):
         movie_id : int | UUID
             movie id
 
+        user_id : UUID | None
+            owner id the movie must belong to, 'None' for any owner
+
+        actor_id : UUID
+            acting user id, whose reads are pinned after the change
+
         Returns
         -------
         MovieOutputDM
@@ -156,6 +385,9 @@ class BaseMovieService(BaseService):
         ------
         MovieNotFoundError
             movie not found
+
+        ResourceOwnershipError
+            movie belongs to another user
         """
         raise NotImplementedError
 
@@ -167,6 +399,49 @@ class MovieService(
 ):
     """SqlAlchemy movie service."""
 
+    __slots__ = ("database_manager", "listing_cache", "movie_cache", "movie_flight")
+
+    @override
+    def __init__(
+        self,
+        uow_class: type[SqlAlchemyUOW],
+        database_manager: SqlAlchemyDatabaseManager,
+        movie_cache: BaseCache[int | UUID, MovieOutputDM] | None = None,
+        listing_cache: RedisGenerationCache[MovieOutputDM] | None = None,
+        movie_flight: SingleFlight[str, MovieOutputDM] | None = None,
+    ) -> None:
+        """
+        Initialize the movie service.
+
+        Parameters
+        ----------
+        uow_class : type[SqlAlchemyUOW]
+            sqlalchemy database unit-of-work class
+
+        database_manager : SqlAlchemyDatabaseManager
+            sqlalchemy database manager
+
+        movie_cache : BaseCache[int | UUID, MovieOutputDM] | None, optional
+            read-through cache of single movies, invalidated after \
+                committed changes, by default None
+
+        listing_cache : RedisGenerationCache[MovieOutputDM] | None, optional
+            cache of filtered listings per user, invalidated as a whole \
+                after committed changes of the user's movies, by default None
+
+        movie_flight : SingleFlight[str, MovieOutputDM] | None, optional
+            coalescing of concurrent reads of a movie missing \
+                from the cache, by default None
+        """
+        super().__init__(
+            uow_class=uow_class,
+            database_manager=database_manager,
+        )
+        self.database_manager = database_manager
+        self.movie_cache = movie_cache
+        self.listing_cache = listing_cache
+        self.movie_flight = movie_flight
+
     @override
     async def create_movie(
         self,
@@ -179,9 +454,95 @@ class MovieService(
             user_id=user_id,
         )
 
-        async with self.uow as uow:
+        async with self.uow(pin_key=user_id) as uow:
             movie = await uow.movies.create(movie_create)
-            return MovieOutputDM.from_object(movie)
+            movie_output = MovieOutputDM.from_object(movie)
+
+        await self._invalidate(user_id)
+        return movie_output
+
+    @override
+    async def create_movies(
+        self,
+        movies_input: Sequence[MovieInputDM],
+        user_id: UUID,
+    ) -> MovieBulkOutputDM:
+        movies_create = [
+            MovieCreateDM.from_object(
+                movie_input,
+                none_if_key_not_found=True,
+                user_id=user_id,
+            )
+            for movie_input in movies_input
+        ]
+
+        async with self.uow(pin_key=user_id) as uow:
+            movies = await uow.movies.create_many(movies_create)
+
+        await self._invalidate(user_id)
+
+        created_titles = {movie.title for movie in movies}
+        errors: list[MovieBulkErrorDM] = []
+
+        for index, movie_create in enumerate(movies_create):
+            # only the first occurrence of a title within the batch is inserted
+            if movie_create.title in created_titles:
+                created_titles.remove(movie_create.title)
+            else:
+                errors.append(
+                    MovieBulkErrorDM(
+                        index=index,
+                        title=movie_create.title,
+                        detail=MOVIE_TITLE_CONFLICT_DETAIL,
+                    ),
+                )
+
+        return MovieBulkOutputDM(
+            created=[MovieOutputDM.from_object(movie) for movie in movies],
+            errors=errors,
+        )
+
+    @override
+    async def import_movies(
+        self,
+        movies_input: AsyncIterable[MovieInputDM | None],
+        user_id: UUID,
+    ) -> MovieImportOutputDM:
+        invalid = 0
+
+        async def batches() -> AsyncIterator[Sequence[MovieCreateDM]]:
+            nonlocal invalid
+            batch: list[MovieCreateDM] = []
+
+            async for movie_input in movies_input:
+                if movie_input is None:
+                    invalid += 1
+                    continue
+
+                batch.append(
+                    MovieCreateDM.from_object(
+                        movie_input,
+                        none_if_key_not_found=True,
+                        user_id=user_id,
+                    ),
+                )
+                if len(batch) == MOVIE_IMPORT_BATCH_SIZE:
+                    yield batch
+                    batch = []
+
+            if batch:
+                yield batch
+
+        async with self.uow(pin_key=user_id) as uow:
+            loaded, inserted = await uow.movies.copy_many(batches())
+
+        await self._invalidate(user_id)
+
+        return MovieImportOutputDM(
+            inserted=inserted,
+            skipped=loaded - inserted,
+            invalid=invalid,
+        )
 
     @override
     async def get_all_movies(
@@ -189,52 +550,262 @@ class MovieService(
         user_id: UUID,
         filters: MovieFiltersDM,
     ) -> Sequence[MovieOutputDM]:
+        generation = None
+        filters = self._canonicalize_filters(filters)
+
+        if (
+            self.listing_cache is not None
+            and (generation := await self.listing_cache.get_generation(user_id)) is not None
+        ):
+            cached_movies = await self.listing_cache.get(user_id, generation, filters)
+
+            if cached_movies is not None:
+                return cached_movies
+
+        # a lagging replica would cache, or tag, a result older than the generation
+        async with self.uow(
+            read_only=True,
+            pin_key=user_id,
+            primary=generation is not None,
+        ) as uow:
+            movies = await uow.movies.read_all_as(
+                filters=filters,
+                output_class=MovieOutputDM,
+                relation_id=user_id,
+            )
+
+        # a change committed meanwhile has moved on from this generation
+        if self.listing_cache is not None and generation is not None:
+            await self.listing_cache.set(user_id, generation, filters, movies)
+
+        return movies
+
+    @override
+    async def get_all_movies_tag(
+        self,
+        user_id: UUID,
+        filters: MovieFiltersDM,
+    ) -> str | None:
+        if self.listing_cache is None:
+            return None
+
+        return await self.listing_cache.get_tag(user_id, self._canonicalize_filters(filters))
+
+    @override
+    async def export_movies(
+        self,
+        user_id: UUID,
+    ) -> AsyncIterator[Sequence[MovieOutputDM]]:
+        # server-side cursors need a transaction, so this cannot run in read-only mode
         async with self.uow as uow:
-            movies = await uow.movies.read_all(
+            async for movies in uow.movies.stream_all_as(
+                output_class=MovieOutputDM,
+                relation_id=user_id,
+            ):
+                yield movies
+
+    @override
+    async def search_movies(
+        self,
+        user_id: UUID,
+        filters: MovieSearchFiltersDM,
+    ) -> Sequence[MovieOutputDM]:
+        async with self.uow(read_only=True, pin_key=user_id) as uow:
+            movies = await uow.movies.search(
                 filters=filters,
                 relation_id=user_id,
             )
             return [MovieOutputDM.from_object(movie) for movie in movies]
 
+    @override
+    async def get_movie_stats(
+        self,
+        user_id: UUID,
+    ) -> MovieStatsDM:
+        async with self.uow(read_only=True, pin_key=user_id) as uow:
+            stats = await uow.movies.read_stats(user_id)
+
+        if stats is None or not stats.movie_count:
+            return MovieStatsDM(
+                count=0,
+                average_rate=None,
+                rate_histogram=[0] * MOVIE_RATE_HISTOGRAM_BUCKETS,
+                newest_created_at=None,
+                oldest_created_at=None,
+            )
+
+        return MovieStatsDM(
+            count=stats.movie_count,
+            average_rate=round(float(stats.rate_sum / stats.movie_count), 2),
+            rate_histogram=stats.rate_histogram,
+            newest_created_at=stats.newest_created_at,
+            oldest_created_at=stats.oldest_created_at,
+        )
+
+    @override
+    async def get_movies(
+        self,
+        movie_ids: Sequence[int | UUID],
+        user_id: UUID | None,
+        actor_id: UUID,
+    ) -> MovieBatchOutputDM:
+        unique_ids = list(dict.fromkeys(movie_ids))
+
+        async with self.uow(read_only=True, pin_key=actor_id) as uow:
+            movies = await uow.movies.read_many_as(
+                item_ids=unique_ids,
+                output_class=MovieOutputDM,
+                relation_id=user_id,
+            )
+
+        movies_by_id = {movie.id: movie for movie in movies}
+        return MovieBatchOutputDM(
+            movies=[
+                movies_by_id[movie_id] for movie_id in unique_ids if movie_id in movies_by_id
+            ],
+            missing=[movie_id for movie_id in unique_ids if movie_id not in movies_by_id],
+        )
+
     @override
     async def get_movie(
         self,
         movie_id: int | UUID,
+        user_id: UUID,
     ) -> MovieOutputDM:
-        async with self.uow as uow:
-            movie = await uow.movies.read(movie_id)
-
-            if movie is None:
-                raise MovieNotFoundError
-
-            return MovieOutputDM.from_object(movie)
+        if self.movie_cache is not None and (
+            cached_movie := await self.movie_cache.get(movie_id)
+        ):
+            return cached_movie
+
+        if self.movie_flight is None:
+            return await self._load_movie(movie_id, user_id)
+
+        # a recent writer reads the primary, it must not share a replica read
+        pinned = await self.database_manager.is_pinned(user_id)
+        return await self.movie_flight.do(
+            key=f"{movie_id}:primary" if pinned else str(movie_id),
+            load=partial(self._load_movie, movie_id, user_id),
+            recheck=(
+                None if self.movie_cache is None else partial(self.movie_cache.peek, movie_id)
+            ),
+        )
 
     @override
     async def update_movie(
         self,
         movie_id: int | UUID,
         movie_update: MovieUpdateDM,
+        user_id: UUID | None,
+        actor_id: UUID,
     ) -> MovieOutputDM:
-        async with self.uow as uow:
-            movie = await uow.movies.update(
+        async with self.uow(pin_key=actor_id) as uow:
+            movie = await uow.movies.update_returning(
                 item_id=movie_id,
                 item_update=movie_update,
+                output_class=MovieOutputDM,
+                relation_id=user_id,
             )
 
             if movie is None:
-                raise MovieNotFoundError
+                raise (
+                    exc.ResourceOwnershipError
+                    if await uow.movies.exists(movie_id)
+                    else MovieNotFoundError
+                )
 
-            return MovieOutputDM.from_object(movie)
+        await self._invalidate(movie.user_id, movie_id)
+        return movie
 
     @override
     async def delete_movie(
         self,
         movie_id: int | UUID,
+        user_id: UUID | None,
+        actor_id: UUID,
     ) -> MovieOutputDM:
-        async with self.uow as uow:
-            movie = await uow.movies.delete(movie_id)
+        async with self.uow(pin_key=actor_id) as uow:
+            movie = await uow.movies.delete_returning(
+                item_id=movie_id,
+                output_class=MovieOutputDM,
+                relation_id=user_id,
+            )
+
+            if movie is None:
+                raise (
+                    exc.ResourceOwnershipError
+                    if await uow.movies.exists(movie_id)
+                    else MovieNotFoundError
+                )
+
+        await self._invalidate(movie.user_id, movie_id)
+        return movie
+
+    async def _invalidate(
+        self,
+        user_id: UUID,
+        movie_id: int | UUID | None = None,
+    ) -> None:
+        """
+        Invalidate the cached data of changed movies.
+
+        Runs after the commit, so a concurrent read cannot cache \
+            the old rows again.
+
+        Parameters
+        ----------
+        user_id : UUID
+            owner id of the changed movies
+
+        movie_id : int | UUID | None, optional
+            id of the changed movie, 'None' for new movies, by default None
+        """
+        if self.listing_cache is not None:
+            await self.listing_cache.invalidate(user_id)
+
+        if self.movie_flight is not None and movie_id is not None:
+            self.movie_flight.forget(str(movie_id))
+            self.movie_flight.forget(f"{movie_id}:primary")
+
+        if self.movie_cache is not None and movie_id is not None:
+            await self.movie_cache.invalidate(movie_id)
+
+    async def _load_movie(
+        self,
+        movie_id: int | UUID,
+        user_id: UUID,
+    ) -> MovieOutputDM:
+        """
+        Read a movie and fill the cache.
+
+        Parameters
+        ----------
+        movie_id : int | UUID
+            movie id
+
+        user_id : UUID
+            id of the reading user
+
+        Returns
+        -------
+        MovieOutputDM
+            movie data
+        """
+        async with self.uow(read_only=True, pin_key=user_id) as uow:
+            movie = await uow.movies.read(movie_id)
 
             if movie is None:
                 raise MovieNotFoundError
 
-            return MovieOutputDM.from_object(movie)
+            movie_output = MovieOutputDM.from_object(movie)
+
+        if self.movie_cache is not None:
+            await self.movie_cache.set(movie_id, movie_output)
+
+        return movie_output
+
+    @staticmethod
+    def _canonicalize_filters(filters: MovieFiltersDM) -> MovieFiltersDM:
+        # title matching ignores case, so the cache key does too
+        if filters.title_contains is None:
+            return filters
+        return replace(filters, title_contains=filters.title_contains.lower())
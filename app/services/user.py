@@ -24,6 +24,9 @@ from fastapi import (
 )
 
 import app.core.exceptions as exc
+from app.cache import (
+    BaseCache,
+)
 from app.database.db_managers import (
     SqlAlchemyDatabaseManager,
 )
@@ -31,6 +34,7 @@ from app.database.unit_of_works import (
     SqlAlchemyUOW,
 )
 from app.domains import (
+    MovieOutputDM,
     UserFiltersDM,
     UserHashedUpdateDM,
     UserOutputDM,
@@ -176,7 +180,7 @@ class UserService(
 ):
     """SqlAlchemy user service."""
 
-    __slots__ = ("auth_manager", "password_manager")
+    __slots__ = ("auth_manager", "movie_cache", "password_manager", "user_cache")
 
     @override
     def __init__(
@@ -185,6 +189,8 @@ class UserService(
         database_manager: SqlAlchemyDatabaseManager,
         password_manager: BasePasswordManager,
         auth_manager: BaseAuthManager[Any, Any, Any, Any, Any],
+        user_cache: BaseCache[UUID, UserOutputDM] | None = None,
+        movie_cache: BaseCache[int | UUID, MovieOutputDM] | None = None,
     ) -> None:
         """
         Initialize the user service.
@@ -202,6 +208,14 @@ class UserService(
 
         auth_manager : BaseAuthManager
             token manager
+
+        user_cache : BaseCache[UUID, UserOutputDM] | None, optional
+            read-through cache of single users, invalidated after \
+                committed changes, by default None
+
+        movie_cache : BaseCache[int | UUID, MovieOutputDM] | None, optional
+            read-through cache of single movies, the movies of a deleted \
+                user are invalidated, by default None
         """
         super().__init__(
             uow_class=uow_class,
@@ -209,15 +223,19 @@ class UserService(
         )
         self.password_manager = password_manager
         self.auth_manager = auth_manager
+        self.user_cache = user_cache
+        self.movie_cache = movie_cache
 
     @override
     async def get_all_users(
         self,
         filters: UserFiltersDM,
     ) -> Sequence[UserOutputDM]:
-        async with self.uow as uow:
-            users = await uow.users.read_all(filters)
-            return [UserOutputDM.from_object(user) for user in users]
+        async with self.uow(read_only=True) as uow:
+            return await uow.users.read_all_as(
+                filters=filters,
+                output_class=UserOutputDM,
+            )
 
     @override
     async def get_user(
@@ -231,13 +249,26 @@ class UserService(
                 created_at=datetime.now(UTC),
             )
 
-        async with self.uow as uow:
+        if self.user_cache is not None and (cached_user := await self.user_cache.get(user_id)):
+            return cached_user
+
+        # a lagging replica would cache the user as it was before an eviction
+        async with self.uow(
+            read_only=True,
+            pin_key=user_id,
+            primary=self.user_cache is not None,
+        ) as uow:
             user = await uow.users.read(user_id)
 
             if user is None:
                 raise UserNotFoundError
 
-            return UserOutputDM.from_object(user)
+            user_output = UserOutputDM.from_object(user)
+
+        if self.user_cache is not None:
+            await self.user_cache.set(user_id, user_output)
+
+        return user_output
 
     @override
     async def update_user(
@@ -255,7 +286,7 @@ class UserService(
             else None,
         )
 
-        async with self.uow as uow:
+        async with self.uow(pin_key=user_id) as uow:
             user = await uow.users.update(
                 item_id=user_id,
                 item_update=user_hashed_update,
@@ -273,6 +304,9 @@ class UserService(
                 response=response,
             )
 
+        if self.user_cache is not None:
+            await self.user_cache.invalidate(user_id)
+
     @override
     async def delete_user(
         self,
@@ -281,7 +315,12 @@ class UserService(
         response: Response,
     ) -> UserOutputDM:
         async with self.uow as uow:
-            user = await uow.users.delete(user_id)
+            # deleted here rather than by the cascade, to learn the cached ids
+            movie_ids = await uow.movies.delete_all(relation_id=user_id)
+            user = await uow.users.delete_returning(
+                item_id=user_id,
+                output_class=UserOutputDM,
+            )
 
             if user is None:
                 raise UserNotFoundError
@@ -291,4 +330,11 @@ class UserService(
                 response=response,
                 user_id=user_id,
             )
-            return UserOutputDM.from_object(user)
+
+        if self.user_cache is not None:
+            await self.user_cache.invalidate(user_id)
+
+        if self.movie_cache is not None and movie_ids:
+            await self.movie_cache.invalidate_many(movie_ids)
+
+        return user
@@ -0,0 +1,60 @@
+from sqlalchemy.engine import (
+    URL,
+    Connection,
+    Engine,
+    create_engine,
+)
+from sqlalchemy.sql.expression import (
+    text,
+)
+
+from app.core import (
+    settings,
+)
+
+
+def get_engine() -> Engine:
+    """
+    Get a synchronous engine for the configured PostgreSQL database.
+
+    Returns
+    -------
+    Engine
+        sqlalchemy engine
+    """
+    return create_engine(
+        url=URL.create(
+            drivername="postgresql",
+            username=settings.db.username,
+            password=settings.db.password.get_secret_value(),
+            host=settings.db.host,
+            port=settings.db.port,
+            database=settings.db.database,
+        ),
+    )
+
+
+def explain_analyze(
+    conn: Connection,
+    query: str,
+    **params: object,
+) -> str:
+    """
+    Get the execution plan of the query.
+
+    Parameters
+    ----------
+    conn : Connection
+        database connection
+    query : str
+        raw sql query
+    **params : object
+        query parameters
+
+    Returns
+    -------
+    str
+        'EXPLAIN (ANALYZE, BUFFERS)' output
+    """
+    result = conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {query}"), params)
+    return "\n".join(row[0] for row in result)
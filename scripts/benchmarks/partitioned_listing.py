@@ -0,0 +1,213 @@
+import random
+import statistics
+import sys
+import time
+from typing import (
+    Final,
+)
+from uuid import (
+    UUID,
+)
+
+from sqlalchemy.engine import (
+    Connection,
+)
+from sqlalchemy.sql.expression import (
+    text,
+)
+
+from scripts.benchmarks.common import (
+    explain_analyze,
+    get_engine,
+)
+
+SCHEMA: Final[str] = "bench_partitioning"
+NUM_USERS: Final[int] = 20_000
+MOVIES_PER_USER: Final[int] = 1_000  # 20M rows per table
+PARTITIONS: Final[int] = 16
+NUM_SAMPLES: Final[int] = 500
+PAGE_SIZE: Final[int] = 20
+
+TABLES: Final[dict[str, str]] = {
+    "plain": "",
+    "partitioned": "PARTITION BY HASH (user_id)",
+}
+LISTING_QUERIES: Final[dict[str, str]] = {
+    "first page by rate": (
+        "SELECT id, title, rate FROM {table} WHERE user_id = :user_id "  # noqa: S608
+        f"ORDER BY rate, id LIMIT {PAGE_SIZE}"
+    ),
+    "title contains": (
+        "SELECT id, title, rate FROM {table} WHERE user_id = :user_id "  # noqa: S608
+        f"AND title ILIKE '%9_%' ORDER BY id LIMIT {PAGE_SIZE}"
+    ),
+}
+
+
+def create_table(
+    conn: Connection,
+    table: str,
+    partition_by: str,
+) -> None:
+    """
+    Create and fill a movies-like table.
+
+    Parameters
+    ----------
+    conn : Connection
+        database connection
+
+    table : str
+        table name
+
+    partition_by : str
+        partitioning clause, empty for a plain table
+    """
+    conn.execute(
+        text(
+            f"CREATE TABLE {SCHEMA}.{table} ("
+            "id bigint GENERATED ALWAYS AS IDENTITY, "
+            "user_id uuid NOT NULL, "
+            "title varchar(50) NOT NULL, "
+            "rate numeric(2, 1) NOT NULL, "
+            "PRIMARY KEY (id, user_id)"
+            f") {partition_by}"
+        ),
+    )
+
+    if partition_by:
+        for remainder in range(PARTITIONS):
+            conn.execute(
+                text(
+                    f"CREATE TABLE {SCHEMA}.{table}_p{remainder} "
+                    f"PARTITION OF {SCHEMA}.{table} "
+                    f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+                ),
+            )
+
+    conn.execute(
+        text(
+            f"INSERT INTO {SCHEMA}.{table} (user_id, title, rate) "  # noqa: S608
+            f"SELECT u.user_id, 'movie_' || u.n || '_' || i, i % 50 / 10.0 "
+            f"FROM {SCHEMA}.users u, generate_series(1, :movies_per_user) AS i"
+        ),
+        {"movies_per_user": MOVIES_PER_USER},
+    )
+    conn.execute(text(f"CREATE INDEX ON {SCHEMA}.{table} (user_id, id)"))
+    conn.execute(text(f"CREATE INDEX ON {SCHEMA}.{table} (user_id, rate, id)"))
+    conn.execute(text(f"VACUUM ANALYZE {SCHEMA}.{table}"))
+
+
+def measure(
+    conn: Connection,
+    query: str,
+    user_ids: list[UUID],
+) -> tuple[float, float]:
+    """
+    Measure the latency of the query over sampled users.
+
+    Parameters
+    ----------
+    conn : Connection
+        database connection
+
+    query : str
+        raw sql query with a ':user_id' parameter
+
+    user_ids : list[UUID]
+        sampled user ids
+
+    Returns
+    -------
+    tuple[float, float]
+        p50 and p95 latency in milliseconds
+    """
+    timings: list[float] = []
+
+    for user_id in user_ids:
+        start = time.perf_counter()
+        conn.execute(text(query), {"user_id": user_id}).all()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    percentiles = statistics.quantiles(timings, n=20)
+    return statistics.median(timings), percentiles[18]
+
+
+def run_benchmark() -> tuple[bool, str]:
+    """
+    Compare per-user listing latency on a plain and a hash-partitioned table.
+
+    Returns
+    -------
+    tuple[bool, str]
+        status, message
+    """
+    engine = get_engine().execution_options(isolation_level="AUTOCOMMIT")
+
+    with engine.connect() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+        try:
+            conn.execute(
+                text(
+                    f"CREATE TABLE {SCHEMA}.users AS "  # noqa: S608
+                    "SELECT gen_random_uuid() AS user_id, n "
+                    "FROM generate_series(1, :num_users) AS n"
+                ),
+                {"num_users": NUM_USERS},
+            )
+
+            for table, partition_by in TABLES.items():
+                print(
+                    f"🌱 Filling the {table} table with {NUM_USERS * MOVIES_PER_USER} rows..."
+                )
+                create_table(conn, table, partition_by)
+
+            user_ids = list(
+                conn.execute(text(f"SELECT user_id FROM {SCHEMA}.users")).scalars(),  # noqa: S608
+            )
+            sampled_user_ids = random.sample(user_ids, NUM_SAMPLES)
+
+            for name, query in LISTING_QUERIES.items():
+                for table in TABLES:
+                    p50, p95 = measure(
+                        conn,
+                        query.format(table=f"{SCHEMA}.{table}"),
+                        sampled_user_ids,
+                    )
+                    print(f"⏱️ {name}, {table}: p50 {p50:.3f} ms, p95 {p95:.3f} ms")
+
+                print(
+                    explain_analyze(
+                        conn,
+                        query.format(table=f"{SCHEMA}.partitioned"),
+                        user_id=sampled_user_ids[0],
+                    ),
+                )
+
+            for table in TABLES:
+                size = conn.execute(
+                    text(
+                        "SELECT pg_size_pretty(sum(pg_indexes_size(relid))) "
+                        "FROM pg_partition_tree(:table)"
+                    ),
+                    {"table": f"{SCHEMA}.{table}"},
+                ).scalar_one()
+                print(f"📦 {table} indexes: {size}")
+        finally:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+    return True, "✅ Partitioned listing benchmark completed"
+
+
+if __name__ == "__main__":
+    print("📊 Partitioned listing benchmark...")
+
+    try:
+        ok, msg = run_benchmark()
+    except Exception as e:
+        ok, msg = False, f"❌ Partitioned listing benchmark failed:\n{e!s}"
+
+    print(msg)
+    sys.exit(not ok)
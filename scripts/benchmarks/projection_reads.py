@@ -0,0 +1,136 @@
+import sys
+import time
+from collections.abc import (
+    Callable,
+)
+from dataclasses import (
+    fields,
+)
+from typing import (
+    Final,
+)
+
+from sqlalchemy.orm import (
+    Session,
+)
+from sqlalchemy.sql.expression import (
+    insert,
+    select,
+)
+
+from app.database.models import (
+    MovieModel,
+    UserModel,
+)
+from app.domains import (
+    MovieOutputDM,
+    UserRole,
+)
+from scripts.benchmarks.common import (
+    get_engine,
+)
+
+PAGE_SIZE: Final[int] = 100
+NUM_REQUESTS: Final[int] = 1000
+
+
+def measure_cpu(func: Callable[[], object]) -> float:
+    """
+    Measure the mean CPU time of a function call.
+
+    Parameters
+    ----------
+    func : Callable[[], object]
+        function to call 'NUM_REQUESTS' times
+
+    Returns
+    -------
+    float
+        CPU time per call in milliseconds
+    """
+    func()  # warm up statement caches
+    start = time.process_time()
+
+    for _ in range(NUM_REQUESTS):
+        func()
+
+    return (time.process_time() - start) * 1000 / NUM_REQUESTS
+
+
+def run_benchmark() -> tuple[bool, str]:
+    """
+    Compare ORM and projection reads of one movies page.
+
+    Returns
+    -------
+    tuple[bool, str]
+        status, message
+    """
+    engine = get_engine()
+
+    with engine.connect() as conn, Session(bind=conn) as session:
+        user_id = conn.execute(
+            insert(UserModel)
+            .values(
+                username="bench_projection",
+                hashed_password="-",  # noqa: S106
+                role=UserRole.USER,
+            )
+            .returning(UserModel.id),
+        ).scalar_one()
+        conn.execute(
+            insert(MovieModel),
+            [
+                {
+                    "title": f"bench_projection_{i}",
+                    "description": "-",
+                    "rate": i % 50 / 10,
+                    "user_id": user_id,
+                }
+                for i in range(PAGE_SIZE)
+            ],
+        )
+
+        columns = [getattr(MovieModel, field.name) for field in fields(MovieOutputDM)]
+        orm_query = (
+            select(MovieModel)
+            .where(MovieModel.user_id == user_id)
+            .order_by(MovieModel.id)
+            .limit(PAGE_SIZE)
+        )
+        core_query = (
+            select(*columns)
+            .where(MovieModel.user_id == user_id)
+            .order_by(MovieModel.id)
+            .limit(PAGE_SIZE)
+        )
+
+        def read_orm() -> list[MovieOutputDM]:
+            movies = [MovieOutputDM.from_object(movie) for movie in session.scalars(orm_query)]
+            session.expunge_all()  # every request starts with a fresh session
+            return movies
+
+        def read_core() -> list[MovieOutputDM]:
+            return [MovieOutputDM(*row) for row in conn.execute(core_query)]
+
+        try:
+            orm_ms = measure_cpu(read_orm)
+            core_ms = measure_cpu(read_core)
+        finally:
+            conn.rollback()
+
+    print(f"🐢 ORM read:        {orm_ms:.3f} ms CPU per {PAGE_SIZE}-row page")
+    print(f"🚀 Projection read: {core_ms:.3f} ms CPU per {PAGE_SIZE}-row page")
+    return True, f"✅ Projection is {orm_ms / core_ms:.1f}x cheaper in CPU"
+
+
+if __name__ == "__main__":
+    print("📊 Projection reads benchmark...")
+
+    try:
+        ok, msg = run_benchmark()
+    except Exception as e:
+        ok, msg = False, f"❌ Projection reads benchmark failed:\n{e!s}"
+
+    print(msg)
+    sys.exit(not ok)
@@ -0,0 +1,86 @@
+import sys
+from typing import (
+    Final,
+)
+
+from sqlalchemy.sql.expression import (
+    text,
+)
+
+from scripts.benchmarks.common import (
+    explain_analyze,
+    get_engine,
+)
+
+TABLE_NAME: Final[str] = "bench_movies_title"
+NUM_ROWS: Final[int] = 1_000_000
+SEARCH_PATTERN: Final[str] = "%ovie 12345%"
+SEARCH_QUERY: Final[str] = (
+    f"SELECT id, title FROM {TABLE_NAME} WHERE title ILIKE :pattern ORDER BY id LIMIT 10"  # noqa: S608
+)
+
+
+def run_benchmark() -> tuple[bool, str]:
+    """
+    Compare title-contains search plans without and with the trigram index.
+
+    Returns
+    -------
+    tuple[bool, str]
+        status, message
+    """
+    engine = get_engine()
+
+    with engine.connect() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn.execute(text(f"DROP TABLE IF EXISTS {TABLE_NAME}"))
+        conn.execute(
+            text(
+                f"CREATE TABLE {TABLE_NAME} ("
+                "id integer PRIMARY KEY, "
+                "title varchar(50) NOT NULL UNIQUE)"
+            ),
+        )
+        print(f"🌱 Seeding {NUM_ROWS} rows...")
+        conn.execute(
+            text(
+                f"INSERT INTO {TABLE_NAME} (id, title) "  # noqa: S608
+                "SELECT i, 'Movie ' || i FROM generate_series(1, :num_rows) AS i"
+            ),
+            {"num_rows": NUM_ROWS},
+        )
+        conn.execute(text(f"ANALYZE {TABLE_NAME}"))
+        conn.commit()
+
+        try:
+            print("\n🐢 Without trigram index:")
+            print(explain_analyze(conn, SEARCH_QUERY, pattern=SEARCH_PATTERN))
+
+            conn.execute(
+                text(
+                    f"CREATE INDEX ix_{TABLE_NAME}_trgm "
+                    f"ON {TABLE_NAME} USING gin (title gin_trgm_ops)"
+                ),
+            )
+            conn.execute(text(f"ANALYZE {TABLE_NAME}"))
+
+            print("\n🚀 With trigram index:")
+            print(explain_analyze(conn, SEARCH_QUERY, pattern=SEARCH_PATTERN))
+        finally:
+            conn.rollback()
+            conn.execute(text(f"DROP TABLE IF EXISTS {TABLE_NAME}"))
+            conn.commit()
+
+    return True, "✅ Title search benchmark finished"
+
+
+if __name__ == "__main__":
+    print("📊 Title search benchmark...")
+
+    try:
+        ok, msg = run_benchmark()
+    except Exception as e:
+        ok, msg = False, f"❌ Title search benchmark failed:\n{e!s}"
+
+    print(msg)
+    sys.exit(not ok)
@@ -0,0 +1,154 @@
+import sys
+import time
+from typing import (
+    Final,
+)
+from uuid import (
+    UUID,
+)
+
+from sqlalchemy.engine import (
+    Connection,
+)
+from sqlalchemy.orm import (
+    Session,
+)
+from sqlalchemy.sql.expression import (
+    delete,
+    select,
+    text,
+)
+
+from app.database.models import (
+    MovieModel,
+    UserModel,
+)
+from scripts.benchmarks.common import (
+    get_engine,
+)
+
+NUM_MOVIES: Final[int] = 50_000
+USERNAME: Final[str] = "bench_delete"
+
+
+def seed_user(conn: Connection) -> UUID:
+    """
+    Create a user with a large movie library.
+
+    Parameters
+    ----------
+    conn : Connection
+        database connection
+
+    Returns
+    -------
+    UUID
+        user id
+    """
+    user_id: UUID = conn.execute(
+        text(
+            "INSERT INTO users (username, hashed_password, role) "
+            "VALUES (:username, '-', 'USER') RETURNING id"
+        ),
+        {"username": USERNAME},
+    ).scalar_one()
+    conn.execute(
+        text(
+            "INSERT INTO movies (title, description, rate, user_id) "
+            "SELECT :username || '_' || i, '-', i % 50 / 10.0, :user_id "
+            "FROM generate_series(1, :num_movies) AS i"
+        ),
+        {"username": USERNAME, "user_id": user_id, "num_movies": NUM_MOVIES},
+    )
+    return user_id
+
+
+def delete_row_by_row(
+    conn: Connection,
+    user_id: UUID,
+) -> None:
+    """
+    Delete the user the way the ORM 'delete-orphan' cascade did.
+
+    Parameters
+    ----------
+    conn : Connection
+        database connection
+
+    user_id : UUID
+        user id
+    """
+    with Session(bind=conn) as session:
+        movies = session.scalars(select(MovieModel).where(MovieModel.user_id == user_id))
+
+        for movie in movies:
+            session.delete(movie)
+
+        session.flush()
+        session.execute(delete(UserModel).where(UserModel.id == user_id))
+
+
+def delete_cascade(
+    conn: Connection,
+    user_id: UUID,
+) -> None:
+    """
+    Delete the user relying on 'ON DELETE CASCADE'.
+
+    Parameters
+    ----------
+    conn : Connection
+        database connection
+
+    user_id : UUID
+        user id
+    """
+    conn.execute(delete(UserModel).where(UserModel.id == user_id))
+
+
+def run_benchmark() -> tuple[bool, str]:
+    """
+    Compare user deletion with row-by-row and database-side cascades.
+
+    Returns
+    -------
+    tuple[bool, str]
+        status, message
+    """
+    engine = get_engine()
+    timings: dict[str, float] = {}
+
+    with engine.connect() as conn:
+        print(f"🌱 Seeding a user with {NUM_MOVIES} movies...")
+        user_id = seed_user(conn)
+        conn.commit()
+
+        try:
+            for name, delete_user in (
+                ("row-by-row", delete_row_by_row),
+                ("on delete cascade", delete_cascade),
+            ):
+                start = time.perf_counter()
+                delete_user(conn, user_id)
+                timings[name] = time.perf_counter() - start
+                conn.rollback()  # keep the library for the next run
+                print(f"⏱️ {name}: {timings[name]:.3f} s")
+        finally:
+            conn.rollback()
+            delete_cascade(conn, user_id)
+            conn.commit()
+
+    speedup = timings["row-by-row"] / timings["on delete cascade"]
+    return True, f"✅ Cascade delete is {speedup:.1f}x faster"
+
+
+if __name__ == "__main__":
+    print("📊 User delete benchmark...")
+
+    try:
+        ok, msg = run_benchmark()
+    except Exception as e:
+        ok, msg = False, f"❌ User delete benchmark failed:\n{e!s}"
+
+    print(msg)
+    sys.exit(not ok)
@@ -0,0 +1,161 @@
+import argparse
+import sys
+from typing import (
+    Final,
+)
+
+from sqlalchemy.engine import (
+    URL,
+    Connection,
+    create_engine,
+)
+from sqlalchemy.sql.expression import (
+    text,
+)
+
+from app.core import (
+    settings,
+)
+from app.core.constants import (
+    MOVIE_RATE_HISTOGRAM_BUCKETS,
+)
+
+MAX_REPORTED_USERS: Final[int] = 10
+
+STATS_COLUMNS: Final[str] = (
+    "user_id, movie_count, rate_sum, rate_histogram, newest_created_at, oldest_created_at"
+)
+RATE_BUCKET: Final[str] = f"least(floor(rate)::integer, {MOVIE_RATE_HISTOGRAM_BUCKETS - 1})"
+EMPTY_HISTOGRAM: Final[str] = f"array_fill(0, ARRAY[{MOVIE_RATE_HISTOGRAM_BUCKETS}])"
+
+# the same aggregate the stats triggers maintain incrementally
+EXPECTED_STATS: Final[str] = (
+    "SELECT user_id, count(*)::integer AS movie_count, sum(rate) AS rate_sum, "
+    "ARRAY["
+    + ", ".join(
+        f"(count(*) FILTER (WHERE {RATE_BUCKET} = {bucket}))::integer"
+        for bucket in range(MOVIE_RATE_HISTOGRAM_BUCKETS)
+    )
+    + "] AS rate_histogram, "
+    "max(created_at) AS newest_created_at, min(created_at) AS oldest_created_at "
+    "FROM movies GROUP BY user_id"
+)
+# users without movies may have no stats row or an emptied one
+MISMATCHED_USERS: Final[str] = (
+    f"WITH expected AS ({EXPECTED_STATS}) "  # noqa: S608
+    "SELECT coalesce(e.user_id, s.user_id) FROM expected e "
+    "FULL JOIN user_movie_stats s ON s.user_id = e.user_id "
+    "WHERE (coalesce(e.movie_count, 0), coalesce(e.rate_sum, 0), "
+    f"coalesce(e.rate_histogram, {EMPTY_HISTOGRAM}), "
+    "e.newest_created_at, e.oldest_created_at) IS DISTINCT FROM "
+    "(coalesce(s.movie_count, 0), coalesce(s.rate_sum, 0), "
+    f"coalesce(s.rate_histogram, {EMPTY_HISTOGRAM}), "
+    "s.newest_created_at, s.oldest_created_at)"
+)
+
+
+def find_mismatched_users(conn: Connection) -> list[str]:
+    """
+    Find users whose stored movie statistics differ from their movies.
+
+    Parameters
+    ----------
+    conn : Connection
+        database connection
+
+    Returns
+    -------
+    list[str]
+        ids of users with stale statistics
+    """
+    return [str(user_id) for user_id in conn.execute(text(MISMATCHED_USERS)).scalars()]
+
+
+def rebuild_stats(conn: Connection) -> int:
+    """
+    Rebuild the movie statistics of all users from scratch.
+
+    Writes to movies are blocked until the transaction commits, \
+        so no trigger update is lost in between.
+
+    Parameters
+    ----------
+    conn : Connection
+        database connection inside a transaction
+
+    Returns
+    -------
+    int
+        number of rebuilt stats rows
+    """
+    conn.execute(text("LOCK TABLE movies IN SHARE MODE"))
+    conn.execute(text("DELETE FROM user_movie_stats"))
+    result = conn.execute(
+        text(f"INSERT INTO user_movie_stats ({STATS_COLUMNS}) {EXPECTED_STATS}"),
+    )
+    return result.rowcount
+
+
+def check_movie_stats(*, rebuild: bool) -> tuple[bool, str]:
+    """
+    Check the movie statistics against the movies and optionally rebuild them.
+
+    Parameters
+    ----------
+    rebuild : bool
+        rebuild all statistics when any of them is stale
+
+    Returns
+    -------
+    tuple[bool, str]
+        status, message
+    """
+    engine = create_engine(
+        url=URL.create(
+            drivername="postgresql",
+            username=settings.db.username,
+            password=settings.db.password.get_secret_value(),
+            host=settings.db.host,
+            port=settings.db.port,
+            database=settings.db.database,
+        ),
+    )
+
+    with engine.begin() as conn:
+        mismatched = find_mismatched_users(conn)
+
+        if not mismatched:
+            return True, "✅ Movie stats are consistent"
+
+        print(
+            f"⚠️ Movie stats of {len(mismatched)} users are stale: "
+            f"{', '.join(mismatched[:MAX_REPORTED_USERS])}"
+            f"{', ...' if len(mismatched) > MAX_REPORTED_USERS else ''}"
+        )
+
+        if not rebuild:
+            return False, "❌ Movie stats are inconsistent, run with --rebuild to fix them"
+
+        rebuilt = rebuild_stats(conn)
+
+    return True, f"✅ Movie stats have been rebuilt for {rebuilt} users"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the per-user movie statistics.")
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="rebuild all statistics from the movies when any of them is stale",
+    )
+    args = parser.parse_args()
+
+    print("📊 Movie stats check...")
+
+    try:
+        ok, msg = check_movie_stats(rebuild=args.rebuild)
+    except Exception as e:
+        ok, msg = False, f"❌ Movie stats check failed:\n{e!s}"
+
+    print(msg)
+    sys.exit(not ok)
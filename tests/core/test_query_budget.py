@@ -0,0 +1,73 @@
+import pytest
+from fastapi import (
+    APIRouter,
+    FastAPI,
+    status,
+)
+from fastapi.testclient import (
+    TestClient,
+)
+
+from app.core import (
+    dep_query_budget_getter,
+    dep_query_guard_getter,
+)
+from app.core.exceptions import (
+    QueryBudgetExceededError,
+)
+from app.core.exceptions.exc_handlers import (
+    QueryBudgetExceptionHandler,
+)
+from app.core.query_budget import (
+    QueryBudgetMode,
+)
+from app.core.request_context import (
+    request_query_stats,
+)
+
+
+def make_client(mode: QueryBudgetMode) -> TestClient:
+    router = APIRouter(
+        dependencies=[dep_query_guard_getter(mode=mode)],
+    )
+
+    @router.get(
+        path="/statements/{count}",
+        dependencies=[dep_query_budget_getter(statements=1)],
+    )
+    async def issue_statements(count: int) -> dict[str, int]:
+        # stands in for the statement counting of the database engine
+        if (stats := request_query_stats.get()) is not None:
+            stats.statements += count
+        return {"statements": count}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_exception_handler(
+        exc_class_or_status_code=QueryBudgetExceededError,
+        handler=QueryBudgetExceptionHandler(),
+    )
+    # an error raised after the response has started fails the test
+    return TestClient(app, raise_server_exceptions=True)
+
+
+def test_fail_mode_rejects_over_budget_request() -> None:
+    response = make_client("fail").get("/statements/2")
+
+    assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    assert response.json()["error"] == "Internal server error."
+
+
+@pytest.mark.parametrize(
+    ("mode", "count"),
+    [
+        ("fail", 1),
+        ("warn", 2),
+        ("off", 2),
+    ],
+)
+def test_request_passes(mode: QueryBudgetMode, count: int) -> None:
+    response = make_client(mode).get(f"/statements/{count}")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"statements": count}